@@ -0,0 +1,8 @@
+"""Performance benchmarks, run as modules, e.g. ``python -m benchmarks.api``.
+
+Results are printed to stdout, so application logs go to stderr.
+"""
+
+import os
+
+os.environ.setdefault("LOG_STREAM", "stderr")
@@ -0,0 +1,225 @@
+"""Throughput and latency of the mob CRUD routes.
+
+Requests go through the whole ASGI application in process, with the
+sessions bound to a throwaway database. Reads by id are mostly served
+from the mob cache, like in production.
+
+Usage: ``python -m benchmarks.api --concurrency 1 10 50 --requests 500``
+"""
+
+import asyncio
+import itertools
+import random
+import time
+import typing as T  # noqa: WPS111,N812
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from benchmarks import common, database
+from monster_spawner.database import sessions
+from monster_spawner.main import app
+
+MOBS_URL = "/api/v1/mobs/"
+OPERATIONS = ("create_mob", "read_mob", "list_mobs", "update_mob", "delete_mob")
+MAX_HEALTH = 100
+DEFAULT_REQUESTS = 500
+
+Call = T.Callable[[], T.Awaitable[None]]
+
+
+class SessionDependency:
+    """Session dependency bound to the throwaway database."""
+
+    def __init__(
+        self,
+        sessionmaker: T.Callable[..., AsyncSession],
+        commit: bool,
+    ) -> None:
+        self.sessionmaker = sessionmaker
+        self.commit = commit
+
+    async def __call__(self) -> T.AsyncIterator[AsyncSession]:
+        """Open a session like the application dependencies do.
+
+        Yields:
+            AsyncSession: database session.
+        """
+        async with self.sessionmaker() as session:
+            yield session
+            if self.commit:
+                await session.commit()
+
+
+class Workload:
+    """Requests of every operation against a shared pool of mobs."""
+
+    def __init__(self, client: AsyncClient) -> None:
+        self.client = client
+        self.numbers = itertools.count()
+        self.ids: list[str] = []
+
+    async def create_mob(self) -> None:
+        """Create a mob with a unique name."""
+        response = await self.client.post(
+            MOBS_URL,
+            json={"name": f"Mob {next(self.numbers)}"},
+        )
+        response.raise_for_status()
+        self.ids.append(response.json()["id"])
+
+    async def read_mob(self) -> None:
+        """Get a random mob."""
+        response = await self.client.get(
+            f"{MOBS_URL}{random.choice(self.ids)}",  # noqa: S311
+        )
+        response.raise_for_status()
+
+    async def list_mobs(self) -> None:
+        """Get the first page of mobs."""
+        response = await self.client.get(MOBS_URL)
+        response.raise_for_status()
+
+    async def update_mob(self) -> None:
+        """Change the health of a random mob."""
+        response = await self.client.patch(
+            f"{MOBS_URL}{random.choice(self.ids)}",  # noqa: S311
+            json={"health": random.randint(1, MAX_HEALTH)},  # noqa: S311
+        )
+        response.raise_for_status()
+
+    async def delete_mob(self) -> None:
+        """Delete the most recently created mob."""
+        mob_id = self.ids.pop()
+        response = await self.client.delete(f"{MOBS_URL}{mob_id}")
+        response.raise_for_status()
+
+    async def run(
+        self,
+        operation: str,
+        concurrency: int,
+        requests: int,
+    ) -> dict[str, float]:
+        """Send the requests from concurrent workers.
+
+        Args:
+            operation (str): name of the operation method.
+            concurrency (int): number of concurrent workers.
+            requests (int): number of requests of all the workers.
+
+        Returns:
+            dict[str, float]: throughput and latency percentiles.
+        """
+        latencies: list[float] = []
+        budget = iter(range(requests))
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[
+                self.work(getattr(self, operation), budget, latencies)
+                for _ in range(concurrency)
+            ],
+        )
+        return common.summarize(latencies, time.perf_counter() - start)
+
+    async def work(
+        self,
+        call: Call,
+        budget: T.Iterator[int],
+        latencies: list[float],
+    ) -> None:
+        """Keep calling until the shared budget runs out.
+
+        Args:
+            call (Call): operation to time.
+            budget (Iterator[int]): requests left for all the workers.
+            latencies (list[float]): collected latencies.
+        """
+        for _ in budget:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+
+def override_sessions(database_url: str) -> AsyncEngine:
+    """Bind the application sessions to the database.
+
+    Args:
+        database_url (str): database url.
+
+    Returns:
+        AsyncEngine: engine to dispose of at the end.
+    """
+    engine, async_session = sessions.get_connection(database_url)
+    read_session = sessions.get_read_sessionmaker(engine)
+    app.dependency_overrides[sessions.get_session] = SessionDependency(
+        async_session,
+        commit=True,
+    )
+    app.dependency_overrides[sessions.get_read_session] = SessionDependency(
+        read_session,
+        commit=False,
+    )
+    return engine
+
+
+async def run_operations(
+    workload: Workload,
+    concurrency: list[int],
+    requests: int,
+    output: str | None,
+) -> None:
+    """Run every operation at every concurrency level.
+
+    Creates run first and deletes last, so every level has the same
+    number of mobs to work with.
+
+    Args:
+        workload (Workload): workload sending the requests.
+        concurrency (list[int]): concurrency levels.
+        requests (int): number of requests per level.
+        output (str | None): JSON lines file to append the results to.
+    """
+    for operation, level in itertools.product(OPERATIONS, concurrency):
+        common.report(
+            f"api.{operation}",
+            {"concurrency": level, "requests": requests},
+            await workload.run(operation, level, requests),
+            output,
+        )
+
+
+async def benchmark(
+    concurrency: list[int],
+    requests: int,
+    output: str | None,
+) -> None:
+    """Run the operations against a throwaway database.
+
+    Args:
+        concurrency (list[int]): concurrency levels.
+        requests (int): number of requests per level.
+        output (str | None): JSON lines file to append the results to.
+    """
+    async with database.throwaway_database() as database_url:
+        engine = override_sessions(database_url)
+        async with AsyncClient(app=app, base_url="http://bench") as client:
+            await run_operations(
+                Workload(client),
+                concurrency,
+                requests,
+                output,
+            )
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = common.create_parser(__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.concurrency, args.requests, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Shared helpers of the benchmarks.
+
+Every benchmark prints one JSON document per measurement, tagged with
+the git revision, so results of two commits can be diffed directly.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess  # noqa: S404
+import time
+import typing as T  # noqa: WPS111,N812
+
+PERCENTILES = (50, 95, 99)
+
+
+def create_parser(description: str | None) -> argparse.ArgumentParser:
+    """Create an argument parser with the common options.
+
+    Args:
+        description (str | None): benchmark description.
+
+    Returns:
+        ArgumentParser: argument parser.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--output",
+        help="also append the results to this JSON lines file",
+    )
+    return parser
+
+
+def get_revision() -> str:
+    """Get the current git revision.
+
+    Returns:
+        str: short commit hash, empty outside of a git checkout.
+    """
+    process = subprocess.run(  # noqa: S603,S607
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+    )
+    return process.stdout.strip()
+
+
+def report(
+    benchmark: str,
+    params: dict[str, T.Any],
+    metrics: dict[str, float],
+    output: str | None = None,
+) -> None:
+    """Print a single result as a JSON document.
+
+    Args:
+        benchmark (str): benchmark name.
+        params (dict[str, Any]): parameters of the measurement.
+        metrics (dict[str, float]): measured values.
+        output (str | None): JSON lines file to append the result to.
+    """
+    line = json.dumps(
+        {
+            "benchmark": benchmark,
+            "params": params,
+            "metrics": {
+                name: round(measured, 6) for name, measured in metrics.items()
+            },
+            "revision": get_revision(),
+            "python": platform.python_version(),
+            "time": time.time(),
+        },
+    )
+    print(line)  # noqa: WPS421
+    if output:
+        with open(output, "a") as results_file:
+            results_file.write(f"{line}\n")
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict[str, float]:
+    """Compute throughput and latency percentiles.
+
+    Args:
+        latencies (list[float]): duration of every operation in seconds.
+        elapsed (float): wall time of all the operations in seconds.
+
+    Returns:
+        dict[str, float]: operations per second and percentiles.
+    """
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    metrics = {"ops_per_second": len(latencies) / elapsed}
+    for percentile in PERCENTILES:
+        metrics[f"p{percentile}_seconds"] = quantiles[percentile - 1]
+    return metrics
@@ -0,0 +1,58 @@
+"""Throwaway databases for the benchmarks."""
+
+import typing as T  # noqa: WPS111,N812
+import uuid
+from contextlib import asynccontextmanager
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from monster_spawner.database import base
+from monster_spawner.settings import settings
+
+
+@asynccontextmanager
+async def throwaway_database() -> T.AsyncIterator[str]:
+    """Create an empty database with the schema, dropped afterwards.
+
+    It lives on the server from DATABASE_URL.
+
+    Yields:
+        str: url of the database.
+    """
+    server_url = make_url(settings.DATABASE_URL + settings.DATABASE_NAME)
+    database_url = server_url.set(database=f"bench_{uuid.uuid4().hex}")
+    server = create_async_engine(server_url, isolation_level="AUTOCOMMIT")
+    await execute(server, f'CREATE DATABASE "{database_url.database}"')
+    await create_schema(database_url)
+    try:
+        yield database_url.render_as_string(hide_password=False)
+    finally:
+        await execute(
+            server,
+            f'DROP DATABASE "{database_url.database}" WITH (FORCE)',
+        )
+        await server.dispose()
+
+
+async def execute(engine: AsyncEngine, statement: str) -> None:
+    """Execute a single statement on a new connection.
+
+    Args:
+        engine (AsyncEngine): async engine.
+        statement (str): SQL statement.
+    """
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql(statement)
+
+
+async def create_schema(database_url: URL) -> None:
+    """Create all the tables.
+
+    Args:
+        database_url (URL): database url.
+    """
+    engine = create_async_engine(database_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(base.Model.metadata.create_all)
+    await engine.dispose()
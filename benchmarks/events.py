@@ -0,0 +1,190 @@
+"""Throughput of EventBus.publish, publish_many and buffered publishing.
+
+With ``--redis fake`` the async redis client is replaced by one that
+drops every message, which isolates the cost of the bus itself.
+
+Usage: ``python -m benchmarks.events --events 10000 --redis fake``
+"""
+
+import asyncio
+import functools
+import time
+import types
+import typing as T  # noqa: WPS111,N812
+import uuid
+from unittest import mock
+
+from benchmarks import common
+from monster_spawner.domain.events.outgoing import MonsterCreated
+from monster_spawner.events import publisher
+from monster_spawner.events.buffer import EventBuffer
+from monster_spawner.events.bus import EventBus
+
+DEFAULT_EVENTS = 10000
+DEFAULT_BATCH = 100
+
+
+class FakePipeline:
+    """Redis pipeline dropping the buffered commands."""
+
+    def __init__(self) -> None:
+        self.commands = 0
+
+    async def __aenter__(self) -> "FakePipeline":
+        """Enter the pipeline context.
+
+        Returns:
+            FakePipeline: the pipeline.
+        """
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Exit the pipeline context."""  # noqa: DAR101
+
+    def publish(self, channel: str, payload: str) -> None:
+        """Buffer a publish command.
+
+        Args:
+            channel (str): channel name.
+            payload (str): message.
+        """
+        self.commands += 1
+
+    async def execute(self) -> None:
+        """Drop the buffered commands."""
+        self.commands = 0
+
+
+class FakeRedis:
+    """Async redis client dropping every message."""
+
+    async def publish(self, channel: str, payload: str) -> int:
+        """Drop a message.
+
+        Args:
+            channel (str): channel name.
+            payload (str): message.
+
+        Returns:
+            int: number of subscribers which received the message.
+        """
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        """Create a pipeline.
+
+        Args:
+            transaction (bool): whether to wrap the commands in MULTI.
+
+        Returns:
+            FakePipeline: new pipeline.
+        """
+        return FakePipeline()
+
+
+def create_events(count: int) -> list[MonsterCreated]:
+    """Create monster created events.
+
+    Args:
+        count (int): number of events.
+
+    Returns:
+        list[MonsterCreated]: events.
+    """
+    return [
+        MonsterCreated(
+            id=uuid.uuid4(),
+            name=f"Mob {index}",
+            hostile=False,
+            health=100,
+            damage=10,
+        )
+        for index in range(count)
+    ]
+
+
+async def publish_one_by_one(
+    events: list[MonsterCreated],
+    batch: int,
+    buffered: bool = False,
+) -> None:
+    """Publish every event on its own.
+
+    Args:
+        events (list[MonsterCreated]): events.
+        batch (int): number of events flushing the buffer.
+        buffered (bool): whether to publish through an event buffer.
+    """
+    event_buffer = None
+    if buffered:
+        event_buffer = EventBuffer()
+        event_buffer.max_size = batch
+    with mock.patch.object(EventBus, "buffer", event_buffer):
+        for event in events:
+            await EventBus.publish(event)
+    if event_buffer:
+        await event_buffer.flush()
+
+
+async def publish_in_batches(
+    events: list[MonsterCreated],
+    batch: int,
+) -> None:
+    """Publish the events in pipelined batches.
+
+    Args:
+        events (list[MonsterCreated]): events.
+        batch (int): number of events in a pipeline.
+    """
+    for start in range(0, len(events), batch):
+        stop = start + batch
+        await EventBus.publish_many(events[start:stop])
+
+
+MODES: T.Mapping[str, T.Callable[..., T.Awaitable]]
+MODES = types.MappingProxyType(
+    {
+        "publish": publish_one_by_one,
+        "publish_many": publish_in_batches,
+        "buffered": functools.partial(publish_one_by_one, buffered=True),
+    },
+)
+
+
+async def benchmark(count: int, batch: int, output: str | None) -> None:
+    """Publish the same number of events in every mode.
+
+    Args:
+        count (int): number of events.
+        batch (int): number of events in a pipeline.
+        output (str | None): JSON lines file to append the results to.
+    """
+    events = create_events(count)
+    for mode, publish in MODES.items():
+        start = time.perf_counter()
+        await publish(events, batch)
+        elapsed = time.perf_counter() - start
+        common.report(
+            f"events.{mode}",
+            {"events": count, "batch": batch},
+            {"seconds": elapsed, "events_per_second": count / elapsed},
+            output,
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = common.create_parser(__doc__)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH)
+    parser.add_argument("--redis", choices=("local", "fake"), default="local")
+    args = parser.parse_args()
+    client: T.Any = publisher.connections.async_client
+    if args.redis == "fake":
+        client = FakeRedis()
+    with mock.patch.object(publisher.connections, "async_client", client):
+        asyncio.run(benchmark(args.events, args.batch, args.output))
+
+
+if __name__ == "__main__":
+    main()
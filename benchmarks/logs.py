@@ -0,0 +1,140 @@
+"""Measure the logging cost of a single mob read.
+
+The legacy calls are the ones ``MobService.get`` made before the log
+levels and sampling were tuned, the current calls are the ones it makes
+now. Both are timed with structlog's default configuration, which the
+application used to run with, and with ``configure_logging``. Logs are
+written to the null device.
+
+Usage: ``python -m benchmarks.logs --calls 100000``
+"""
+
+import argparse
+import functools
+import os
+import timeit
+import typing as T  # noqa: WPS111,N812
+import uuid
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+import structlog
+
+from benchmarks import common
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.logs import configure_logging
+
+DEFAULT_CALLS = 100000
+MICROSECONDS = 1e6
+
+
+def legacy_calls(logger: T.Any, mob: schemas.MobOutSchema) -> None:
+    """Log a mob read as it used to be logged.
+
+    Args:
+        logger (Any): structlog logger.
+        mob (MobOutSchema): read mob.
+    """
+    logger.info("Getting mob", pk=mob.id)
+    logger.info("Got mob", mob=mob)
+
+
+def current_calls(logger: T.Any, mob: schemas.MobOutSchema) -> None:
+    """Log a mob read as it is logged now.
+
+    Args:
+        logger (Any): structlog logger.
+        mob (MobOutSchema): read mob.
+    """
+    logger.debug("Getting mob", pk=mob.id)
+    logger.info("Got mob", pk=mob.id, sampled=True)
+
+
+def configure_default(stream: T.TextIO) -> None:
+    """Use structlog's default configuration.
+
+    Args:
+        stream (TextIO): stream to write the logs to.
+    """
+    structlog.reset_defaults()
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(stream))
+
+
+CALLS = MappingProxyType({"legacy": legacy_calls, "current": current_calls})
+CONFIGURATIONS: T.Mapping[str, T.Callable[[T.TextIO], None]]
+CONFIGURATIONS = MappingProxyType(
+    {
+        "default": configure_default,
+        "configured": functools.partial(configure_logging, json=True),
+    },
+)
+
+
+def create_mob() -> schemas.MobOutSchema:
+    """Create a mob to log.
+
+    Returns:
+        MobOutSchema: mob output data.
+    """
+    now = datetime.now(timezone.utc)
+    return schemas.MobOutSchema(
+        id=uuid.uuid4(),
+        name="Zombie",
+        hostile=True,
+        health=100,
+        damage=10,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def measure(
+    log: T.Callable[[T.Any, schemas.MobOutSchema], None],
+    number: int,
+    repeat: int,
+) -> float:
+    """Time logging calls with the current configuration.
+
+    Args:
+        log (Callable[[Any, MobOutSchema], None]): logging calls.
+        number (int): number of requests in a run.
+        repeat (int): number of runs.
+
+    Returns:
+        float: microseconds per request of the best run.
+    """
+    call = functools.partial(log, structlog.get_logger(), create_mob())
+    best = min(timeit.repeat(call, number=number, repeat=repeat))
+    return best / number * MICROSECONDS
+
+
+def benchmark(configuration: str, args: argparse.Namespace) -> None:
+    """Time both calls with one configuration.
+
+    Args:
+        configuration (str): configuration name.
+        args (Namespace): command line arguments.
+    """
+    for calls, log in CALLS.items():
+        common.report(
+            f"logs.{calls}",
+            {"configuration": configuration, "calls": args.calls},
+            {"us_per_request": measure(log, args.calls, args.repeat)},
+            args.output,
+        )
+
+
+def main() -> None:
+    """Time every combination of calls and configuration."""
+    parser = common.create_parser(__doc__)
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    with open(os.devnull, "w") as devnull:
+        for configuration, configure in CONFIGURATIONS.items():
+            configure(devnull)
+            benchmark(configuration, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Time AlchemyRepository.collect on tables of growing size.
+
+The table is seeded with generate_series between the sizes, so the
+larger sizes reuse the rows of the smaller ones.
+
+Usage: ``python -m benchmarks.repository --sizes 1000 100000 1000000``
+"""
+
+import asyncio
+import time
+import typing as T  # noqa: WPS111,N812
+from types import MappingProxyType
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks import common, database
+from monster_spawner.database import models, sessions
+from monster_spawner.domain.mob import repositories
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+FILTERS: T.Mapping[str, dict[str, T.Any]] = MappingProxyType(
+    {
+        "all": {},
+        "hostile": {"hostile": True},
+        "lookups": {"health__gte": 5, "damage__in": [6, 8]},
+    },
+)
+MAX_HEALTH = 100
+MAX_DAMAGE = 10
+
+
+async def seed(
+    sessionmaker: T.Callable[..., AsyncSession],
+    start: int,
+    stop: int,
+) -> None:
+    """Insert mobs numbered from start to stop, both included.
+
+    Args:
+        sessionmaker (Callable[..., AsyncSession]): session factory.
+        start (int): number of the first mob.
+        stop (int): number of the last mob.
+    """
+    numbers = func.generate_series(start, stop).table_valued("number")
+    number = numbers.render_derived().c.number
+    query = insert(models.Mob).from_select(
+        ["id", "name", "hostile", "health", "damage"],
+        select(
+            func.gen_random_uuid(),
+            func.concat("Mob ", number),
+            number % 2 == 0,
+            number % MAX_HEALTH,
+            number % MAX_DAMAGE,
+        ),
+    )
+    async with sessionmaker() as session:
+        await session.execute(query)
+        await session.commit()
+
+
+async def collect(
+    sessionmaker: T.Callable[..., AsyncSession],
+    filters: dict[str, T.Any],
+) -> tuple[float, int]:
+    """Collect all the matching mobs with a fresh session.
+
+    Args:
+        sessionmaker (Callable[..., AsyncSession]): session factory.
+        filters (dict[str, Any]): filters to apply.
+
+    Returns:
+        tuple[float, int]: duration in seconds and number of mobs.
+    """
+    async with sessionmaker() as session:
+        repository = repositories.MobRepository(session=session)
+        start = time.perf_counter()
+        mobs = list(await repository.collect(**filters))
+        return time.perf_counter() - start, len(mobs)
+
+
+async def measure(
+    sessionmaker: T.Callable[..., AsyncSession],
+    size: int,
+    repeat: int,
+    output: str | None,
+) -> None:
+    """Collect every filter shape from the seeded table.
+
+    Args:
+        sessionmaker (Callable[..., AsyncSession]): session factory.
+        size (int): number of rows.
+        repeat (int): number of timed runs, the best one is reported.
+        output (str | None): JSON lines file to append the results to.
+    """
+    for name, filters in FILTERS.items():
+        runs = [await collect(sessionmaker, filters) for _ in range(repeat)]
+        best, count = min(runs)
+        common.report(
+            "repository.collect",
+            {"rows": size, "filters": name},
+            {"seconds": best, "rows_per_second": count / best},
+            output,
+        )
+
+
+async def benchmark(sizes: list[int], repeat: int, output: str | None):
+    """Grow the table through the sizes and measure each of them.
+
+    Args:
+        sizes (list[int]): numbers of rows.
+        repeat (int): number of timed runs, the best one is reported.
+        output (str | None): JSON lines file to append the results to.
+    """
+    async with database.throwaway_database() as database_url:
+        engine, async_session = sessions.get_connection(database_url)
+        seeded = 0
+        for size in sorted(sizes):
+            await seed(async_session, seeded + 1, size)
+            seeded = size
+            await measure(async_session, size, repeat, output)
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = common.create_parser(__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.sizes, args.repeat, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compare the validated and the fast list response paths.
+
+The validated path builds schemas from ORM entries, validates them
+again against the response model and encodes them with stdlib JSON.
+The fast path encodes plain column values with orjson.
+
+Usage: ``python -m benchmarks.serialization --count 10000``
+"""
+
+import asyncio
+import timeit
+import typing as T  # noqa: WPS111,N812
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from benchmarks import common
+from monster_spawner.api.responses import FastJSONResponse
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.database import models
+
+DEFAULT_COUNT = 10000
+
+response_field = create_response_field(
+    name="response",
+    type_=list[schemas.MobOutSchema],
+)
+
+
+def create_values(count: int) -> list[dict]:
+    """Create column values of mobs.
+
+    Args:
+        count (int): number of mobs.
+
+    Returns:
+        list[dict]: column values by field.
+    """
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Zombie {index}",
+            "hostile": index % 2 == 0,
+            "health": index % 100,
+            "damage": index % 10,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(count)
+    ]
+
+
+def validated_path(entries: list[models.Mob]) -> bytes:
+    """Serialize entries the way a response model does.
+
+    Args:
+        entries (list[Mob]): ORM entries.
+
+    Returns:
+        bytes: response body.
+    """
+    mobs = [schemas.MobOutSchema.from_orm(entry) for entry in entries]
+    content = asyncio.run(
+        serialize_response(field=response_field, response_content=mobs),
+    )
+    return JSONResponse(content).body
+
+
+def fast_path(values: list[dict]) -> bytes:
+    """Serialize column values with orjson.
+
+    Args:
+        values (list[dict]): column values by field.
+
+    Returns:
+        bytes: response body.
+    """
+    return FastJSONResponse(values).body
+
+
+def create_cases(count: int) -> dict[str, T.Callable[[], bytes]]:
+    """Prepare both paths on the same mobs.
+
+    Args:
+        count (int): number of mobs.
+
+    Returns:
+        dict[str, Callable[[], bytes]]: benchmarked callables by name.
+    """
+    values = create_values(count)
+    entries = [models.Mob(**row) for row in values]
+    return {
+        "validated": lambda: validated_path(entries),
+        "fast": lambda: fast_path(values),
+    }
+
+
+def main() -> None:
+    """Time both paths and report the best run of each."""
+    parser = common.create_parser(__doc__)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for name, case in create_cases(args.count).items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        common.report(
+            f"serialization.{name}",
+            {"count": args.count},
+            {"seconds": best},
+            args.output,
+        )
+
+
+if __name__ == "__main__":
+    main()
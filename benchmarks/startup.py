@@ -0,0 +1,105 @@
+"""Cold start of the application: import time and time to first response.
+
+Every run is a fresh interpreter, like a new worker of the autoscaler.
+It imports the application, runs the startup handlers, which connect to
+the configured database and redis, and serves a request through the
+ASGI application in process.
+
+Usage: ``python -m benchmarks.startup --runs 10``
+"""
+
+import asyncio
+import importlib
+import json
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+
+from httpx import AsyncClient
+
+from benchmarks import common
+
+FIRST_URL = "/api/v1/stats/pool"
+DEFAULT_RUNS = 10
+
+
+async def serve_first_request() -> None:
+    """Start the application and serve a single request."""
+    app = importlib.import_module("monster_spawner.main").app
+    async with AsyncClient(app=app, base_url="http://benchmark") as client:
+        await app.router.startup()
+        response = await client.get(FIRST_URL)
+        response.raise_for_status()
+        await app.router.shutdown()
+
+
+def measure() -> None:
+    """Measure a single cold start and print it as JSON."""
+    started = time.perf_counter()
+    importlib.import_module("monster_spawner.main")
+    imported = time.perf_counter()
+    asyncio.run(serve_first_request())
+    served = time.perf_counter()
+    print(  # noqa: WPS421
+        json.dumps(
+            {
+                "import_seconds": imported - started,
+                "first_response_seconds": served - started,
+            },
+        ),
+    )
+
+
+def run_process() -> dict[str, float]:
+    """Measure a cold start in a fresh interpreter.
+
+    Returns:
+        dict[str, float]: durations of the run, including the
+            interpreter startup as process_seconds.
+    """
+    started = time.perf_counter()
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "benchmarks.startup", "--measure"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    durations = json.loads(process.stdout.splitlines()[-1])
+    return {**durations, "process_seconds": elapsed}
+
+
+def benchmark(runs: int, output: str | None) -> None:
+    """Measure cold starts and report their medians.
+
+    Args:
+        runs (int): number of fresh interpreters.
+        output (str | None): JSON lines file to append the results to.
+    """
+    results = [run_process() for _ in range(runs)]
+    common.report(
+        "startup",
+        {"runs": runs, "url": FIRST_URL},
+        {
+            name: statistics.median(result[name] for result in results)
+            for name in results[0]
+        },
+        output,
+    )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = common.create_parser(__doc__)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--measure", action="store_true", help="single run")
+    args = parser.parse_args()
+    if args.measure:
+        measure()
+    else:
+        benchmark(args.runs, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,8 @@ make migrate
 
 if [[ -z ${DEVELOPMENT} ]]; then
 
-	COMMAND=("$(which uvicorn)" "monster_spawner.main:app" "--limit-max-requests=10000" "--timeout-keep-alive=2" "--workers" "1" "--host" "0.0.0.0" "--port" "${PORT:-8002}")
+	export LOG_JSON="${LOG_JSON:-true}"
+	COMMAND=("$(which python)" "-m" "monster_spawner.server")
 
 else
 
@@ -0,0 +1,77 @@
+"""Conditional request helpers."""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+
+
+def create_validators(
+    version: str | int,
+    modified_at: datetime | None = None,
+) -> dict[str, str]:
+    """Create the validator headers of a representation.
+
+    Args:
+        version (str | int): value changing with every modification.
+        modified_at (datetime | None): time of the last modification.
+
+    Returns:
+        dict[str, str]: ETag and optionally Last-Modified headers.
+    """
+    validators = {ETAG_HEADER: f'W/"{version}"'}
+    if modified_at:
+        validators[LAST_MODIFIED_HEADER] = format_datetime(
+            modified_at.astimezone(timezone.utc),
+            usegmt=True,
+        )
+    return validators
+
+
+def matches_etag(if_none_match: str, etag: str) -> bool:
+    """Compare entity tags with the weak comparison.
+
+    Args:
+        if_none_match (str): comma separated tags sent by the client.
+        etag (str): current entity tag.
+
+    Returns:
+        bool: whether any of the tags matches.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, validators: dict[str, str]) -> bool:
+    """Tell whether the representation held by the client is fresh.
+
+    If-None-Match takes precedence over If-Modified-Since.
+
+    Args:
+        request (Request): request object.
+        validators (dict[str, str]): current validator headers.
+
+    Returns:
+        bool: whether 304 Not Modified can be sent instead of the body.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return matches_etag(if_none_match, validators[ETAG_HEADER])
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = validators.get(LAST_MODIFIED_HEADER)
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(
+            last_modified,
+        ) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
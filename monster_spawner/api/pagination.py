@@ -0,0 +1,17 @@
+"""Pagination arguments."""
+
+from dataclasses import dataclass
+
+from fastapi import Query
+
+from monster_spawner.settings import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Pagination:
+    """Keyset pagination arguments."""
+
+    limit: int = Query(settings.PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE)
+    cursor: str | None = Query(None)
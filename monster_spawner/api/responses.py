@@ -0,0 +1,25 @@
+"""Response classes."""
+
+import typing as T  # noqa: WPS111,N812
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+
+    Values orjson does not know, like the UUID subclass returned by
+    asyncpg, are encoded as strings.
+    """
+
+    def render(self, content: T.Any) -> bytes:
+        """Encode the content.
+
+        Args:
+            content (Any): JSON compatible content.
+
+        Returns:
+            bytes: encoded content.
+        """
+        return orjson.dumps(content, default=str)
@@ -0,0 +1,22 @@
+"""Streaming response helpers."""
+
+from typing import AsyncIterator, Iterable
+
+from monster_spawner.api import schemas
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def encode_ndjson(
+    chunks: AsyncIterator[Iterable[schemas.Schema]],
+) -> AsyncIterator[str]:
+    """Encode chunks of schemas as newline delimited JSON.
+
+    Args:
+        chunks (AsyncIterator[Iterable[Schema]]): chunks of data objects.
+
+    Yields:
+        str: one JSON document per line for each chunk.
+    """
+    async for chunk in chunks:
+        yield "".join(f"{data_object.json()}\n" for data_object in chunk)
@@ -2,17 +2,29 @@
 
 import typing as T  # noqa: WPS111,N812
 
+from fastapi import Query
 from fastapi.params import Depends
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from structlog import get_logger
 
+from monster_spawner.api import pagination
+from monster_spawner.api.v1.mobs import filters, schemas
 from monster_spawner.database import sessions
+from monster_spawner.domain import readers
 from monster_spawner.domain.database import transactions
-from monster_spawner.domain.mob import repositories, services
+from monster_spawner.domain.mob import (
+    catalogue,
+    invalidation,
+    repositories,
+    services,
+)
 
 logger = get_logger(__name__)
 
-DictItems = list[tuple[str, T.Any]]
+Fieldset = T.Optional[list[str]]
+
+FIELD_PATTERN = "|".join(schemas.MobOutSchema.__fields__)
+FIELDSET_REGEX = f"^({FIELD_PATTERN})(,({FIELD_PATTERN}))*$"
 
 
 def get_alchemy_mob_service(
@@ -28,16 +40,62 @@ def get_alchemy_mob_service(
     """
     transaction = transactions.DatabaseTransaction(session=session)
     repository = repositories.MobRepository(session=session)
-    return services.MobService(transaction, repository)
+    return services.MobService(
+        transaction,
+        repository,
+        invalidation.mob_cache,
+        catalogue.mob_catalogue,
+    )
+
+
+def get_alchemy_mob_read_service(
+    session: AsyncSession = Depends(sessions.get_read_session),  # type: ignore
+) -> services.MobService:
+    """Instantiate a MobService with a read only database session.
+
+    Args:
+        session (AsyncSession): read only database session.
+
+    Returns:
+        MobService: mob service.
+    """
+    return get_alchemy_mob_service(session)
+
+
+def get_fieldset(
+    fields: str | None = Query(None, regex=FIELDSET_REGEX),
+) -> Fieldset:
+    """Parse a sparse fieldset of comma separated mob fields.
+
+    Args:
+        fields (str | None): comma separated field names.
+
+    Returns:
+        Fieldset: field names, None for all of them.
+    """
+    if fields is None:
+        return None
+    return fields.split(",")
 
 
-def dict_factory(dict_items: DictItems) -> dict[str, T.Any]:
-    """Convert a list of tuples to a dictionary.
+def get_page_request(
+    page_args: pagination.Pagination = Depends(),  # type: ignore
+    ordering: filters.MobOrdering = Depends(),  # type: ignore
+    fields: Fieldset = Depends(get_fieldset),  # type: ignore
+) -> readers.PageRequest:
+    """Gather the page arguments of a mob listing.
 
     Args:
-        dict_items (DictItems): list of tuples.
+        page_args (Pagination): page size and cursor.
+        ordering (MobOrdering): sort field.
+        fields (Fieldset): sparse fieldset.
 
     Returns:
-        dict[str, Any]: dictionary without empty values.
+        PageRequest: requested page.
     """
-    return {key: value for key, value in dict_items if value}  # noqa: WPS110
+    return readers.PageRequest(
+        limit=page_args.limit,
+        cursor=page_args.cursor,
+        ordering=ordering.sort,
+        fields=fields,
+    )
@@ -1,13 +1,63 @@
 """Url filters."""
 
-from dataclasses import dataclass
+import typing as T  # noqa: WPS111,N812
+from dataclasses import dataclass, fields
 
 from fastapi import Query
 
 
 @dataclass
 class MobFilters:
-    """Mob object filters."""
+    """Mob object filters.
+
+    Lookups follow the field name after a double underscore in the url,
+    e.g. ``health__gte``. Ranges are inclusive and take both bounds,
+    e.g. ``health__between=20&health__between=80``.
+    """
 
     name: str | None = Query(None)
+    name_in: list[str] | None = Query(None, alias="name__in")
+    name_startswith: str | None = Query(None, alias="name__startswith")
+    name_istartswith: str | None = Query(None, alias="name__istartswith")
+    name_iexact: str | None = Query(None, alias="name__iexact")
     hostile: bool | None = Query(None)
+    health_gt: int | None = Query(None, alias="health__gt")
+    health_gte: int | None = Query(None, alias="health__gte")
+    health_lt: int | None = Query(None, alias="health__lt")
+    health_lte: int | None = Query(None, alias="health__lte")
+    health_between: list[int] | None = Query(
+        None,
+        alias="health__between",
+        min_items=2,
+        max_items=2,
+    )
+    damage_gt: int | None = Query(None, alias="damage__gt")
+    damage_gte: int | None = Query(None, alias="damage__gte")
+    damage_lt: int | None = Query(None, alias="damage__lt")
+    damage_lte: int | None = Query(None, alias="damage__lte")
+    damage_between: list[int] | None = Query(
+        None,
+        alias="damage__between",
+        min_items=2,
+        max_items=2,
+    )
+
+    def to_lookups(self) -> dict[str, T.Any]:
+        """Name the set filters after the repository lookups.
+
+        Returns:
+            dict[str, Any]: filter values by lookup, without unset ones.
+        """
+        lookups = {}
+        for field in fields(self):
+            filter_value = getattr(self, field.name)
+            if filter_value is not None:
+                lookups[field.default.alias or field.name] = filter_value
+        return lookups
+
+
+@dataclass
+class MobOrdering:
+    """Mob object ordering, prefixed with ``-`` for descending."""
+
+    sort: str = Query("id", regex="^-?(id|name|health|damage)$")
@@ -1,15 +1,17 @@
 """Mobs API routes."""
 
-import typing as T  # noqa: WPS111,N812
-from dataclasses import asdict
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Body, Request, Response
 from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
 from starlette import status
 
+from monster_spawner.api import conditional, pagination, responses, streaming
 from monster_spawner.api.v1.mobs import dependencies, filters, schemas
+from monster_spawner.domain import readers
 from monster_spawner.domain.mob import services
+from monster_spawner.settings import settings
 
 router = APIRouter(prefix="/mobs", tags=["mobs"])
 
@@ -37,6 +39,68 @@ async def create_mob(
     return await service.create(payload)
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=list[schemas.MobBulkResultSchema],
+)
+async def create_mobs(
+    payload: list[schemas.MobCreateSchema] = Body(
+        ...,
+        min_items=1,
+        max_items=settings.MAX_BULK_SIZE,
+    ),
+    service: services.MobService = Depends(
+        dependencies.get_alchemy_mob_service,  # type: ignore
+    ),
+) -> list[schemas.MobBulkResultSchema]:
+    """Create many mobs at once.
+
+    Mobs with taken names are reported as conflicts instead of failing
+    the whole batch.
+
+    Args:
+        payload (list[MobCreateSchema]): mobs input data.
+        service (MobService): mob service.
+
+    Returns:
+        list[MobBulkResultSchema]: result of every mob in input order.
+    """
+    return await service.create_many(payload)
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_mobs(
+    service: services.MobService = Depends(
+        dependencies.get_alchemy_mob_service,  # type: ignore
+    ),
+    url_filters: filters.MobFilters = Depends(),  # type: ignore
+) -> StreamingResponse:
+    """Export all mobs as newline delimited JSON.
+
+    Rows are read with a server-side cursor and sent chunk by chunk.
+
+    Args:
+        service (MobService): mob service.
+        url_filters (MobFilters): mob filter arguments.
+
+    Returns:
+        StreamingResponse: one mob output data per line.
+    """
+    mobs = service.export(
+        settings.EXPORT_CHUNK_SIZE,
+        **url_filters.to_lookups(),
+    )
+    return StreamingResponse(
+        streaming.encode_ndjson(mobs),
+        media_type=streaming.NDJSON_MEDIA_TYPE,
+    )
+
+
 @router.get(
     "/{pk}",
     status_code=status.HTTP_200_OK,
@@ -44,48 +108,93 @@ async def create_mob(
 )
 async def get_mob(
     pk: UUID,
+    request: Request,
+    response: Response,
     service: services.MobService = Depends(
-        dependencies.get_alchemy_mob_service,  # type: ignore
+        dependencies.get_alchemy_mob_read_service,  # type: ignore
     ),
-) -> schemas.MobOutSchema:
+) -> schemas.MobOutSchema | Response:
     """Get mob by its primary key.
 
+    Responds with 304 Not Modified when the client copy is fresh.
+
     Args:
         pk (UUID): primary key of the mob.
+        request (Request): request object.
+        response (Response): response object.
         service (MobService): mob service.
 
     Returns:
-        MobOutSchema: mob output data.
+        MobOutSchema | Response: mob output data or empty response.
     """
-    return await service.get(pk)
+    mob = await service.get(pk)
+    validators = conditional.create_validators(
+        mob.updated_at.isoformat(),
+        mob.updated_at,
+    )
+    if conditional.is_not_modified(request, validators):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=validators,
+        )
+    response.headers.update(validators)
+    return mob
 
 
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=T.Iterable[schemas.MobOutSchema],
+    response_model=list[schemas.MobOutSchema],
+    response_class=responses.FastJSONResponse,
 )
 async def get_mobs(
+    request: Request,
     service: services.MobService = Depends(
-        dependencies.get_alchemy_mob_service,  # type: ignore
+        dependencies.get_alchemy_mob_read_service,  # type: ignore
     ),
     url_filters: filters.MobFilters = Depends(),  # type: ignore
-) -> T.Iterable[schemas.MobOutSchema]:
-    """Get all mobs.
+    page_request: readers.PageRequest = Depends(
+        dependencies.get_page_request,  # type: ignore
+    ),
+) -> Response:
+    """Get a page of mobs.
+
+    Only the requested fields and the id are returned when ``fields``
+    is given. Rows are encoded straight from the database values,
+    without validating them against the response model again.
+
+    The ETag is the version of the whole collection, so polling an
+    unchanged one costs a single tiny query and no body. It is read
+    before the page on the same server, so the page is never older.
+    Pages cut from the catalogue are sent without validators, the
+    catalogue may not have caught up with the version yet.
+
+    The cursor of the next page is sent in the X-Next-Cursor header.
 
     Args:
+        request (Request): request object.
         service (MobService): mob service.
         url_filters (MobFilters): mob filter arguments.
+        page_request (PageRequest): page size, cursor, sort and fields.
 
     Returns:
-        Iterable[MobOutSchema]: list of mobs output data.
+        Response: list of mobs output data or empty response.
     """
-    return await service.get_all(
-        **asdict(
-            url_filters,
-            dict_factory=dependencies.dict_factory,
-        ),
-    )
+    lookups = url_filters.to_lookups()
+    page = service.get_catalogue_page_values(page_request, **lookups)
+    validators = {}
+    if page is None:
+        validators = conditional.create_validators(await service.get_version())
+        if conditional.is_not_modified(request, validators):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers=validators,
+            )
+        page = await service.get_page_values(page_request, **lookups)
+    response = responses.FastJSONResponse(page.items, headers=validators)
+    if page.next_cursor:
+        response.headers[pagination.NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
 
 
 @router.delete("/{pk}", status_code=status.HTTP_204_NO_CONTENT)
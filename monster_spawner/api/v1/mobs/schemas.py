@@ -1,5 +1,7 @@
 """Mob API schemas."""
 
+import enum
+from datetime import datetime
 from uuid import UUID
 
 from monster_spawner.api import schemas
@@ -31,3 +33,26 @@ class MobOutSchema(schemas.Schema):
     hostile: bool
     health: int
     damage: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class BulkStatus(str, enum.Enum):  # noqa: WPS600
+    """Outcome of a single item of a bulk operation."""
+
+    CREATED = "created"
+    CONFLICT = "conflict"
+    SKIPPED = "skipped"
+
+
+class MobBulkResultSchema(schemas.Schema):
+    """Bulk create result of a single mob.
+
+    The id belongs to the conflicting mob when the name was taken. A mob
+    is skipped without an id when the mob holding its name was deleted
+    before it could be looked up.
+    """
+
+    status: BulkStatus
+    id: UUID | None = None
+    name: str
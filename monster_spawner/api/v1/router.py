@@ -2,7 +2,9 @@
 
 from fastapi.routing import APIRouter
 
-from monster_spawner.api.v1.mobs import routes
+from monster_spawner.api.v1.mobs import routes as mob_routes
+from monster_spawner.api.v1.stats import routes as stats_routes
 
 v1_router = APIRouter(prefix="/v1")
-v1_router.include_router(routes.router)
+v1_router.include_router(mob_routes.router)
+v1_router.include_router(stats_routes.router)
@@ -0,0 +1,44 @@
+"""Runtime statistics API routes."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette import status
+
+from monster_spawner.cache import Cache, CacheStats
+from monster_spawner.database import sessions
+from monster_spawner.database.pool import PoolStats
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    "/cache",
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, CacheStats],
+)
+async def get_cache_stats() -> dict[str, CacheStats]:
+    """Get hit and miss counters of every cache.
+
+    Returns:
+        dict[str, CacheStats]: counters by cache name.
+    """
+    return {name: cache.stats for name, cache in Cache.registry.items()}
+
+
+@router.get(
+    "/pool",
+    status_code=status.HTTP_200_OK,
+    response_model=PoolStats,
+)
+async def get_pool_stats(
+    engine: AsyncEngine = Depends(sessions.get_engine),
+) -> PoolStats:
+    """Get the state of the database connection pool.
+
+    Args:
+        engine (AsyncEngine): engine of the primary database.
+
+    Returns:
+        PoolStats: pool counters.
+    """
+    return engine.sync_engine.pool.stats()
@@ -0,0 +1,190 @@
+"""In-process LRU cache with an optional shared redis tier."""
+
+import time
+import typing as T  # noqa: WPS111,N812
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import redis
+from redis import asyncio as aioredis
+from structlog import get_logger
+
+from monster_spawner.api import schemas
+from monster_spawner.events.publisher import connections
+from monster_spawner.settings import settings
+
+logger = get_logger(__name__)
+
+CachedSchema = T.TypeVar("CachedSchema", bound=schemas.Schema)
+
+
+@dataclass
+class CacheStats:
+    """Counters of a single cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_size: int = 0
+
+
+class Cache(T.Generic[CachedSchema]):
+    """Bounded LRU cache of schemas with a time to live.
+
+    With CACHE_REDIS enabled, entries missing locally are looked up in
+    redis, so workers share what any of them has read.
+    """
+
+    registry: dict[str, "Cache"] = {}
+
+    def __init__(self, name: str, schema: type[CachedSchema]) -> None:
+        self.name = name
+        self.schema = schema
+        self.ttl = settings.CACHE_TTL
+        self.use_redis = settings.CACHE_REDIS
+        self.entries: OrderedDict[str, tuple[float, CachedSchema]]
+        self.entries = OrderedDict()
+        self.stats = CacheStats(max_size=settings.CACHE_MAX_SIZE)
+        self.registry[name] = self
+
+    @property
+    def generation(self) -> int:
+        """Number of the invalidations, moving on every delete or clear.
+
+        Returns:
+            int: current generation.
+        """
+        return self.stats.invalidations
+
+    @property
+    def client(self) -> aioredis.Redis | None:
+        """Client of the redis tier, looked up on use.
+
+        Returns:
+            aioredis.Redis | None: redis client, None when disabled.
+        """
+        if self.use_redis:
+            return connections.async_client
+        return None
+
+    async def get(self, key: str) -> CachedSchema | None:
+        """Get a fresh entry and mark it as recently used.
+
+        Args:
+            key (str): entry key.
+
+        Returns:
+            CachedSchema | None: cached data object, None on a miss.
+        """
+        entry = self.entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+        data_object = await self.get_shared(key)
+        if data_object is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self.store(key, data_object)
+        return data_object
+
+    async def set(
+        self,
+        key: str,
+        data_object: CachedSchema,
+        generation: int | None = None,
+    ) -> None:
+        """Cache an entry in both tiers.
+
+        A data object read before an invalidation may be older than the
+        change, so it is not cached when the generation it was read at
+        has moved since.
+
+        Args:
+            key (str): entry key.
+            data_object (CachedSchema): data object.
+            generation (int | None): generation it was read at, if any.
+        """
+        if generation not in {None, self.generation}:
+            return
+        self.store(key, data_object)
+        if self.client:
+            try:
+                await self.client.set(
+                    self.shared_key(key),
+                    data_object.json(),
+                    px=int(self.ttl * 1000),  # noqa: WPS432
+                )
+            except redis.exceptions.RedisError as exc:
+                logger.warning("Could not write to redis cache", exc=exc)
+
+    async def delete(self, key: str) -> None:
+        """Invalidate an entry in both tiers.
+
+        Args:
+            key (str): entry key.
+        """
+        self.entries.pop(key, None)
+        self.stats.size = len(self.entries)
+        self.stats.invalidations += 1
+        if self.client:
+            try:
+                await self.client.delete(self.shared_key(key))
+            except redis.exceptions.RedisError as exc:
+                logger.warning("Could not delete from redis cache", exc=exc)
+
+    def clear(self) -> None:
+        """Drop all local entries and reset the counters but the generation."""
+        self.entries.clear()
+        self.stats = CacheStats(
+            max_size=self.stats.max_size,
+            invalidations=self.generation + 1,
+        )
+
+    def store(self, key: str, data_object: CachedSchema) -> None:
+        """Put an entry in the local tier, evicting the least recent one.
+
+        Args:
+            key (str): entry key.
+            data_object (CachedSchema): data object.
+        """
+        self.entries[key] = (time.monotonic() + self.ttl, data_object)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.stats.max_size:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+        self.stats.size = len(self.entries)
+
+    async def get_shared(self, key: str) -> CachedSchema | None:
+        """Get an entry from the redis tier.
+
+        Args:
+            key (str): entry key.
+
+        Returns:
+            CachedSchema | None: cached data object, None on a miss.
+        """
+        if not self.client:
+            return None
+        try:
+            payload = await self.client.get(self.shared_key(key))
+        except redis.exceptions.RedisError as exc:
+            logger.warning("Could not read from redis cache", exc=exc)
+            return None
+        if payload is None:
+            return None
+        return self.schema.parse_raw(payload)
+
+    def shared_key(self, key: str) -> str:
+        """Prefix the key with the cache name.
+
+        Args:
+            key (str): entry key.
+
+        Returns:
+            str: redis key.
+        """
+        return f"cache:{self.name}:{key}"
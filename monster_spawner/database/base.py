@@ -3,23 +3,38 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import Column
+from sqlalchemy import Column, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
+from sqlalchemy.sql import func
 
 Base = declarative_base()
 
 
 class Model(Base):  # type: ignore
-    """Abstract database model."""
+    """Abstract database model.
+
+    Timestamps are set by the database and fetched right after a flush.
+    """
 
     __abstract__ = True
     __name__: str
+    __mapper_args__ = {"eager_defaults": True}
 
     metadata: Any
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    # TODO: Add created_at and updated_at columns.
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
 
     @declared_attr
     def __tablename__(self) -> str:
@@ -1,2 +1,2 @@
 from monster_spawner.database.base import Model  # noqa
-from monster_spawner.database.models import Mob  # noqa
+from monster_spawner.database.models import Mob, Outbox  # noqa
@@ -1,6 +1,18 @@
 """Database models."""
 
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Column,
+    Identity,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.event import listen
+from sqlalchemy.schema import Index
+from sqlalchemy.sql import func
 
 from monster_spawner.database import base
 
@@ -14,3 +26,63 @@ class Mob(base.Model):
     hostile = Column(Boolean, nullable=False, default=False)
     health = Column(Integer, nullable=False, default=100)
     damage = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_mob_hostile_health", hostile, health),
+        Index("ix_mob_health_id", health, "id"),
+        Index("ix_mob_damage_id", damage, "id"),
+        Index(
+            "ix_mob_name_pattern",
+            name,
+            postgresql_ops={"name": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_mob_lower_name_pattern",
+            func.lower(name).label("lower_name"),
+            postgresql_ops={"lower_name": "text_pattern_ops"},
+        ),
+    )
+
+
+class TableVersion(base.Base):  # type: ignore
+    """Counter bumped by every statement changing a versioned table."""
+
+    __tablename__ = "table_version"
+
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
+
+
+class Outbox(base.Model):
+    """Event stored with the transaction, waiting to be relayed."""
+
+    position = Column(BigInteger, Identity(), nullable=False, unique=True)
+    channel = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+
+
+# Statement level, so a bulk insert bumps the version once. The bump
+# is transactional, readers never see a version before its rows, and
+# the counter row is locked until the writing transaction commits.
+BUMP_TABLE_VERSION = DDL(  # noqa: WPS462
+    """
+    CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO table_version (name, version) VALUES (TG_TABLE_NAME, 1)
+        ON CONFLICT (name)
+        DO UPDATE SET version = table_version.version + 1;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+)
+VERSION_TRIGGER = DDL(  # noqa: WPS462
+    """
+    CREATE TRIGGER %(table)s_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %(table)s
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+    """,  # noqa: WPS323
+)
+
+listen(base.Base.metadata, "before_create", BUMP_TABLE_VERSION)
+listen(Mob.__table__, "after_create", VERSION_TRIGGER)
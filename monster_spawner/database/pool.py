@@ -0,0 +1,63 @@
+"""Connection pool instrumentation."""
+
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass
+class PoolStats:
+    """Connection pool counters."""
+
+    size: int = 0
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_time: float = 0
+    max_wait_time: float = 0
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool measuring how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.counters = PoolStats()
+
+    def stats(self) -> PoolStats:
+        """Take a snapshot of the pool state and counters.
+
+        Returns:
+            PoolStats: pool counters.
+        """
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self.counters.checkouts,
+            timeouts=self.counters.timeouts,
+            wait_time=self.counters.wait_time,
+            max_wait_time=self.counters.max_wait_time,
+        )
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.counters.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.counters.wait_time += waited
+            self.counters.max_wait_time = max(
+                self.counters.max_wait_time,
+                waited,
+            )
+        self.counters.checkouts += 1
+        return connection
@@ -0,0 +1,147 @@
+"""Read replica routing."""
+
+import asyncio
+import itertools
+import math
+import typing as T  # noqa: WPS111,N812
+
+from sqlalchemy import Float, case, extract, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from structlog import get_logger
+
+from monster_spawner.settings import settings
+
+logger = get_logger(__name__)
+
+# A replica which replayed all the WAL it received is up to date, no
+# matter how long ago the last transaction was. Both positions and the
+# replay timestamp are NULL on a primary, so its lag is zero.
+CAUGHT_UP = func.pg_last_wal_receive_lsn() == func.pg_last_wal_replay_lsn()
+REPLAY_DELAY = func.coalesce(
+    extract("epoch", func.now() - func.pg_last_xact_replay_timestamp()),
+    0,
+)
+LAG_QUERY = select(case((CAUGHT_UP, 0), else_=REPLAY_DELAY).cast(Float))
+
+
+class Replica:
+    """Read replica engine with its last measured lag."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.autocommit_engine = engine.execution_options(
+            isolation_level="AUTOCOMMIT",
+        )
+        self.lag: float = 0
+
+
+class ReplicaSet:
+    """Round robin of read replicas skipping the lagging ones."""
+
+    def __init__(self, engines: T.Iterable[AsyncEngine]) -> None:
+        self.replicas = [Replica(engine) for engine in engines]
+        self.rotation = itertools.cycle(self.replicas)
+        self.max_lag = settings.DATABASE_REPLICA_MAX_LAG
+        self.check_interval = settings.DATABASE_REPLICA_CHECK_INTERVAL
+        self.task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        """Count the replicas.
+
+        Returns:
+            int: number of replicas.
+        """
+        return len(self.replicas)
+
+    def choose(self) -> Replica | None:
+        """Get the next replica which is not lagging behind.
+
+        Returns:
+            Replica | None: replica, None when all of them are lagging.
+        """
+        for replica in itertools.islice(self.rotation, len(self.replicas)):
+            if replica.lag <= self.max_lag:
+                return replica
+        return None
+
+    async def check_lag(self) -> None:
+        """Measure the replication lag of every replica.
+
+        Unreachable replicas are treated as infinitely lagging.
+        """
+        for replica in self.replicas:
+            try:
+                async with replica.autocommit_engine.connect() as connection:
+                    lag = (await connection.execute(LAG_QUERY)).scalar_one()
+            except (SQLAlchemyError, OSError) as exc:
+                logger.warning("Could not check replica lag", exc=exc)
+                lag = math.inf
+            replica.lag = lag
+
+    async def run(self) -> None:
+        """Keep checking the replication lag until cancelled."""
+        while True:  # noqa: WPS457
+            await self.check_lag()
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        """Run the lag monitor in the background."""
+        logger.info("Starting replica lag monitor")
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel the lag monitor."""
+        logger.info("Stopping replica lag monitor")
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+
+class RoutingSession(Session):
+    """Session sending plain reads to replicas and the rest to primary.
+
+    Only the autocommit read sessions route, sessions which write stay
+    on the primary. Plain reads stick to the server the first one went
+    to, the primary included, so the later reads of a session never see
+    older rows than the earlier ones.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """Choose the bind for the clause.
+
+        Args:
+            mapper (Mapper): mapped class or mapper.
+            clause (ClauseElement): statement to execute.
+            kwargs (dict): other get_bind arguments.
+
+        Returns:
+            Engine | Connection: replica engine or primary bind.
+        """
+        primary = super().get_bind(mapper, clause, **kwargs)
+        replicas: ReplicaSet | None = self.info.get("replicas")
+        if not replicas or self._flushing or not is_plain_read(clause):
+            return primary
+        if "replica" not in self.info:
+            self.info["replica"] = replicas.choose()
+        replica: Replica | None = self.info["replica"]
+        if replica is None:
+            return primary
+        return replica.autocommit_engine.sync_engine
+
+
+def is_plain_read(clause: T.Any) -> bool:
+    """Tell whether the clause is a select without row locks.
+
+    Args:
+        clause (Any): statement to execute.
+
+    Returns:
+        bool: whether the clause can run on a replica.
+    """
+    if not isinstance(clause, Select):
+        return False
+    return clause._for_update_arg is None  # noqa: WPS437
@@ -1,5 +1,6 @@
 """Database session helpers."""
 
+from functools import cached_property
 from typing import Callable
 
 from sqlalchemy.ext.asyncio import (
@@ -9,9 +10,46 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import sessionmaker
 
+from monster_spawner.database.pool import InstrumentedPool
+from monster_spawner.database.replicas import ReplicaSet, RoutingSession
+from monster_spawner.metrics import collectors
 from monster_spawner.settings import settings
 
 
+def create_engine(database_url: str) -> AsyncEngine:
+    """Create an async engine.
+
+    The pool is configured with the DATABASE_POOL_* settings and every
+    statement is timed for the metrics. DATABASE_QUERY_CACHE_SIZE bounds
+    the compiled statements kept by SQLAlchemy and
+    DATABASE_STATEMENT_CACHE_SIZE the prepared statements kept by every
+    asyncpg connection.
+
+    Args:
+        database_url (str): database url.
+
+    Returns:
+        AsyncEngine: async engine.
+    """
+    engine = create_async_engine(
+        database_url,
+        poolclass=InstrumentedPool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+        connect_args={
+            "prepared_statement_cache_size": (
+                settings.DATABASE_STATEMENT_CACHE_SIZE
+            ),
+        },
+    )
+    collectors.instrument_engine(engine.sync_engine)
+    return engine
+
+
 def get_connection(
     database_url: str,
 ) -> tuple[AsyncEngine, Callable[..., AsyncSession]]:
@@ -24,7 +62,7 @@ def get_connection(
         tuple[AsyncEngine, Callable[..., AsyncSession]]: async engine
             and session.
     """
-    engine = create_async_engine(database_url)
+    engine = create_engine(database_url)
     async_session = sessionmaker(
         engine,
         class_=AsyncSession,
@@ -33,9 +71,120 @@ def get_connection(
     return engine, async_session
 
 
-engine, async_session = get_connection(
-    settings.DATABASE_URL + settings.DATABASE_NAME,
-)
+def get_read_sessionmaker(
+    engine: AsyncEngine,
+    replicas: ReplicaSet | None = None,
+) -> Callable[..., AsyncSession]:
+    """Prepare sessions for requests which only read.
+
+    The connections run in autocommit mode, so no BEGIN and COMMIT
+    round trips are made around single statement reads. Plain reads go
+    to the replicas, the only sessions allowed to read stale rows.
+
+    Args:
+        engine (AsyncEngine): async engine.
+        replicas (ReplicaSet | None): read replicas for plain reads.
+
+    Returns:
+        Callable[..., AsyncSession]: read session factory.
+    """
+    return sessionmaker(
+        engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        info={"replicas": replicas},
+    )
+
+
+class Database:
+    """Engines and session factories of the application database.
+
+    Nothing is created on import. The engines are created on first use,
+    normally by the startup handlers, and dropped by ``dispose``, so the
+    next use creates them again from the current settings.
+    """
+
+    @cached_property
+    def replicas(self) -> ReplicaSet:
+        """Read replicas of the DATABASE_REPLICA_URLS.
+
+        Returns:
+            ReplicaSet: read replicas, empty without any url.
+        """
+        return ReplicaSet(
+            create_engine(url)
+            for url in settings.DATABASE_REPLICA_URLS.split(",")
+            if url
+        )
+
+    @cached_property
+    def engine(self) -> AsyncEngine:
+        """Engine of the primary database.
+
+        Returns:
+            AsyncEngine: async engine.
+        """
+        return create_engine(settings.DATABASE_URL + settings.DATABASE_NAME)
+
+    @cached_property
+    def async_session(self) -> Callable[..., AsyncSession]:
+        """Factory of the sessions which write.
+
+        Every statement of the sessions, reads included, runs on the
+        primary, so checks made before a write never see a lagging
+        replica.
+
+        Returns:
+            Callable[..., AsyncSession]: session factory.
+        """
+        return sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+    @cached_property
+    def read_session(self) -> Callable[..., AsyncSession]:
+        """Factory of the sessions which only read.
+
+        Returns:
+            Callable[..., AsyncSession]: read session factory.
+        """
+        return get_read_sessionmaker(self.engine, self.replicas)
+
+    def session(self) -> AsyncSession:
+        """Open a session which writes.
+
+        Unlike ``async_session``, the method can be handed over before
+        the engine exists.
+
+        Returns:
+            AsyncSession: database session.
+        """
+        return self.async_session()
+
+    async def dispose(self) -> None:
+        """Close the pooled connections and drop the engines."""
+        created = vars(self)  # noqa: WPS421
+        if "engine" in created:
+            await self.engine.dispose()
+        if "replicas" in created:
+            for replica in self.replicas.replicas:
+                await replica.engine.dispose()
+        created.clear()
+
+
+database = Database()
+
+
+def get_engine() -> AsyncEngine:
+    """Get the engine of the primary database.
+
+    Returns:
+        AsyncEngine: async engine.
+    """
+    return database.engine
 
 
 async def get_session():  # pragma: no cover
@@ -44,6 +193,16 @@ async def get_session():  # pragma: no cover
     Yields:
         AsyncSession: database session.
     """
-    async with async_session() as session:
+    async with database.async_session() as session:
         yield session
         await session.commit()
+
+
+async def get_read_session():  # pragma: no cover
+    """Create a new session without a commit at the end.
+
+    Yields:
+        AsyncSession: read only database session.
+    """
+    async with database.read_session() as session:
+        yield session
@@ -0,0 +1,141 @@
+"""Keyset pagination cursors."""
+
+import base64
+import json
+import typing as T  # noqa: WPS111,N812
+
+from pydantic import ValidationError, parse_obj_as
+from sqlalchemy import tuple_
+from sqlalchemy.sql import elements
+
+from monster_spawner.api import schemas
+from monster_spawner.database import base
+from monster_spawner.domain import exceptions
+
+
+def encode_cursor(values: list[T.Any]) -> str:
+    """Encode keyset values into an opaque cursor.
+
+    Args:
+        values (list[Any]): values of the ordering columns.
+
+    Returns:
+        str: url safe cursor.
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps(values, default=str).encode(),
+    ).decode()
+
+
+def create_cursor(entry: T.Any, fields: list[str]) -> str:
+    """Create a cursor pointing after the entry.
+
+    Args:
+        entry (Any): last entry or row of a page.
+        fields (list[str]): ordering fields.
+
+    Returns:
+        str: url safe cursor.
+    """
+    return encode_cursor([getattr(entry, field) for field in fields])
+
+
+def decode_cursor(cursor: str) -> list[T.Any]:
+    """Decode an opaque cursor into keyset values.
+
+    Args:
+        cursor (str): url safe cursor.
+
+    Raises:
+        InvalidCursorError: when the cursor is malformed.
+
+    Returns:
+        list[Any]: values of the ordering columns.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise exceptions.InvalidCursorError(cursor=cursor)
+    if not isinstance(values, list):
+        raise exceptions.InvalidCursorError(cursor=cursor)
+    return values
+
+
+def validate_cursor(
+    schema: type[schemas.Schema],
+    fields: list[str],
+    cursor: str,
+) -> list[T.Any]:
+    """Decode a cursor and validate it with the schema fields.
+
+    Args:
+        schema (type[Schema]): output schema of the model.
+        fields (list[str]): ordering fields.
+        cursor (str): url safe cursor.
+
+    Raises:
+        InvalidCursorError: when the cursor does not match the fields.
+
+    Returns:
+        list[Any]: values of the ordering fields.
+    """
+    values = decode_cursor(cursor)
+    if len(values) != len(fields):
+        raise exceptions.InvalidCursorError(cursor=cursor)
+    try:
+        return [
+            parse_obj_as(schema.__fields__[field].outer_type_, value)
+            for field, value in zip(fields, values)  # noqa: WPS110
+        ]
+    except ValidationError:
+        raise exceptions.InvalidCursorError(cursor=cursor)
+
+
+def create_keyset_expression(
+    model: type[base.Model],
+    schema: type[schemas.Schema],
+    fields: list[str],
+    cursor: str,
+    descending: bool = False,
+) -> elements.BinaryExpression:
+    """Create an expression selecting rows after the cursor.
+
+    Args:
+        model (type[Model]): alchemy model.
+        schema (type[Schema]): output schema of the model.
+        fields (list[str]): ordering fields.
+        cursor (str): url safe cursor.
+        descending (bool): whether the fields are ordered descending.
+
+    Returns:
+        BinaryExpression: row comparison of the fields and the cursor.
+    """
+    return compare_keyset(
+        model,
+        fields,
+        validate_cursor(schema, fields, cursor),
+        descending,
+    )
+
+
+def compare_keyset(
+    model: type[base.Model],
+    fields: T.Sequence[str],
+    values: T.Sequence[T.Any],
+    descending: bool = False,
+) -> elements.BinaryExpression:
+    """Create a row comparison selecting rows after the values.
+
+    Args:
+        model (type[Model]): alchemy model.
+        fields (Sequence[str]): ordering fields.
+        values (Sequence[Any]): values or bound parameters of the fields.
+        descending (bool): whether the fields are ordered descending.
+
+    Returns:
+        BinaryExpression: row comparison of the fields and the values.
+    """
+    columns = tuple_(*[getattr(model, field) for field in fields])
+    if descending:
+        return columns < tuple_(*values)
+    return columns > tuple_(*values)
@@ -0,0 +1,82 @@
+"""Filter lookups."""
+
+import operator
+import typing as T  # noqa: WPS111,N812
+from types import MappingProxyType
+
+from sqlalchemy import func
+from sqlalchemy.sql import elements
+
+from monster_spawner.database import base
+from monster_spawner.domain import exceptions
+
+LOOKUP_SEPARATOR = "__"
+
+
+def _between(column: T.Any, bounds: T.Sequence[T.Any]) -> T.Any:
+    low, high = bounds
+    return column.between(low, high)
+
+
+def _in(column: T.Any, choices: T.Iterable[T.Any]) -> T.Any:
+    if isinstance(choices, elements.BindParameter):
+        return column.in_(choices)
+    return column.in_(list(choices))
+
+
+def _startswith(column: T.Any, prefix: str) -> T.Any:
+    return column.startswith(prefix, autoescape=True)
+
+
+def _istartswith(column: T.Any, prefix: str) -> T.Any:
+    return func.lower(column).startswith(prefix.lower(), autoescape=True)
+
+
+def _iexact(column: T.Any, text: str) -> T.Any:
+    return func.lower(column) == text.lower()
+
+
+LOOKUPS: T.Mapping[str, T.Callable[[T.Any, T.Any], T.Any]] = MappingProxyType(
+    {
+        "exact": operator.eq,
+        "gt": operator.gt,
+        "gte": operator.ge,
+        "lt": operator.lt,
+        "lte": operator.le,
+        "between": _between,
+        "in": _in,
+        "startswith": _startswith,
+        "istartswith": _istartswith,
+        "iexact": _iexact,
+    },
+)
+
+
+def create_lookup(
+    model: type[base.Model],
+    name: str,
+    value: T.Any,  # noqa: WPS110
+) -> elements.BinaryExpression:
+    """Create an SQL expression from a single filter.
+
+    A filter name is a field name, optionally followed by a lookup
+    after a double underscore, e.g. ``health__gte``. Without a lookup
+    the field is compared for equality.
+
+    Args:
+        model (type[Model]): alchemy model.
+        name (str): filter name.
+        value (Any): filter value.
+
+    Raises:
+        InvalidFilterError: when the field or the lookup is unknown.
+
+    Returns:
+        BinaryExpression: created expression.
+    """
+    field, _, lookup = name.partition(LOOKUP_SEPARATOR)
+    column = getattr(model, field, None)
+    create = LOOKUPS.get(lookup or "exact")
+    if column is None or create is None:
+        raise exceptions.InvalidFilterError(name=name)
+    return create(column, value)
@@ -2,9 +2,12 @@
 
 import typing as T  # noqa: WPS111,N812
 
-from sqlalchemy.sql import elements
+from sqlalchemy import select, update
+from sqlalchemy.sql import Update, elements
 
+from monster_spawner.api import schemas
 from monster_spawner.database import base
+from monster_spawner.domain.database import lookups
 
 
 def create_expressions(
@@ -13,6 +16,10 @@ def create_expressions(
 ) -> list[elements.BinaryExpression]:
     """Create SQL binary expressions from filters.
 
+    A filter name is a field name, optionally followed by a lookup
+    after a double underscore, e.g. ``health__gte``. Without a lookup
+    the field is compared for equality.
+
     Args:
         model (type[Model]): alchemy model.
         filters (dict[str, Any]): filters.
@@ -21,6 +28,96 @@ def create_expressions(
         list[BinaryExpression]: created expressions.
     """
     return [
-        getattr(model, field) == value
-        for field, value in filters.items()  # noqa: WPS110
+        lookups.create_lookup(model, name, value)
+        for name, value in filters.items()  # noqa: WPS110
     ]
+
+
+def parse_ordering(ordering: str) -> tuple[list[str], bool]:
+    """Parse a sort field into the keyset fields and direction.
+
+    Args:
+        ordering (str): field name, prefixed with ``-`` for descending.
+
+    Returns:
+        tuple[list[str], bool]: ordering fields, ending with the primary
+            key, and whether they are descending.
+    """
+    field = ordering.removeprefix("-")
+    fields = [field] if field == "id" else [field, "id"]
+    return fields, ordering.startswith("-")
+
+
+def create_ordering(
+    model: type[base.Model],
+    fields: list[str],
+    descending: bool,
+) -> list[elements.ColumnElement]:
+    """Create ORDER BY clauses of the fields.
+
+    Args:
+        model (type[Model]): alchemy model.
+        fields (list[str]): ordering fields.
+        descending (bool): whether the fields are ordered descending.
+
+    Returns:
+        list[ColumnElement]: ordering clauses.
+    """
+    columns = [getattr(model, field) for field in fields]
+    if descending:
+        return [column.desc() for column in columns]
+    return columns
+
+
+def create_fieldset(
+    schema: type[schemas.Schema],
+    fields: T.Iterable[str] | None = None,
+) -> list[str]:
+    """Pick the schema fields to return, always including the primary key.
+
+    Args:
+        schema (type[Schema]): output schema of the model.
+        fields (Iterable[str] | None): requested fields, None for all.
+
+    Returns:
+        list[str]: returned fields in the schema order.
+    """
+    if fields is None:
+        return list(schema.__fields__)
+    requested = {"id", *fields}
+    return [field for field in schema.__fields__ if field in requested]
+
+
+def create_locked_update(
+    model: type[base.Model],
+    entry_id: T.Any,
+    changes: dict[str, T.Any],
+) -> Update:
+    """Create an UPDATE of a single entry returning it before and after.
+
+    The old row is locked and read by a subquery of the same statement,
+    the returned row holds the old columns followed by the new ones.
+    The session is not synchronized, the returned row is parsed instead
+    of the loaded entries, which cannot be matched to the subquery.
+
+    Args:
+        model (type[Model]): alchemy model.
+        entry_id (Any): primary key.
+        changes (dict[str, Any]): updated values.
+
+    Returns:
+        Update: update statement.
+    """
+    previous = (
+        select(model)
+        .where(model.id == entry_id)
+        .with_for_update()
+        .subquery("previous")
+    )
+    return (
+        update(model)
+        .where(model.id == previous.c.id)
+        .values(**changes)
+        .returning(*previous.c, *model.__table__.columns)
+        .execution_options(synchronize_session=False)
+    )
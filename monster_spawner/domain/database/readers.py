@@ -0,0 +1,192 @@
+"""Database reads spanning many entries."""
+
+import typing as T  # noqa: WPS111,N812
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.sql import Select
+
+from monster_spawner.database import base, models
+from monster_spawner.domain import readers
+from monster_spawner.domain.database import cursors, queries, templates
+
+Model = T.TypeVar("Model", bound=base.Model)
+
+
+class AlchemyReader(T.Generic[Model, readers.OutSchema]):
+    """Reads of a table sharing the session of its repository."""
+
+    def __init__(
+        self,
+        table: type[Model],
+        schema: type[readers.OutSchema],
+        session: AsyncSession,
+    ) -> None:
+        self.table = table
+        self.schema = schema
+        self.session = session
+
+
+class AlchemyPager(AlchemyReader[Model, readers.OutSchema]):
+    """Keyset pagination over a table."""
+
+    async def page(
+        self,
+        request: readers.PageRequest,
+        **filters,
+    ) -> readers.Page[readers.OutSchema]:
+        """Collect a limited number of entries in the given order.
+
+        Args:
+            request (PageRequest): size, cursor and order of the page.
+            filters (dict): filters to apply.
+
+        Returns:
+            Page[OutSchema]: output data representations and next cursor.
+        """
+        page = await self.page_values(request, **filters)
+        return readers.Page(
+            items=[self.schema.parse_obj(row) for row in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    async def page_values(
+        self,
+        request: readers.PageRequest,
+        **filters,
+    ) -> readers.Page[dict[str, T.Any]]:
+        """Collect a limited number of entries as plain column values.
+
+        Rows are selected with a keyset condition on the ordering field
+        and the primary key, so every page costs the same no matter how
+        deep it is. Only the requested columns are selected and the rows
+        skip schema validation, the column types already match it.
+
+        Args:
+            request (PageRequest): size, cursor, order and fields.
+            filters (dict): filters to apply.
+
+        Returns:
+            Page[dict[str, Any]]: column values by field and next cursor.
+        """
+        fieldset = queries.create_fieldset(self.schema, request.fields)
+        shape = templates.PageShape.create(
+            self.table,
+            fieldset,
+            request,
+            filters,
+        )
+        query, parameters = _prepare_page(
+            self.schema,
+            shape,
+            request.cursor,
+            filters,
+        )
+        parameters[templates.LIMIT_PARAMETER] = request.limit + 1
+        rows = (await self.session.execute(query, parameters)).all()
+        return _create_page(rows, request.limit, list(shape.keyset), fieldset)
+
+
+class AlchemyScanner(AlchemyReader[Model, readers.OutSchema]):
+    """Reads over a whole table."""
+
+    async def stream(
+        self,
+        chunk_size: int,
+        **filters,
+    ) -> T.AsyncIterator[list[readers.OutSchema]]:
+        """Iterate over all entries with a server-side cursor.
+
+        Only a single chunk of rows is held in memory at a time.
+
+        Args:
+            chunk_size (int): maximum number of entries in a chunk.
+            filters (dict): filters to apply.
+
+        Yields:
+            list[OutSchema]: chunk of output data representations.
+        """
+        query = select(self.table).order_by(self.table.id)
+        if filters:
+            query = query.where(
+                *queries.create_expressions(self.table, filters),
+            )
+        entries = await self.session.stream(query)
+        async for chunk in entries.scalars().partitions(chunk_size):
+            yield [self.schema.from_orm(entry) for entry in chunk]
+
+    async def version(self) -> int:
+        """Get the version of the whole table.
+
+        The counter is bumped by a trigger on every statement changing
+        the table, so reading it costs a single primary key lookup. The
+        bump commits with the write, so a version is never visible
+        before its rows. Read it before the rows it validates and on the
+        same server, so the rows are never older than the version.
+
+        Returns:
+            int: table version, 0 before the first change.
+        """
+        query = select(models.TableVersion.version).where(
+            models.TableVersion.name == self.table.__tablename__,
+        )
+        return (await self.session.execute(query)).scalar() or 0
+
+
+def _prepare_page(
+    schema: type[readers.OutSchema],
+    shape: templates.PageShape,
+    cursor: str | None,
+    filters: dict[str, T.Any],
+) -> tuple[Select, dict[str, T.Any]]:
+    """Get the select of a page and its parameters but the limit.
+
+    The select is a cached template for the shape of the query, unless
+    a filter cannot be bound as a parameter.
+
+    Args:
+        schema (type[OutSchema]): output schema of the model.
+        shape (PageShape): shape of the query.
+        cursor (str | None): cursor returned with the previous page.
+        filters (dict[str, Any]): filters to apply.
+
+    Returns:
+        tuple[Select, dict[str, Any]]: select and parameters.
+    """
+    parameters = {}
+    if cursor:
+        parameters = shape.create_cursor_parameters(
+            cursors.validate_cursor(schema, list(shape.keyset), cursor),
+        )
+    query = templates.get_page_select(shape)
+    if query is None:
+        expressions = queries.create_expressions(shape.model, filters)
+        return shape.create_select(expressions), parameters
+    return query, {**parameters, **templates.create_parameters(filters)}
+
+
+def _create_page(
+    rows: T.Sequence[T.Any],
+    limit: int,
+    keyset: list[str],
+    fieldset: list[str],
+) -> readers.Page[dict[str, T.Any]]:
+    """Cut the rows down to the limit and point the cursor after them.
+
+    Args:
+        rows (Sequence[Any]): selected rows, up to one over the limit.
+        limit (int): maximum number of entries.
+        keyset (list[str]): ordering fields.
+        fieldset (list[str]): returned fields, selected first.
+
+    Returns:
+        Page[dict[str, Any]]: column values by field and next cursor.
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = cursors.create_cursor(rows[-1], keyset)
+    return readers.Page(
+        items=[dict(zip(fieldset, row)) for row in rows],
+        next_cursor=next_cursor,
+    )
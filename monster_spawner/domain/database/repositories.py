@@ -3,12 +3,14 @@
 import typing as T  # noqa: WPS111,N812
 import uuid
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from monster_spawner.database import base
 from monster_spawner.domain import exceptions, repositories
-from monster_spawner.domain.database import queries
+from monster_spawner.domain.database import queries, readers, templates
 
 Model = T.TypeVar("Model", bound=base.Model)
 
@@ -21,13 +23,23 @@ class AlchemyRepository(
         repositories.OutSchema,
     ],
 ):
-    """Generic database storage for ORM models."""
+    """Generic database storage for ORM models.
+
+    Pages and reads over the whole table are made by the pager and the
+    scanner, on the same session.
+    """
 
     table: type[Model]
     schema: type[repositories.OutSchema]
 
     def __init__(self, *args, session: AsyncSession, **kwargs) -> None:
         self.session = session
+        self.pager = readers.AlchemyPager(self.table, self.schema, session)
+        self.scanner = readers.AlchemyScanner(
+            self.table,
+            self.schema,
+            session,
+        )
 
     async def create(
         self,
@@ -46,6 +58,77 @@ class AlchemyRepository(
         await self.session.commit()
         return self.schema.from_orm(entry)
 
+    async def create_unique(
+        self,
+        data_object: repositories.CreateSchema,
+        field: str,
+    ) -> repositories.OutSchema:
+        """Create a new entry with INSERT ... ON CONFLICT DO NOTHING.
+
+        The unique constraint decides about conflicts, so concurrent
+        inserts cannot both succeed. The conflicting entry is looked up
+        only when the insert did not return a row. The insert is tried
+        again when that entry was deleted in between.
+
+        Args:
+            data_object (CreateSchema): input data object.
+            field (str): name of the unique field.
+
+        Raises:
+            AlreadyExistsError: when the field value is taken.
+
+        Returns:
+            OutSchema: output data representation.
+        """
+        query = (
+            postgresql.insert(self.table)
+            .values(**data_object.dict())
+            .on_conflict_do_nothing(index_elements=[field])
+            .returning(*self.table.__table__.columns)
+        )
+        column = getattr(self.table, field)
+        taken = select(self.table.id).where(
+            column == getattr(data_object, field),
+        )
+        while True:  # noqa: WPS457
+            entry = (await self.session.execute(query)).first()
+            if entry is not None:
+                return self.schema.from_orm(entry)
+            conflict_id = (await self.session.execute(taken)).scalar()
+            if conflict_id is not None:
+                raise exceptions.AlreadyExistsError(
+                    id=conflict_id,
+                    entry_name=self.table.__name__,
+                )
+
+    async def create_many(
+        self,
+        data_objects: T.Sequence[repositories.CreateSchema],
+    ) -> list[repositories.OutSchema]:
+        """Create new entries with a single multi-row INSERT.
+
+        Entries conflicting with an existing one on a unique constraint
+        are skipped and missing from the result, so a concurrent insert
+        of the same value does not fail the whole batch.
+
+        Args:
+            data_objects (Sequence[CreateSchema]): input data objects.
+
+        Returns:
+            list[OutSchema]: output data representations of the created
+                entries.
+        """
+        if not data_objects:
+            return []
+        query = (
+            postgresql.insert(self.table)
+            .values([data_object.dict() for data_object in data_objects])
+            .on_conflict_do_nothing()
+            .returning(*self.table.__table__.columns)
+        )
+        entries = await self.session.execute(query)
+        return [self.schema.from_orm(row) for row in entries]
+
     async def get_by_id(self, entry_id: uuid.UUID) -> repositories.OutSchema:
         """Get an entry by its id.
 
@@ -72,50 +155,158 @@ class AlchemyRepository(
     ) -> T.Iterable[repositories.OutSchema]:
         """Collect all entries nased on the query.
 
+        The select is a cached template for the set of filter fields,
+        unless a filter cannot be bound as a parameter.
+
         Args:
             filters (dict): filters to apply.
 
         Returns:
             Iterable[OutSchema]: list of output data representations.
         """
-        if filters:
-            filter_expressions = queries.create_expressions(self.table, filters)
-            query = select(self.table).where(*filter_expressions)
-        else:
-            query = select(self.table)
+        query = templates.get_select(
+            templates.Shape(self.table, tuple(sorted(filters))),
+        )
+        parameters = templates.create_parameters(filters)
+        if query is None:
+            query = select(self.table).where(
+                *queries.create_expressions(self.table, filters),
+            )
+            parameters = {}
+        entries = await self.session.execute(query, parameters)
+        return (self.schema.from_orm(entry) for entry in entries.scalars())
+
+    async def collect_in(
+        self,
+        field: str,
+        choices: T.Iterable[T.Any],
+    ) -> T.Iterable[repositories.OutSchema]:
+        """Collect entries with the field equal to any of the choices.
+
+        Args:
+            field (str): field name.
+            choices (Iterable[Any]): accepted values.
+
+        Returns:
+            Iterable[OutSchema]: list of output data representations.
+        """
+        query = select(self.table).where(
+            getattr(self.table, field).in_(list(choices)),
+        )
         entries = await self.session.execute(query)
         return (self.schema.from_orm(entry) for entry in entries.scalars())
 
     async def delete(self, entry_id: uuid.UUID) -> None:
-        """Get an entry by its id and delete it.
+        """Delete an entry with a single DELETE ... RETURNING.
 
         Args:
             entry_id (UUID): primary key.
+
+        Raises:
+            DoesNotExistError: when entry does not exist.
         """
-        await self.get_by_id(entry_id)
-        query = delete(self.table).where(self.table.id == entry_id)
-        await self.session.execute(query)
+        query = (
+            delete(self.table)
+            .where(self.table.id == entry_id)
+            .returning(self.table.id)
+        )
+        if (await self.session.execute(query)).first() is None:
+            raise exceptions.DoesNotExistError(
+                id=entry_id,
+                entry_name=self.table.__name__,
+            )
 
     async def update(
         self,
         entry_id: uuid.UUID,
         data_object: repositories.UpdateSchema,
-    ) -> repositories.OutSchema:
-        """Update an existing entry.
+    ) -> tuple[repositories.OutSchema, repositories.OutSchema]:
+        """Update an existing entry with a single UPDATE ... RETURNING.
+
+        The old row is locked and read by the same statement, so a
+        concurrent update cannot change it in between.
+        A unique constraint violation rolls back the transaction and is
+        reported with the entry holding the value.
 
         Args:
             entry_id (UUID): primary key.
             data_object (CreateSchema): input data object.
 
+        Raises:
+            DoesNotExistError: when entry does not exist.
+            IntegrityError: when any other constraint is violated.
+
         Returns:
-            OutSchema: output data representation.
+            tuple[OutSchema, OutSchema]: output data representations of
+                the entry before and after the update.
         """
-        query = (
-            update(self.table)
-            .where(self.table.id == entry_id)
-            .values(**data_object.dict(exclude_unset=True))
+        changes = data_object.dict(exclude_unset=True)
+        if not changes:
+            entry = await self.get_by_id(entry_id)
+            return entry, entry
+        query = queries.create_locked_update(self.table, entry_id, changes)
+        try:
+            row = (await self.session.execute(query)).first()
+        except IntegrityError:
+            await self.session.rollback()
+            await self.raise_conflict(entry_id, changes)
+            raise
+        if row is None:
+            raise exceptions.DoesNotExistError(
+                id=entry_id,
+                entry_name=self.table.__name__,
+            )
+        return _parse_row(self.schema, self.table.__table__.columns.keys(), row)
+
+    async def raise_conflict(
+        self,
+        entry_id: uuid.UUID,
+        changes: dict[str, T.Any],
+    ) -> None:
+        """Look up another entry holding any of the unique values.
+
+        Args:
+            entry_id (UUID): primary key of the updated entry.
+            changes (dict[str, Any]): updated values.
+
+        Raises:
+            AlreadyExistsError: when another entry holds a unique value.
+        """
+        columns = self.table.__table__.columns
+        conditions = [
+            column == changes[column.name]
+            for column in columns
+            if column.unique and column.name in changes
+        ]
+        query = select(self.table.id).where(
+            or_(*conditions),
+            self.table.id != entry_id,
         )
-        await self.session.execute(query)
+        conflict_id = (await self.session.execute(query)).scalar()
+        if conflict_id:
+            raise exceptions.AlreadyExistsError(
+                id=conflict_id,
+                entry_name=self.table.__name__,
+            )
 
-        entry = await self.get_by_id(entry_id)
-        return self.schema.from_orm(entry)
+
+def _parse_row(
+    schema: type[repositories.OutSchema],
+    keys: list[str],
+    row: T.Sequence[T.Any],
+) -> tuple[repositories.OutSchema, repositories.OutSchema]:
+    """Parse a row of old columns followed by the new ones.
+
+    Args:
+        schema (type[OutSchema]): output schema of the model.
+        keys (list[str]): column names in the table order.
+        row (Sequence[Any]): returned row.
+
+    Returns:
+        tuple[OutSchema, OutSchema]: old and new output data.
+    """
+    row_values = iter(row)
+    return (
+        schema.parse_obj(dict(zip(keys, row_values))),
+        schema.parse_obj(dict(zip(keys, row_values))),
+    )
@@ -0,0 +1,199 @@
+"""Parameterised query templates, cached by the shape of the query.
+
+Building a select and its cache key takes longer than executing a
+compiled one. A template is built once for every set of filter fields
+and takes the values as bound parameters. Its cache key is memoized,
+so repeated calls go straight to the compiled statement cache of the
+engine.
+"""
+
+import functools
+import typing as T  # noqa: WPS111,N812
+from dataclasses import dataclass
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.sql import Select
+
+from monster_spawner.database import base
+from monster_spawner.domain import readers
+from monster_spawner.domain.database import cursors, lookups, queries
+from monster_spawner.settings import settings
+
+LIMIT_PARAMETER = "limit"
+CURSOR_PARAMETER = "cursor_{0}"
+
+# Lookups taking the value as a single bound parameter.
+PARAMETER_LOOKUPS = frozenset(("exact", "gt", "gte", "lt", "lte", "in"))
+
+
+@dataclass(frozen=True)
+class Shape:
+    """Everything deciding the SQL of a query, but the values."""
+
+    model: type[base.Model]
+    filters: tuple[str, ...]
+
+    def create_filters(self) -> list[T.Any] | None:
+        """Create the filter expressions taking the values as parameters.
+
+        Every parameter is named after its filter.
+
+        Returns:
+            list[Any] | None: filter expressions, None when the SQL of a
+                filter depends on its value, e.g. an escaped pattern.
+        """
+        expressions = []
+        for name in self.filters:
+            lookup = name.partition(lookups.LOOKUP_SEPARATOR)[2] or "exact"
+            if lookup not in PARAMETER_LOOKUPS:
+                return None
+            parameter = bindparam(name, expanding=lookup == "in")
+            expressions.append(
+                lookups.create_lookup(self.model, name, parameter),
+            )
+        return expressions
+
+
+@dataclass(frozen=True)
+class PageShape(Shape):
+    """Shape of a query selecting a page of column values."""
+
+    columns: tuple[str, ...]
+    keyset: tuple[str, ...]
+    descending: bool
+    after_cursor: bool
+
+    @classmethod
+    def create(
+        cls,
+        model: type[base.Model],
+        fieldset: list[str],
+        request: readers.PageRequest,
+        filters: dict[str, T.Any],
+    ) -> "PageShape":
+        """Get the shape of a page query.
+
+        Args:
+            model (type[Model]): alchemy model.
+            fieldset (list[str]): returned fields.
+            request (PageRequest): ordering and cursor of the page.
+            filters (dict[str, Any]): filters to apply.
+
+        Returns:
+            PageShape: shape of the query.
+        """
+        keyset, descending = queries.parse_ordering(request.ordering)
+        return cls(
+            model=model,
+            filters=tuple(sorted(filters)),
+            columns=tuple(dict.fromkeys(fieldset + keyset)),
+            keyset=tuple(keyset),
+            descending=descending,
+            after_cursor=bool(request.cursor),
+        )
+
+    def create_select(self, filters: T.Sequence[T.Any]) -> Select:
+        """Create the select of the page.
+
+        The limit and the cursor values are bound parameters.
+
+        Args:
+            filters (Sequence[Any]): filter expressions.
+
+        Returns:
+            Select: page select.
+        """
+        columns = [getattr(self.model, column) for column in self.columns]
+        ordering = queries.create_ordering(
+            self.model,
+            list(self.keyset),
+            self.descending,
+        )
+        query = (
+            select(*columns)
+            .where(*filters)
+            .order_by(*ordering)
+            .limit(bindparam(LIMIT_PARAMETER))
+        )
+        if not self.after_cursor:
+            return query
+        parameters = [
+            bindparam(
+                CURSOR_PARAMETER.format(field),
+                type_=getattr(self.model, field).type,
+            )
+            for field in self.keyset
+        ]
+        return query.where(
+            cursors.compare_keyset(
+                self.model,
+                self.keyset,
+                parameters,
+                self.descending,
+            ),
+        )
+
+    def create_cursor_parameters(
+        self,
+        values: T.Sequence[T.Any],
+    ) -> dict[str, T.Any]:
+        """Get the bound parameters of the cursor values.
+
+        Args:
+            values (Sequence[Any]): cursor values.
+
+        Returns:
+            dict[str, Any]: parameters by name.
+        """
+        return {
+            CURSOR_PARAMETER.format(field): cursor_value
+            for field, cursor_value in zip(self.keyset, values)
+        }
+
+
+def create_parameters(filters: dict[str, T.Any]) -> dict[str, T.Any]:
+    """Get the bound parameters of the filters.
+
+    Args:
+        filters (dict[str, Any]): filters.
+
+    Returns:
+        dict[str, Any]: parameters by name.
+    """
+    parameters = dict(filters)
+    for name, value in filters.items():  # noqa: WPS110
+        if name.endswith(f"{lookups.LOOKUP_SEPARATOR}in"):
+            parameters[name] = list(value)
+    return parameters
+
+
+@functools.lru_cache(maxsize=settings.DATABASE_QUERY_TEMPLATES)
+def get_select(shape: Shape) -> Select | None:
+    """Get the template selecting filtered entries.
+
+    Args:
+        shape (Shape): shape of the query.
+
+    Returns:
+        Select | None: template, None when a filter cannot be bound.
+    """
+    filters = shape.create_filters()
+    if filters is None:
+        return None
+    return select(shape.model).where(*filters)
+
+
+@functools.lru_cache(maxsize=settings.DATABASE_QUERY_TEMPLATES)
+def get_page_select(shape: PageShape) -> Select | None:
+    """Get the template selecting a page of column values.
+
+    Args:
+        shape (PageShape): shape of the query.
+
+    Returns:
+        Select | None: template, None when a filter cannot be bound.
+    """
+    filters = shape.create_filters()
+    if filters is None:
+        return None
+    return shape.create_select(filters)
@@ -1,8 +1,16 @@
 """Database transactions."""
 
+from typing import TYPE_CHECKING
+
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from monster_spawner.domain import transactions
+from monster_spawner.events import outbox
+from monster_spawner.events.bus import EventBus
+from monster_spawner.settings import settings
+
+if TYPE_CHECKING:
+    from monster_spawner.domain.events.event_types import Event
 
 
 class DatabaseTransaction(transactions.Transaction):
@@ -10,16 +18,37 @@ class DatabaseTransaction(transactions.Transaction):
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.events: list["Event"] = []
 
     async def __aexit__(self, *args, **kwargs) -> None:
         """Exit transaction and close the session."""  # noqa: DAR101
         await super().__aexit__(*args, **kwargs)
         await self.session.close()
 
+    def add_event(self, event: "Event") -> None:
+        """Register an event to be published with the commit.
+
+        Args:
+            event (Event): event object.
+        """
+        self.events.append(event)
+
     async def commit(self) -> None:
-        """Commit the transaction."""
+        """Commit the transaction and hand over the registered events.
+
+        With the outbox enabled the events are stored in the same
+        transaction, otherwise they are published after the commit.
+        """
+        events = self.events
+        self.events = []
+        if settings.EVENTS_OUTBOX:
+            await outbox.store_events(self.session, events)
+            await self.session.commit()
+            return
         await self.session.commit()
+        await EventBus.publish_many(events)
 
     async def rollback(self) -> None:
-        """Rollback the transaction."""
+        """Rollback the transaction and drop the registered events."""
+        self.events.clear()
         await self.session.rollback()
@@ -2,16 +2,33 @@
 
 import abc
 import enum
+import typing as T  # noqa: WPS111,N812
 
 
 class Event(abc.ABC):
-    """Base class for domain events."""
+    """Base class for domain events.
+
+    Events with ``coalesce_by`` set are merged when several of them are
+    published close together for the same value of that field.
+    """
 
     event_type: enum.Enum
+    coalesce_by: T.ClassVar[str | None] = None
 
     def __init__(self, *args, **kwargs) -> None:
         """Allow taking parameters."""  # noqa: DAR101
 
+    def merge(self, later: "Event") -> "Event":
+        """Merge a later event of the same entity into this one.
+
+        Args:
+            later (Event): event published after this one.
+
+        Returns:
+            Event: single event standing for both.
+        """
+        return later
+
     @abc.abstractmethod
     async def handle(self) -> None:
         """Handle the event."""
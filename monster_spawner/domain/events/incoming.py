@@ -1 +1,63 @@
 """Domain events coming from the outside world."""
+
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import TYPE_CHECKING, AsyncIterator
+
+from structlog import get_logger
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.domain.events.event_types import Event
+from monster_spawner.events.bus import eventclass
+from monster_spawner.events.event_types import IncomingEventType
+
+if TYPE_CHECKING:
+    from monster_spawner.domain.mob.services import MobService
+
+logger = get_logger(__name__)
+
+
+@asynccontextmanager
+async def mob_service() -> AsyncIterator["MobService"]:
+    """Open a session and a mob service on it.
+
+    The database and service modules are imported on first use, so
+    registering the events on package import stays cheap, e.g. for the
+    server process which only spawns the workers.
+
+    Yields:
+        MobService: mob service.
+    """
+    from monster_spawner.api.v1.mobs import dependencies  # noqa: WPS433
+    from monster_spawner.database import sessions  # noqa: WPS433
+
+    async with sessions.database.session() as session:
+        yield dependencies.get_alchemy_mob_service(session)
+
+
+@eventclass(IncomingEventType.CREATE_MONSTER)
+class CreateMonster(Event):
+    """Event handler for monster creation requests."""
+
+    name: str
+    hostile: bool = False
+    health: int = 100
+    damage: int = 10
+
+    async def handle(self) -> None:
+        """Create the requested monster."""
+        async with mob_service() as service:
+            await service.create(schemas.MobCreateSchema(**asdict(self)))
+
+
+@eventclass(IncomingEventType.DELETE_MONSTER)
+class DeleteMonster(Event):
+    """Event handler for monster deletion requests."""
+
+    id: uuid.UUID
+
+    async def handle(self) -> None:
+        """Delete the requested monster."""
+        async with mob_service() as service:
+            await service.delete(self.id)
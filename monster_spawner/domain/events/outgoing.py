@@ -1,6 +1,7 @@
 """Domain events going to the outside world."""
 
 
+import typing as T  # noqa: WPS111,N812
 import uuid
 
 from structlog import get_logger
@@ -34,3 +35,65 @@ class MonsterDeleted(Event):
 
     async def handle(self) -> None:
         """Publish info about deleted monster."""
+
+
+@eventclass(OutgoingEventType.MONSTER_UPDATED)
+class MonsterUpdated(Event):
+    """Event handler for monster update.
+
+    Only the changed fields are sent, with their values before and after
+    the update. Updates of a mob published close together are merged.
+    """
+
+    coalesce_by: T.ClassVar[str | None] = "id"
+
+    id: uuid.UUID
+    changes: dict[str, T.Any]
+    previous: dict[str, T.Any]
+
+    @classmethod
+    def between(
+        cls,
+        pk: uuid.UUID,
+        previous: dict[str, T.Any],
+        current: dict[str, T.Any],
+    ) -> "MonsterUpdated":
+        """Create the event of the fields which differ.
+
+        Args:
+            pk (UUID): monster primary key.
+            previous (dict[str, Any]): field values before the update.
+            current (dict[str, Any]): field values after the update.
+
+        Returns:
+            MonsterUpdated: event with the changed fields only.
+        """
+        changed = [
+            field
+            for field, field_value in current.items()
+            if previous[field] != field_value
+        ]
+        return cls(
+            id=pk,
+            changes={field: current[field] for field in changed},
+            previous={field: previous[field] for field in changed},
+        )
+
+    def merge(self, later: Event) -> Event:
+        """Merge the diffs, a field changed back is left out.
+
+        Args:
+            later (Event): update published after this one.
+
+        Returns:
+            Event: update from the first previous to the last changes.
+        """
+        update = T.cast(MonsterUpdated, later)
+        return self.between(
+            self.id,
+            {**update.previous, **self.previous},
+            {**self.changes, **update.changes},
+        )
+
+    async def handle(self) -> None:
+        """Publish info about updated monster."""
@@ -18,3 +18,17 @@ class AlreadyExistsError(Exception):
 
     id: uuid.UUID
     entry_name: str = "Object"
+
+
+@dataclass
+class InvalidCursorError(Exception):
+    """Raise when a pagination cursor cannot be decoded."""
+
+    cursor: str
+
+
+@dataclass
+class InvalidFilterError(Exception):
+    """Raise when a filter refers to an unknown field or lookup."""
+
+    name: str
@@ -0,0 +1,314 @@
+"""In-process snapshot of the whole mob table.
+
+The mob table is small enough to be held by every worker. The
+catalogue is loaded when its feed starts and kept in sync from the mob
+events, so reads are served without a database round trip. Until it is
+loaded, and whenever the feed loses track, the catalogue is unloaded
+and reads go to the database.
+"""
+
+import operator
+import typing as T  # noqa: WPS111,N812
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.database.lookups import LOOKUP_SEPARATOR
+
+
+def _between(field_value: T.Any, bounds: T.Sequence[T.Any]) -> bool:
+    low, high = bounds
+    return low <= field_value <= high
+
+
+def _in(field_value: T.Any, choices: T.Iterable[T.Any]) -> bool:
+    return field_value in choices
+
+
+def _istartswith(field_value: str, prefix: str) -> bool:
+    return field_value.lower().startswith(prefix.lower())
+
+
+def _iexact(field_value: str, text: str) -> bool:
+    return field_value.lower() == text.lower()
+
+
+PREDICATES: T.Mapping[str, T.Callable[[T.Any, T.Any], bool]] = MappingProxyType(
+    {
+        "exact": operator.eq,
+        "gt": operator.gt,
+        "gte": operator.ge,
+        "lt": operator.lt,
+        "lte": operator.le,
+        "between": _between,
+        "in": _in,
+        "startswith": str.startswith,
+        "istartswith": _istartswith,
+        "iexact": _iexact,
+    },
+)
+
+
+@dataclass(slots=True)
+class MobRecord:
+    """Compact copy of a mob, without the attribute dict of a schema."""
+
+    id: uuid.UUID
+    name: str
+    hostile: bool
+    health: int
+    damage: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def create(cls, mob: schemas.MobOutSchema) -> "MobRecord":
+        """Copy the fields of a mob.
+
+        Args:
+            mob (MobOutSchema): mob output data.
+
+        Returns:
+            MobRecord: mob record.
+        """
+        return cls(
+            id=mob.id,
+            name=mob.name,
+            hostile=mob.hostile,
+            health=mob.health,
+            damage=mob.damage,
+            created_at=mob.created_at,
+            updated_at=mob.updated_at,
+        )
+
+    def to_schema(self) -> schemas.MobOutSchema:
+        """Create the output schema of the mob, without validation.
+
+        Returns:
+            MobOutSchema: mob output data.
+        """
+        return schemas.MobOutSchema.construct(
+            **{field: getattr(self, field) for field in self.__slots__},
+        )
+
+
+@dataclass(frozen=True)
+class Condition:
+    """Single filter, checked against the records."""
+
+    field: str
+    lookup: str
+    filter_value: T.Any
+
+    @classmethod
+    def create(cls, name: str, filter_value: T.Any) -> "Condition":
+        """Create the condition of a repository filter.
+
+        Args:
+            name (str): filter name, e.g. ``health__gte``.
+            filter_value (Any): filter value.
+
+        Raises:
+            InvalidFilterError: when the field or the lookup is unknown.
+
+        Returns:
+            Condition: created condition.
+        """
+        field, _, lookup = name.partition(LOOKUP_SEPARATOR)
+        lookup = lookup or "exact"
+        if field not in MobRecord.__slots__ or lookup not in PREDICATES:
+            raise exceptions.InvalidFilterError(name=name)
+        return cls(field, lookup, filter_value)
+
+    def matches(self, record: MobRecord) -> bool:
+        """Check the record against the filter.
+
+        Args:
+            record (MobRecord): mob record.
+
+        Returns:
+            bool: whether the record passes the filter.
+        """
+        predicate = PREDICATES[self.lookup]
+        return predicate(getattr(record, self.field), self.filter_value)
+
+
+class Catalogue:
+    """Mob records in a flat list, indexed by id, name and hostile.
+
+    A removed record is replaced by the last one, so the list never has
+    holes and the order of the records is not kept. Writes to an
+    unloaded catalogue are ignored, the next load includes them.
+    """
+
+    def __init__(self) -> None:
+        self.records: list[MobRecord] = []
+        self.positions: dict[uuid.UUID, int] = {}
+        self.names: dict[str, uuid.UUID] = {}
+        self.hostile: dict[bool, set[uuid.UUID]] = {True: set(), False: set()}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        """Count the records.
+
+        Returns:
+            int: number of mobs in the catalogue.
+        """
+        return len(self.records)
+
+    def load(self, mobs: T.Iterable[schemas.MobOutSchema]) -> None:
+        """Replace the records with a snapshot of the table.
+
+        Args:
+            mobs (Iterable[MobOutSchema]): every mob.
+        """
+        self.unload()
+        for mob in mobs:
+            self.insert(MobRecord.create(mob))
+        self.loaded = True
+
+    def unload(self) -> None:
+        """Drop the records, reads go to the database until reloaded."""
+        self.records.clear()
+        self.positions.clear()
+        self.names.clear()
+        for ids in self.hostile.values():
+            ids.clear()
+        self.loaded = False
+
+    def put(self, *mobs: schemas.MobOutSchema) -> None:
+        """Add mobs or replace their records.
+
+        Args:
+            mobs (MobOutSchema): mobs output data.
+        """
+        if not self.loaded:
+            return
+        for mob in mobs:
+            self.discard(mob.id)
+            self.insert(MobRecord.create(mob))
+
+    def remove(self, pk: uuid.UUID) -> None:
+        """Remove a mob if it is in the catalogue.
+
+        Args:
+            pk (UUID): mob primary key.
+        """
+        if self.loaded:
+            self.discard(pk)
+
+    def get(self, pk: uuid.UUID) -> schemas.MobOutSchema | None:
+        """Get a mob by its primary key.
+
+        Args:
+            pk (UUID): mob primary key.
+
+        Returns:
+            MobOutSchema | None: mob output data, None when the mob is
+                not in the catalogue or the catalogue is not loaded.
+        """
+        position = self.positions.get(pk)
+        if position is None:
+            return None
+        return self.records[position].to_schema()
+
+    def collect(self, **filters) -> list[schemas.MobOutSchema] | None:
+        """Collect the mobs matching the filters.
+
+        Filters are named like the repository ones, e.g. ``health__gte``.
+
+        Args:
+            filters (dict): filters to apply.
+
+        Returns:
+            list[MobOutSchema] | None: mobs output data, None when the
+                catalogue is not loaded or a filter is unknown.
+        """
+        records = self.match(filters)
+        if records is None:
+            return None
+        return [record.to_schema() for record in records]
+
+    def match(self, filters: dict[str, T.Any]) -> list[MobRecord] | None:
+        """Pick the records matching the filters.
+
+        Args:
+            filters (dict[str, Any]): filters to apply.
+
+        Returns:
+            list[MobRecord] | None: matching records, None when the
+                catalogue is not loaded or a filter is unknown.
+        """
+        if not self.loaded:
+            return None
+        try:
+            conditions = [
+                Condition.create(name, filter_value)
+                for name, filter_value in filters.items()
+            ]
+        except exceptions.InvalidFilterError:
+            return None
+        return [
+            record
+            for record in self.narrow(filters)
+            if all(condition.matches(record) for condition in conditions)
+        ]
+
+    def narrow(self, filters: dict[str, T.Any]) -> T.Sequence[MobRecord]:
+        """Pick the records an index leaves for the exact filters.
+
+        Args:
+            filters (dict[str, Any]): filters to apply.
+
+        Returns:
+            Sequence[MobRecord]: records which may match the filters.
+        """
+        name = filters.get("name")
+        hostile = filters.get("hostile")
+        ids: T.Collection[uuid.UUID | None]
+        if name is not None:
+            ids = {self.names.get(name)}
+        elif hostile is not None:
+            ids = self.hostile.get(hostile, set())
+        else:
+            return self.records
+        return [
+            self.records[self.positions[pk]]
+            for pk in ids
+            if pk in self.positions
+        ]
+
+    def insert(self, record: MobRecord) -> None:
+        """Append a record and index it.
+
+        Args:
+            record (MobRecord): new mob record.
+        """
+        self.positions[record.id] = len(self.records)
+        self.records.append(record)
+        self.names[record.name] = record.id
+        self.hostile[record.hostile].add(record.id)
+
+    def discard(self, pk: uuid.UUID) -> None:
+        """Remove a record, moving the last one in its place.
+
+        Args:
+            pk (UUID): mob primary key.
+        """
+        position = self.positions.pop(pk, None)
+        if position is None:
+            return
+        record = self.records[position]
+        last = self.records.pop()
+        if last is not record:
+            self.records[position] = last
+            self.positions[last.id] = position
+        if self.names.get(record.name) == pk:
+            del self.names[record.name]  # noqa: WPS420
+        self.hostile[record.hostile].discard(pk)
+
+
+mob_catalogue = Catalogue()
@@ -0,0 +1,100 @@
+"""Change feed keeping the mob catalogue in sync."""
+
+import uuid
+
+from sqlalchemy.exc import SQLAlchemyError
+from structlog import get_logger
+
+from monster_spawner.database import sessions
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.events.event_types import Event
+from monster_spawner.domain.events.outgoing import (
+    MonsterCreated,
+    MonsterDeleted,
+    MonsterUpdated,
+)
+from monster_spawner.domain.mob.catalogue import Catalogue
+from monster_spawner.domain.mob.invalidation import CacheFeed, MobCache
+from monster_spawner.domain.mob.repositories import MobRepository
+from monster_spawner.settings import settings
+
+logger = get_logger(__name__)
+
+# Errors after which the catalogue cannot be trusted until reloaded.
+FEED_ERRORS = (SQLAlchemyError, OSError)
+
+
+class CatalogueFeed(CacheFeed):
+    """Background worker keeping a catalogue in sync with mob events.
+
+    The catalogue is reloaded on every connection, after reading is set
+    up, so no event falls between the snapshot and the feed. Events
+    carry no timestamps, so the mob of a created or updated event is
+    read back from the database.
+    """
+
+    def __init__(self, catalogue: Catalogue, cache: MobCache) -> None:
+        super().__init__(cache)
+        self.catalogue = catalogue
+
+    async def load(self) -> None:
+        """Load the catalogue with a snapshot of the mob table."""
+        async with sessions.database.session() as session:
+            chunks = MobRepository(session=session).scanner.stream(
+                settings.CONSUMER_BATCH_SIZE,
+            )
+            mobs = [mob async for chunk in chunks for mob in chunk]
+        self.catalogue.load(mobs)
+        logger.info("Loaded mob catalogue", count=len(mobs))
+
+    async def refresh(self, pk: uuid.UUID) -> None:
+        """Read a mob back from the database into the catalogue.
+
+        Args:
+            pk (UUID): mob primary key.
+        """
+        async with sessions.database.session() as session:
+            try:
+                mob = await MobRepository(session=session).get_by_id(pk)
+            except exceptions.DoesNotExistError:
+                self.catalogue.remove(pk)
+                return
+        self.catalogue.put(mob)
+
+    async def catch_up(self) -> None:
+        """Load a fresh snapshot, including what was sent before."""
+        await super().catch_up()
+        try:
+            await self.load()
+        except FEED_ERRORS as exc:
+            logger.error("Could not load mob catalogue", exc=exc)
+            self.catalogue.unload()
+
+    async def apply(self, event: Event) -> None:
+        """Apply a mob event to the cache and the catalogue.
+
+        An unloaded catalogue is loaded instead, the snapshot already
+        has the change.
+
+        Args:
+            event (Event): decoded mob event.
+        """
+        await super().apply(event)
+        if not self.catalogue.loaded:
+            await self.catch_up()
+            return
+        if isinstance(event, MonsterDeleted):
+            self.catalogue.remove(event.id)
+            return
+        if not isinstance(event, (MonsterCreated, MonsterUpdated)):
+            return
+        try:
+            await self.refresh(event.id)
+        except FEED_ERRORS as exc:
+            logger.error("Could not sync mob catalogue", exc=exc)
+            self.catalogue.unload()
+
+    async def stop(self) -> None:
+        """Stop reading and unload the catalogue, it is not synced."""
+        await super().stop()
+        self.catalogue.unload()
@@ -0,0 +1,46 @@
+"""Invalidation of the mobs cached by every worker."""
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.cache import Cache
+from monster_spawner.domain.events.event_types import Event
+from monster_spawner.domain.events.outgoing import (
+    MonsterDeleted,
+    MonsterUpdated,
+)
+from monster_spawner.events.consumer import EventFeed
+from monster_spawner.events.event_types import OutgoingEventType
+
+MobCache = Cache[schemas.MobOutSchema]
+
+FEED_CHANNELS = (
+    OutgoingEventType.MONSTER_CREATED.value,
+    OutgoingEventType.MONSTER_UPDATED.value,
+    OutgoingEventType.MONSTER_DELETED.value,
+)
+
+mob_cache = MobCache("mobs", schemas.MobOutSchema)
+
+
+class CacheFeed(EventFeed):
+    """Background worker dropping the cached mobs changed by any worker.
+
+    The worker handling a write only invalidates its own cache, the
+    others drop the mob once its event comes in.
+    """
+
+    def __init__(self, cache: MobCache) -> None:
+        super().__init__(FEED_CHANNELS)
+        self.cache = cache
+
+    async def catch_up(self) -> None:
+        """Drop the local entries, the events sent before are lost."""
+        self.cache.clear()
+
+    async def apply(self, event: Event) -> None:
+        """Drop the cached mob of an updated or deleted event.
+
+        Args:
+            event (Event): decoded mob event.
+        """
+        if isinstance(event, (MonsterUpdated, MonsterDeleted)):
+            await self.cache.delete(str(event.id))
@@ -0,0 +1,151 @@
+"""Keyset pages of the mob catalogue.
+
+Pages are cut like the database ones and share their cursors, so a
+client keeps paging when the catalogue is loaded or unloaded in between.
+Names are ordered by the database collation, which Python does not
+reproduce, so pages ordered by name are left to the database.
+"""
+
+import heapq
+import operator
+import typing as T  # noqa: WPS111,N812
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.domain import readers
+from monster_spawner.domain.database import cursors, queries
+from monster_spawner.domain.mob.catalogue import Catalogue, MobRecord
+
+SORTABLE = frozenset(("id", "health", "damage"))
+
+
+def page(
+    catalogue: Catalogue,
+    request: readers.PageRequest,
+    **filters,
+) -> readers.Page[schemas.MobOutSchema] | None:
+    """Collect a page of mobs from the catalogue.
+
+    Args:
+        catalogue (Catalogue): mob catalogue.
+        request (PageRequest): size, cursor and order of the page.
+        filters (dict): filters to apply.
+
+    Returns:
+        Page[MobOutSchema] | None: mobs output data and the next cursor,
+            None when the page is left to the database.
+    """
+    selected = _select(catalogue, request, filters)
+    if selected is None:
+        return None
+    records, next_cursor = selected
+    return readers.Page(
+        items=[record.to_schema() for record in records],
+        next_cursor=next_cursor,
+    )
+
+
+def page_values(
+    catalogue: Catalogue,
+    request: readers.PageRequest,
+    **filters,
+) -> readers.Page[dict[str, T.Any]] | None:
+    """Collect a page of mobs from the catalogue as plain field values.
+
+    Args:
+        catalogue (Catalogue): mob catalogue.
+        request (PageRequest): size, cursor, order and fields.
+        filters (dict): filters to apply.
+
+    Returns:
+        Page[dict[str, Any]] | None: mobs field values and the next
+            cursor, None when the page is left to the database.
+    """
+    selected = _select(catalogue, request, filters)
+    if selected is None:
+        return None
+    records, next_cursor = selected
+    fieldset = queries.create_fieldset(schemas.MobOutSchema, request.fields)
+    return readers.Page(
+        items=[
+            {field: getattr(record, field) for field in fieldset}
+            for record in records
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+def _select(
+    catalogue: Catalogue,
+    request: readers.PageRequest,
+    filters: dict[str, T.Any],
+) -> tuple[list[MobRecord], str | None] | None:
+    """Pick the records of a page and point the cursor after them.
+
+    Only the records of the page are kept while scanning the catalogue,
+    the matching ones are never sorted as a whole.
+
+    Args:
+        catalogue (Catalogue): mob catalogue.
+        request (PageRequest): size, cursor and order of the page.
+        filters (dict[str, Any]): filters to apply.
+
+    Returns:
+        tuple[list[MobRecord], str | None] | None: records and the next
+            cursor, None when the catalogue is not loaded, a filter is
+            unknown or the mobs are ordered by name.
+    """
+    keyset, descending = queries.parse_ordering(request.ordering)
+    records = catalogue.match(filters)
+    if records is None or keyset[0] not in SORTABLE:
+        return None
+    if request.cursor:
+        records = _after(records, keyset, descending, request.cursor)
+    pick = heapq.nlargest if descending else heapq.nsmallest
+    records = pick(
+        request.limit + 1,
+        records,
+        key=lambda record: _values(record, keyset),
+    )
+    if len(records) <= request.limit:
+        return records, None
+    records.pop()
+    return records, cursors.create_cursor(records[-1], keyset)
+
+
+def _after(
+    records: list[MobRecord],
+    keyset: list[str],
+    descending: bool,
+    cursor: str,
+) -> list[MobRecord]:
+    """Drop the records up to the cursor.
+
+    Args:
+        records (list[MobRecord]): matching records.
+        keyset (list[str]): ordering fields.
+        descending (bool): whether the fields are ordered descending.
+        cursor (str): cursor returned with the previous page.
+
+    Returns:
+        list[MobRecord]: records after the cursor.
+    """
+    bound = tuple(
+        cursors.validate_cursor(schemas.MobOutSchema, keyset, cursor),
+    )
+    compare = operator.lt if descending else operator.gt
+    return [
+        record for record in records if compare(_values(record, keyset), bound)
+    ]
+
+
+def _values(record: MobRecord, keyset: list[str]) -> tuple[T.Any, ...]:
+    """Get the values of the ordering fields of a record.
+
+    Args:
+        record (MobRecord): mob record.
+        keyset (list[str]): ordering fields.
+
+    Returns:
+        tuple[Any, ...]: values of the ordering fields.
+    """
+    return tuple(getattr(record, field) for field in keyset)
@@ -6,26 +6,40 @@ import uuid
 from structlog import get_logger
 
 from monster_spawner.api.v1.mobs import schemas
-from monster_spawner.domain import exceptions, repositories, transactions
+from monster_spawner.cache import Cache
+from monster_spawner.domain import readers, repositories, transactions
 from monster_spawner.domain.events.outgoing import (
     MonsterCreated,
     MonsterDeleted,
+    MonsterUpdated,
 )
-from monster_spawner.events.bus import EventBus
+from monster_spawner.domain.mob import paging
+from monster_spawner.domain.mob.catalogue import Catalogue
+from monster_spawner.logs import lazy
 
 logger = get_logger(__name__)
 
+TIMESTAMPS = frozenset(("created_at", "updated_at"))
+
 
 class MobService:
-    """Mob model service."""
+    """Mob model service.
+
+    Reads are served by the catalogue while it is loaded, and the
+    service writes go to it once committed.
+    """
 
     def __init__(
         self,
         transaction: transactions.Transaction,
         repository: repositories.Repository,
+        cache: Cache[schemas.MobOutSchema],
+        catalogue: Catalogue | None = None,
     ) -> None:
         self.transaction = transaction
         self.repository = repository
+        self.cache = cache
+        self.catalogue = catalogue if catalogue is not None else Catalogue()
 
     async def create(
         self,
@@ -33,35 +47,78 @@ class MobService:
     ) -> schemas.MobOutSchema:
         """Create a new mob.
 
+        The repository raises AlreadyExistsError when the name is taken.
+
         Args:
             data_object (MobCreateSchema): mob data.
 
-        Raises:
-            AlreadyExistsError: when mob already exists.
-
         Returns:
             MobOutSchema: mob output data.
         """
-        logger.info("Creating mob", data=data_object)
+        logger.debug("Creating mob", data=data_object)
         async with self.transaction:
-            mobs = await self.repository.collect(name=data_object.name)
-            mobs = list(mobs)
-            if mobs:
-                raise exceptions.AlreadyExistsError(
-                    id=mobs[0].id,
-                    entry_name="Mob",
-                )
-            mob = await self.repository.create(data_object)
+            mob = await self.repository.create_unique(data_object, "name")
+            self.transaction.add_event(
+                MonsterCreated(**mob.dict(exclude=TIMESTAMPS)),
+            )
             await self.transaction.commit()
-            await EventBus.publish(MonsterCreated(**mob.dict()))
-        logger.info("Created mob", mob=mob)
+        self.catalogue.put(mob)
+        logger.info("Created mob", pk=mob.id)
         return mob
 
+    async def create_many(
+        self,
+        data_objects: T.Sequence[schemas.MobCreateSchema],
+    ) -> list[schemas.MobBulkResultSchema]:
+        """Create many mobs at once, skipping the ones with taken names.
+
+        The new mobs are inserted with a single statement skipping the
+        taken names, the mobs holding them are only looked up when some
+        name was taken.
+
+        Args:
+            data_objects (Sequence[MobCreateSchema]): mobs data.
+
+        Returns:
+            list[MobBulkResultSchema]: result of every mob in input order.
+        """
+        logger.debug("Creating mobs", count=len(data_objects))
+        pending = _first_by_name(data_objects)
+        async with self.transaction:
+            mobs = await self.repository.create_many(list(pending.values()))
+            ids = {mob.name: mob.id for mob in mobs}
+            if len(ids) < len(pending):
+                existing = await self.repository.collect_in(
+                    "name",
+                    pending.keys() - ids.keys(),
+                )
+                ids.update({mob.name: mob.id for mob in existing})
+                pending = {mob.name: pending[mob.name] for mob in mobs}
+            for mob in mobs:
+                self.transaction.add_event(
+                    MonsterCreated(**mob.dict(exclude=TIMESTAMPS)),
+                )
+            await self.transaction.commit()
+        self.catalogue.put(*mobs)
+        logger.info("Created mobs", count=len(mobs))
+        return [
+            schemas.MobBulkResultSchema(
+                status=_bulk_status(data_object, pending, ids),
+                id=ids.get(data_object.name),
+                name=data_object.name,
+            )
+            for data_object in data_objects
+        ]
+
     async def get(
         self,
         pk: uuid.UUID,
     ) -> schemas.MobOutSchema:
-        """Get a mob by its primary key.
+        """Get a mob by its primary key, reading through the cache.
+
+        A mob missing from the catalogue may have been created by another
+        worker whose event is not applied yet, so it is looked up in the
+        cache and the database.
 
         Args:
             pk (UUID): mob primary key.
@@ -69,16 +126,22 @@ class MobService:
         Returns:
             MobOutSchema: mob output data.
         """
-        logger.info("Getting mob", pk=pk)
-        mob = await self.repository.get_by_id(pk)
-        logger.info("Got mob", mob=mob)
+        logger.debug("Getting mob", pk=pk)
+        mob = self.catalogue.get(pk)
+        if mob is None:
+            mob = await self.cache.get(str(pk))
+        if mob is None:
+            generation = self.cache.generation
+            mob = await self.repository.get_by_id(pk)
+            await self.cache.set(str(pk), mob, generation)
+        logger.info("Got mob", pk=pk, sampled=True)
         return mob
 
     async def get_all(
         self,
         **filters,
     ) -> T.Iterable[schemas.MobOutSchema]:
-        """Get all mobs.
+        """Get all mobs, from the catalogue when it is loaded.
 
         Args:
             filters (dict): filters to apply.
@@ -86,22 +149,138 @@ class MobService:
         Returns:
             Iterable[MobOutSchema]: all mobs output data.
         """
-        logger.info("Getting all mobs")
-        mobs = await self.repository.collect(**filters)
-        logger.info("Got all the mobs")
+        logger.debug("Getting all mobs")
+        mobs: T.Iterable[schemas.MobOutSchema] | None
+        mobs = self.catalogue.collect(**filters)
+        if mobs is None:
+            mobs = await self.repository.collect(**filters)
+        logger.info("Got all the mobs", sampled=True)
         return mobs
 
+    async def get_page(
+        self,
+        request: readers.PageRequest,
+        **filters,
+    ) -> readers.Page[schemas.MobOutSchema]:
+        """Get a page of mobs, from the catalogue when it is loaded.
+
+        Args:
+            request (PageRequest): size, cursor and order of the page.
+            filters (dict): filters to apply.
+
+        Returns:
+            Page[MobOutSchema]: mobs output data and the next cursor.
+        """
+        logger.debug(
+            "Getting page of mobs",
+            cursor=request.cursor,
+            ordering=request.ordering,
+        )
+        page = paging.page(self.catalogue, request, **filters)
+        if page is None:
+            page = await self.repository.pager.page(request, **filters)
+        logger.info(
+            "Got page of mobs",
+            next_cursor=page.next_cursor,
+            sampled=True,
+        )
+        return page
+
+    async def get_page_values(
+        self,
+        request: readers.PageRequest,
+        **filters,
+    ) -> readers.Page[dict[str, T.Any]]:
+        """Get a page of mobs as plain field values, ready to encode.
+
+        The page is cut from the catalogue when it is loaded, with the
+        same cursors as the database pages.
+
+        Args:
+            request (PageRequest): size, cursor, order and fields.
+            filters (dict): filters to apply.
+
+        Returns:
+            Page[dict[str, Any]]: mobs field values and the next cursor.
+        """
+        logger.debug(
+            "Getting page of mobs",
+            cursor=request.cursor,
+            ordering=request.ordering,
+        )
+        page = paging.page_values(self.catalogue, request, **filters)
+        if page is None:
+            page = await self.repository.pager.page_values(request, **filters)
+        logger.info(
+            "Got page of mobs",
+            next_cursor=page.next_cursor,
+            sampled=True,
+        )
+        return page
+
+    def get_catalogue_page_values(
+        self,
+        request: readers.PageRequest,
+        **filters,
+    ) -> readers.Page[dict[str, T.Any]] | None:
+        """Get a page of mobs as plain field values from the catalogue.
+
+        The catalogue follows the events, so it may be behind the
+        version of the database and cannot vouch for it.
+
+        Args:
+            request (PageRequest): size, cursor, order and fields.
+            filters (dict): filters to apply.
+
+        Returns:
+            Page[dict[str, Any]] | None: mobs field values and the next
+                cursor, None when the page is left to the database.
+        """
+        return paging.page_values(self.catalogue, request, **filters)
+
+    async def get_version(self) -> int:
+        """Get the version of the whole mob collection.
+
+        Returns:
+            int: version changing with every write to any mob.
+        """
+        return await self.repository.scanner.version()
+
+    async def export(
+        self,
+        chunk_size: int,
+        **filters,
+    ) -> T.AsyncIterator[T.Sequence[schemas.MobOutSchema]]:
+        """Iterate over all mobs in chunks.
+
+        Args:
+            chunk_size (int): maximum number of mobs in a chunk.
+            filters (dict): filters to apply.
+
+        Yields:
+            Sequence[MobOutSchema]: chunk of mobs output data.
+        """
+        logger.debug("Exporting mobs")
+        exported = 0
+        chunks = self.repository.scanner.stream(chunk_size, **filters)
+        async for chunk in chunks:
+            exported += len(chunk)
+            yield chunk
+        logger.info("Exported mobs", count=exported)
+
     async def delete(self, pk: uuid.UUID) -> None:
         """Delete a mob by its primary key.
 
         Args:
             pk (UUID): mob primary key.
         """
-        logger.info("Deleting mob", pk=pk)
+        logger.debug("Deleting mob", pk=pk)
         async with self.transaction:
             await self.repository.delete(pk)
+            self.transaction.add_event(MonsterDeleted(id=pk))
             await self.transaction.commit()
-            await EventBus.publish(MonsterDeleted(id=pk))
+        await self.cache.delete(str(pk))
+        self.catalogue.remove(pk)
         logger.info("Deleted mob", pk=pk)
 
     async def update(
@@ -111,26 +290,73 @@ class MobService:
     ) -> schemas.MobOutSchema:
         """Update an existing mob.
 
+        The repository raises AlreadyExistsError when the name is taken.
+        The event carries the changed fields only, none is sent when
+        nothing changed.
+
         Args:
             pk (UUID): mob primary key.
             data_object (MobCreateSchema): mob data.
 
-        Raises:
-            AlreadyExistsError: when mob already exists.
-
         Returns:
             MobOutSchema: mob output data.
         """
-        logger.info("Updating mob", pk=pk, data=data_object)
+        logger.debug(
+            "Updating mob",
+            pk=pk,
+            data=lazy(data_object.dict, exclude_unset=True),
+        )
         async with self.transaction:
-            mobs = await self.repository.collect(name=data_object.name)
-            mobs = list(mobs)
-            if mobs and str(mobs[0].id) != str(pk):
-                raise exceptions.AlreadyExistsError(
-                    id=mobs[0].id,
-                    entry_name="Mob",
-                )
-            mob = await self.repository.update(pk, data_object)
+            previous, mob = await self.repository.update(pk, data_object)
+            event = MonsterUpdated.between(
+                pk,
+                previous.dict(exclude=TIMESTAMPS),
+                mob.dict(exclude=TIMESTAMPS),
+            )
+            if event.changes:
+                self.transaction.add_event(event)
             await self.transaction.commit()
+        await self.cache.delete(str(pk))
+        self.catalogue.put(mob)
         logger.info("Updated mob", pk=pk)
         return mob
+
+
+def _first_by_name(
+    data_objects: T.Sequence[schemas.MobCreateSchema],
+) -> dict[str, schemas.MobCreateSchema]:
+    """Pick the first data object of every name.
+
+    Args:
+        data_objects (Sequence[MobCreateSchema]): mobs data.
+
+    Returns:
+        dict[str, MobCreateSchema]: mobs data to create by name.
+    """
+    pending: dict[str, schemas.MobCreateSchema] = {}
+    for data_object in data_objects:
+        pending.setdefault(data_object.name, data_object)
+    return pending
+
+
+def _bulk_status(
+    data_object: schemas.MobCreateSchema,
+    pending: dict[str, schemas.MobCreateSchema],
+    ids: dict[str, uuid.UUID],
+) -> schemas.BulkStatus:
+    """Tell whether the data object was the one created for its name.
+
+    Args:
+        data_object (MobCreateSchema): mob data.
+        pending (dict[str, MobCreateSchema]): created mobs data by name.
+        ids (dict[str, UUID]): ids of the created and conflicting mobs.
+
+    Returns:
+        BulkStatus: created, conflict or skipped when the conflicting
+            mob was deleted before it was looked up.
+    """
+    if pending.get(data_object.name) is data_object:
+        return schemas.BulkStatus.CREATED
+    if data_object.name in ids:
+        return schemas.BulkStatus.CONFLICT
+    return schemas.BulkStatus.SKIPPED
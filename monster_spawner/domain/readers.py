@@ -0,0 +1,78 @@
+"""Storage abstractions for reads spanning many entries."""
+
+import typing as T  # noqa: WPS111,N812
+from dataclasses import dataclass
+
+from monster_spawner.api import schemas
+
+OutSchema = T.TypeVar("OutSchema", bound=schemas.Schema, covariant=True)
+PageItem = T.TypeVar("PageItem", covariant=True)
+
+
+@dataclass(frozen=True)
+class Page(T.Generic[PageItem]):
+    """Slice of entries with the cursor pointing to the next one."""
+
+    items: list[PageItem]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Size, position, order and fields of a requested page."""
+
+    limit: int
+    cursor: str | None = None
+    ordering: str = "id"
+    fields: T.Sequence[str] | None = None
+
+
+class Pager(T.Generic[OutSchema], T.Protocol):
+    """Keyset pagination interface."""
+
+    async def page(
+        self,
+        request: PageRequest,
+        **filters,
+    ) -> Page[OutSchema]:
+        """Collect a limited number of entries after the cursor.
+
+        Args:
+            request (PageRequest): size, cursor and order of the page.
+            filters (dict): additional filters to apply.
+        """
+        ...  # noqa: WPS428
+
+    async def page_values(
+        self,
+        request: PageRequest,
+        **filters,
+    ) -> Page[dict[str, T.Any]]:
+        """Collect a limited number of entries as plain field values.
+
+        Args:
+            request (PageRequest): size, cursor, order and fields.
+            filters (dict): additional filters to apply.
+        """
+        ...  # noqa: WPS428
+
+
+class Scanner(T.Generic[OutSchema], T.Protocol):
+    """Interface of the reads over the whole storage."""
+
+    def stream(
+        self,
+        chunk_size: int,
+        **filters,
+    ) -> T.AsyncIterator[T.Sequence[OutSchema]]:
+        """Iterate over all entries in chunks.
+
+        Args:
+            chunk_size (int): maximum number of entries in a chunk.
+            filters (dict): additional filters to apply.
+        """
+        ...  # noqa: WPS428
+
+    async def version(self) -> int:
+        """Get the version of the whole storage."""
+        ...  # noqa: WPS428
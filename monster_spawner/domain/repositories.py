@@ -4,6 +4,7 @@ import typing as T  # noqa: WPS111,N812
 import uuid
 
 from monster_spawner.api import schemas
+from monster_spawner.domain import readers
 
 CreateSchema = T.TypeVar(
     "CreateSchema",
@@ -22,11 +23,22 @@ class Repository(
     T.Generic[CreateSchema, UpdateSchema, OutSchema],
     T.Protocol,
 ):
-    """Storage interface."""
+    """Storage interface.
+
+    Reads spanning many entries are left to the pager and the scanner.
+    """
 
     def __init__(self, *args, **kwargs) -> None:
         """Allow taking parameters."""  # noqa: DAR101
 
+    @property
+    def pager(self) -> readers.Pager[OutSchema]:
+        """Pagination of the entries."""
+
+    @property
+    def scanner(self) -> readers.Scanner[OutSchema]:
+        """Reads over all the entries."""
+
     async def create(self, data_object: CreateSchema) -> OutSchema:
         """Create a new entry.
 
@@ -35,6 +47,30 @@ class Repository(
         """
         ...  # noqa: WPS428
 
+    async def create_unique(
+        self,
+        data_object: CreateSchema,
+        field: str,
+    ) -> OutSchema:
+        """Create a new entry unless the unique field value is taken.
+
+        Args:
+            data_object (CreateSchema): input data object.
+            field (str): name of the unique field.
+        """
+        ...  # noqa: WPS428
+
+    async def create_many(
+        self,
+        data_objects: T.Sequence[CreateSchema],
+    ) -> T.Sequence[OutSchema]:
+        """Create new entries at once, skipping the conflicting ones.
+
+        Args:
+            data_objects (Sequence[CreateSchema]): input data objects.
+        """
+        ...  # noqa: WPS428
+
     async def get_by_id(self, entry_id: uuid.UUID) -> OutSchema:
         """Get an entry by its identifier.
 
@@ -54,6 +90,19 @@ class Repository(
         """
         ...  # noqa: WPS428
 
+    async def collect_in(
+        self,
+        field: str,
+        choices: T.Iterable[T.Any],
+    ) -> T.Iterable[OutSchema]:
+        """Collect entries with the field equal to any of the choices.
+
+        Args:
+            field (str): field name.
+            choices (Iterable[Any]): accepted values.
+        """
+        ...  # noqa: WPS428
+
     async def delete(self, entry_id: uuid.UUID) -> None:
         """Delete an entry.
 
@@ -66,8 +115,8 @@ class Repository(
         self,
         entry_id: uuid.UUID,
         data_object: UpdateSchema,
-    ) -> OutSchema:
-        """Update an existing entry.
+    ) -> tuple[OutSchema, OutSchema]:
+        """Update an existing entry, returning it before and after.
 
         Args:
             entry_id (UUID): entry ID.
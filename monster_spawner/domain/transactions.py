@@ -1,6 +1,10 @@
 """Transaction abstractions."""
 
 import abc
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from monster_spawner.domain.events.event_types import Event
 
 
 class Transaction(abc.ABC):
@@ -21,6 +25,14 @@ class Transaction(abc.ABC):
         """Exit and rollback the transaction."""  # noqa: DAR101
         await self.rollback()
 
+    @abc.abstractmethod
+    def add_event(self, event: "Event") -> None:
+        """Register an event to be published with the commit.
+
+        Args:
+            event (Event): event object.
+        """
+
     @abc.abstractmethod
     async def commit(self) -> None:
         """Commit the transaction."""
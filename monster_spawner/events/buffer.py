@@ -0,0 +1,82 @@
+"""Buffered event publishing."""
+
+import asyncio
+from typing import Iterable
+
+import redis
+from structlog import get_logger
+
+from monster_spawner.events.bus import EventBus
+from monster_spawner.events.publisher import publish_messages
+from monster_spawner.settings import settings
+
+logger = get_logger(__name__)
+
+
+class EventBuffer:
+    """Buffer of serialized events published in redis pipelines.
+
+    The buffer is flushed when it reaches EVENTS_BUFFER_SIZE messages
+    and every EVENTS_BUFFER_INTERVAL seconds. Flushes run one at a time
+    and take the messages in the order they were added, so the events
+    of every channel are published in order. With EVENTS_COALESCE the
+    events of an entity buffered together are merged.
+    """
+
+    def __init__(self) -> None:
+        self.max_size = settings.EVENTS_BUFFER_SIZE
+        self.flush_interval = settings.EVENTS_BUFFER_INTERVAL
+        self.messages: list[tuple[str, str]] = []
+        self.lock = asyncio.Lock()
+        self.task: asyncio.Task | None = None
+
+    async def add(self, messages: Iterable[tuple[str, str]]) -> None:
+        """Buffer messages, flushing when the buffer is full.
+
+        Args:
+            messages (Iterable[tuple[str, str]]): channel and payload pairs.
+        """
+        self.messages.extend(messages)
+        if len(self.messages) >= self.max_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Publish all buffered messages in one pipeline.
+
+        Like the unbuffered publisher, a batch which cannot reach redis
+        is logged and dropped.
+        """
+        async with self.lock:
+            if not self.messages:
+                return
+            messages = self.messages
+            self.messages = []
+            messages = EventBus.coalesce(messages)
+            try:
+                await publish_messages(messages)
+            except redis.exceptions.ConnectionError as exc:
+                logger.error(
+                    "Could not connect to redis",
+                    exc=exc,
+                    dropped=len(messages),
+                )
+
+    async def run(self) -> None:
+        """Keep flushing the buffer until cancelled."""
+        while True:  # noqa: WPS457
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """Run the periodic flush in the background."""
+        logger.info("Starting event buffer")
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel the periodic flush and publish what is left."""
+        logger.info("Stopping event buffer")
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        await self.flush()
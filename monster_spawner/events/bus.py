@@ -1,44 +1,180 @@
 """Event bus."""
 
+import typing as T  # noqa: WPS111,N812
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterable
 
+import redis
+from pydantic import parse_raw_as
 from structlog import get_logger
 
-from monster_spawner.events.publisher import publish_with_redis
+from monster_spawner.events.publisher import (
+    publish_messages,
+    publish_with_async_redis,
+    publish_with_redis,
+    serialize_event,
+)
+from monster_spawner.settings import settings
 
 if TYPE_CHECKING:
     from monster_spawner.domain.events.event_types import Event
+    from monster_spawner.events.buffer import EventBuffer
     from monster_spawner.events.event_types import EventType
 
 logger = get_logger(__name__)
 
 
 class EventBus:
-    """Dispatcher and publisher for event objects."""
+    """Dispatcher and publisher for event objects.
+
+    With a buffer set, events are handed over to it instead of being
+    published right away.
+    """
 
     events: dict[str, type["Event"]] = {}
+    buffer: T.Optional["EventBuffer"] = None
 
     @classmethod
-    async def publish(cls, event: "Event") -> None:
-        """Publish an event to redis.
+    def coalesce(
+        cls,
+        messages: Iterable[tuple[str, str]],
+    ) -> list[tuple[str, str]]:
+        """Merge the messages of events published close together.
+
+        Messages are kept as they are unless EVENTS_COALESCE is enabled.
+
+        Args:
+            messages (Iterable[tuple[str, str]]): channel and payload pairs.
+
+        Returns:
+            list[tuple[str, str]]: messages left, in the original order.
+        """
+        if not settings.EVENTS_COALESCE:
+            return list(messages)
+        coalescer = Coalescer(cls.events)
+        for channel, payload in messages:
+            coalescer.add(channel, payload)
+        if coalescer.merged:
+            logger.debug("Coalesced events", merged=coalescer.merged)
+        return coalescer.messages
+
+    @classmethod
+    async def prepare(cls, event: "Event") -> bool:
+        """Check that the event is registered and handle it.
 
         Args:
             event (Event): event object.
+
+        Returns:
+            bool: whether the event should be sent out.
         """
-        logger.info(
-            "Publishing event",
-            event_object=event,
-        )
+        logger.debug("Publishing event", event_object=event)
         if not cls.events.get(event.event_type.value):
             logger.warning(
                 "No event registered to publish",
-                event_object=event,
-                events=cls.events,
+                event_type=event.event_type.value,
             )
-            return
+            return False
         await event.handle()
-        publish_with_redis(event)
+        return True
+
+    @classmethod
+    async def publish(cls, event: "Event") -> None:
+        """Publish an event to redis.
+
+        Args:
+            event (Event): event object.
+        """
+        if not await cls.prepare(event):
+            return
+        if cls.buffer:
+            await cls.buffer.add(
+                [(event.event_type.value, serialize_event(event))],
+            )
+        elif settings.REDIS_ASYNC_PUBLISHER:
+            await publish_with_async_redis(event)
+        else:
+            publish_with_redis(event)
+
+    @classmethod
+    async def publish_many(cls, events: Iterable["Event"]) -> None:
+        """Publish events to redis in a single pipeline or buffer them.
+
+        Args:
+            events (Iterable[Event]): event objects.
+        """
+        prepared = [event for event in events if await cls.prepare(event)]
+        if not cls.buffer and not settings.REDIS_ASYNC_PUBLISHER:
+            for sync_event in prepared:
+                publish_with_redis(sync_event)
+            return
+        messages = [
+            (event.event_type.value, serialize_event(event))
+            for event in prepared
+        ]
+        if cls.buffer:
+            await cls.buffer.add(messages)
+            return
+        try:
+            await publish_messages(messages)
+        except redis.exceptions.ConnectionError as exc:
+            logger.error("Could not connect to redis", exc=exc)
+
+
+class Coalescer:
+    """Merger of the messages of events with a coalesce field.
+
+    An event is merged into the first message of the same channel and
+    entity. Any other message closes the open merges, so events never
+    move across it: a deletion still comes after the updates before it.
+    """
+
+    def __init__(self, events: dict[str, type["Event"]]) -> None:
+        self.events = events
+        self.messages: list[tuple[str, str]] = []
+        self.open: dict[tuple[str, T.Any], tuple[int, "Event"]] = {}
+        self.merged = 0
+
+    def decode(self, channel: str, payload: str) -> T.Optional["Event"]:
+        """Decode the message of an event which can be merged.
+
+        Args:
+            channel (str): channel name.
+            payload (str): serialized event.
+
+        Returns:
+            Event | None: event object, None when it is never merged.
+        """
+        event_class = self.events.get(channel)
+        if event_class is None or event_class.coalesce_by is None:
+            return None
+        try:
+            return parse_raw_as(event_class, payload)
+        except ValueError:
+            return None
+
+    def add(self, channel: str, payload: str) -> None:
+        """Add a message, merging it when possible.
+
+        Args:
+            channel (str): channel name.
+            payload (str): serialized event.
+        """
+        event = self.decode(channel, payload)
+        if event is None:
+            self.open.clear()
+            self.messages.append((channel, payload))
+            return
+        key = (channel, getattr(event, str(event.coalesce_by)))
+        if key not in self.open:
+            self.open[key] = (len(self.messages), event)
+            self.messages.append((channel, payload))
+            return
+        position, first = self.open[key]
+        merged = first.merge(event)
+        self.open[key] = (position, merged)
+        self.messages[position] = (channel, serialize_event(merged))
+        self.merged += 1
 
 
 def eventclass(event_type: "EventType") -> Callable:
@@ -52,7 +188,7 @@ def eventclass(event_type: "EventType") -> Callable:
     Returns:
         Callable: a decorator.
     """
-    logger.info("Registering event class", event_type=event_type)
+    logger.debug("Registering event class", event_type=event_type)
 
     def wrapper(cls) -> type:
         """Register the event class and create the dataclass.
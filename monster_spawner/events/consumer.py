@@ -0,0 +1,305 @@
+"""Incoming event consumer."""
+
+import asyncio
+import typing as T  # noqa: WPS111,N812
+from typing import TYPE_CHECKING
+
+import redis
+from pydantic import parse_raw_as
+from structlog import get_logger
+
+from monster_spawner.domain import exceptions
+from monster_spawner.events import groups, streams
+from monster_spawner.events.bus import EventBus
+from monster_spawner.events.publisher import connections
+from monster_spawner.settings import settings
+
+if TYPE_CHECKING:
+    from monster_spawner.domain.events.event_types import Event
+
+logger = get_logger(__name__)
+
+# Handled by the domain, retrying would be rejected the same way.
+REJECTIONS = (exceptions.AlreadyExistsError, exceptions.DoesNotExistError)
+
+
+class HandlerPool:
+    """Background tasks handling messages, at most ``size`` at a time.
+
+    Spawning waits for a free slot, so slow handlers hold back the
+    reader instead of piling up tasks.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.slots = asyncio.Semaphore(size)
+        self.running: set[asyncio.Task] = set()
+
+    async def spawn(self, coroutine: T.Coroutine[T.Any, T.Any, None]) -> None:
+        """Wait for a free slot and run the coroutine in the background.
+
+        Args:
+            coroutine (Coroutine): handling of a message.
+        """
+        await self.slots.acquire()
+        task = asyncio.create_task(coroutine)
+        self.running.add(task)
+        task.add_done_callback(self.finish)
+
+    def finish(self, task: asyncio.Task) -> None:
+        """Free the slot of a finished task.
+
+        Args:
+            task (Task): finished handling task.
+        """
+        self.running.discard(task)
+        self.slots.release()
+
+    async def drain(self) -> None:
+        """Wait for the running tasks."""
+        await asyncio.gather(*self.running, return_exceptions=True)
+
+
+class EventConsumer:
+    """Background worker handling the events received on channels.
+
+    Messages are decoded into the event classes registered for their
+    channel and handled concurrently, at most CONSUMER_CONCURRENCY at a
+    time. Reading waits for a free slot, so slow handlers hold back the
+    transport instead of piling up tasks.
+
+    With EVENTS_STREAMS the channel streams are read as a consumer
+    group: messages are acknowledged once handled, the ones left
+    pending by a crash are replayed on the next start and the ones left
+    pending by a failed handler are claimed again. Otherwise the
+    channels are subscribed to and messages sent while the consumer is
+    down are lost.
+    """
+
+    def __init__(self, channels: T.Iterable[str]) -> None:
+        self.channels = list(channels)
+        self.group = settings.CONSUMER_GROUP
+        self.name = settings.CONSUMER_NAME
+        self.handlers = HandlerPool(settings.CONSUMER_CONCURRENCY)
+        self.task: asyncio.Task | None = None
+
+    def decode(self, channel: str, payload: str) -> T.Optional["Event"]:
+        """Decode a message into the event registered for the channel.
+
+        Args:
+            channel (str): channel name.
+            payload (str): serialized event.
+
+        Returns:
+            Event | None: event object, None when it cannot be decoded.
+        """
+        event_class = EventBus.events.get(channel)
+        if event_class is None:
+            logger.warning("No event registered to consume", channel=channel)
+            return None
+        try:
+            return parse_raw_as(event_class, payload)
+        except ValueError as exc:
+            logger.error("Could not decode event", channel=channel, exc=exc)
+            return None
+
+    async def handle(self, message: streams.StreamMessage) -> bool:
+        """Decode and handle a message.
+
+        Args:
+            message (StreamMessage): received message.
+
+        Returns:
+            bool: whether the message is done with, False when handling
+                it failed and it is worth a retry.
+        """
+        event = self.decode(message.channel, message.payload)
+        if event is None:
+            return True
+        try:
+            await event.handle()
+        except REJECTIONS as exc:
+            logger.warning("Event rejected", channel=message.channel, exc=exc)
+        except Exception as exc:
+            logger.error(
+                "Could not handle event",
+                channel=message.channel,
+                exc=exc,
+            )
+            return False
+        return True
+
+    async def process(self, message: streams.StreamMessage) -> None:
+        """Handle a message and acknowledge it when done with.
+
+        Args:
+            message (StreamMessage): received message.
+        """
+        if not await self.handle(message) or not message.message_id:
+            return
+        try:
+            await groups.acknowledge(self.group, [message])
+        except redis.exceptions.RedisError as exc:
+            logger.error("Could not acknowledge event", exc=exc)
+
+    async def dispatch(self, message: streams.StreamMessage) -> None:
+        """Wait for a free slot and handle the message in the background.
+
+        Args:
+            message (StreamMessage): received message.
+        """
+        await self.handlers.spawn(self.process(message))
+
+    async def catch_up(self) -> None:
+        """Catch up with what was sent before reading started.
+
+        Called once reading is set up, on every (re)connection. Nothing
+        to do here: pending stream messages are replayed and messages
+        sent to channels while nobody listened are lost.
+        """
+
+    async def consume_streams(self) -> None:
+        """Replay the pending messages, then read new ones as they come.
+
+        Every CONSUMER_CLAIM_INTERVAL seconds the messages pending for
+        over CONSUMER_CLAIM_IDLE milliseconds are claimed and handled
+        again, so failed messages are retried while the consumer runs.
+        """
+        await groups.create_group(self.group, self.channels, start="0")
+        await self.catch_up()
+        messages = await groups.read_group(
+            self.group,
+            self.name,
+            self.channels,
+            settings.CONSUMER_BATCH_SIZE,
+            pending=True,
+        )
+        loop = asyncio.get_running_loop()
+        claimed_at = loop.time()
+        while True:  # noqa: WPS457
+            for message in messages:
+                await self.dispatch(message)
+            claiming = (
+                loop.time() - claimed_at >= settings.CONSUMER_CLAIM_INTERVAL
+            )
+            if claiming:
+                claimed_at = loop.time()
+            messages = await self.read_batch(claim=claiming)
+
+    async def read_batch(self, claim: bool) -> list[streams.StreamMessage]:
+        """Wait for new messages, claiming the idle pending ones first.
+
+        Args:
+            claim (bool): whether to claim the idle pending messages.
+
+        Returns:
+            list[StreamMessage]: claimed and new messages.
+        """
+        claimed = []
+        if claim:
+            claimed = await groups.claim(
+                self.group,
+                self.name,
+                self.channels,
+                settings.CONSUMER_CLAIM_IDLE,
+                settings.CONSUMER_BATCH_SIZE,
+            )
+        return claimed + await groups.read_group(
+            self.group,
+            self.name,
+            self.channels,
+            settings.CONSUMER_BATCH_SIZE,
+            block=settings.CONSUMER_BLOCK,
+        )
+
+    async def consume_channels(self) -> None:
+        """Subscribe to the channels and handle every published message."""
+        async with connections.async_client.pubsub() as pubsub:
+            await pubsub.subscribe(*self.channels)
+            await self.catch_up()
+            while True:  # noqa: WPS457
+                received = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=settings.CONSUMER_BLOCK / 1000,  # noqa: WPS432
+                )
+                if received:
+                    await self.dispatch(
+                        streams.StreamMessage(
+                            channel=received["channel"].decode(),
+                            message_id="",
+                            payload=received["data"].decode(),
+                        ),
+                    )
+
+    async def run(self) -> None:
+        """Keep consuming until cancelled, reconnecting after errors."""
+        while True:  # noqa: WPS457
+            try:
+                if settings.EVENTS_STREAMS:
+                    await self.consume_streams()
+                else:
+                    await self.consume_channels()
+            except redis.exceptions.RedisError as exc:
+                logger.error("Could not consume events", exc=exc)
+                await asyncio.sleep(settings.CONSUMER_RETRY_DELAY)
+
+    def start(self) -> None:
+        """Run the consumer in the background."""
+        logger.info("Starting event consumer", channels=self.channels)
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop reading and wait for the messages being handled."""
+        logger.info("Stopping event consumer")
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        await self.handlers.drain()
+
+
+class EventFeed(EventConsumer):
+    """Background worker applying every event of the channels in order.
+
+    Every worker process reads all the events: the channels are
+    subscribed to, or with EVENTS_STREAMS the streams are read without
+    a consumer group, from the events sent after the catch up.
+    """
+
+    async def apply(self, event: "Event") -> None:
+        """Apply a decoded event, nothing to do here.
+
+        Args:
+            event (Event): decoded event.
+        """
+
+    async def process(self, message: streams.StreamMessage) -> None:
+        """Decode an event and apply it.
+
+        Args:
+            message (StreamMessage): received message.
+        """
+        event = self.decode(message.channel, message.payload)
+        if event is not None:
+            await self.apply(event)
+
+    async def dispatch(self, message: streams.StreamMessage) -> None:
+        """Apply the events one at a time, in the order they were sent.
+
+        Args:
+            message (StreamMessage): received message.
+        """
+        await self.process(message)
+
+    async def consume_streams(self) -> None:
+        """Catch up, then read the events sent after it."""
+        offsets = await streams.get_last_ids(self.channels)
+        await self.catch_up()
+        while True:  # noqa: WPS457
+            messages = await streams.read_streams(
+                offsets,
+                settings.CONSUMER_BATCH_SIZE,
+                block=settings.CONSUMER_BLOCK,
+            )
+            for message in messages:
+                offsets[message.channel] = message.message_id
+                await self.dispatch(message)
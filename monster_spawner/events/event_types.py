@@ -10,9 +10,13 @@ class EventType(str, enum.Enum):  # noqa: WPS600
 class IncomingEventType(EventType):
     """Incoming event types."""
 
+    CREATE_MONSTER = "create-monster"
+    DELETE_MONSTER = "delete-monster"
+
 
 class OutgoingEventType(EventType):
     """Incoming event types."""
 
     MONSTER_CREATED = "monster-created"
     MONSTER_DELETED = "monster-deleted"
+    MONSTER_UPDATED = "monster-updated"
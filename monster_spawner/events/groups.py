@@ -0,0 +1,177 @@
+"""Consumer group helpers for the redis streams transport.
+
+A consumer group keeps the position of its consumers in the channel
+streams, so a consumer which was down resumes from the last
+acknowledged message instead of a full resync.
+"""
+
+import typing as T  # noqa: WPS111,N812
+
+from redis.exceptions import ResponseError
+
+from monster_spawner.events.publisher import connections, stream_key
+from monster_spawner.events.streams import StreamMessage, create_message
+
+NEW_MESSAGES = ">"
+PENDING_MESSAGES = "0"
+
+
+async def create_group(
+    group: str,
+    channels: T.Iterable[str],
+    start: str = "$",
+) -> None:
+    """Create a consumer group on the streams of the channels.
+
+    Missing streams are created and existing groups are kept as they
+    are, so the call is safe on every consumer start.
+
+    Args:
+        group (str): consumer group name.
+        channels (Iterable[str]): channel names.
+        start (str): id to start after, ``$`` for new messages only.
+
+    Raises:
+        ResponseError: when redis rejects the group for another reason.
+    """
+    for channel in channels:
+        try:
+            await connections.async_client.xgroup_create(
+                stream_key(channel),
+                group,
+                id=start,
+                mkstream=True,
+            )
+        except ResponseError as exc:
+            if not str(exc).startswith("BUSYGROUP"):
+                raise
+
+
+async def read_group(  # noqa: WPS211
+    group: str,
+    consumer: str,
+    channels: T.Iterable[str],
+    count: int,
+    block: int | None = None,
+    pending: bool = False,
+) -> list[StreamMessage]:
+    """Read the messages delivered to a consumer of the group.
+
+    Read messages stay pending until acknowledged. A restarted consumer
+    reads its pending messages first to replay what it did not finish.
+    Pending messages already trimmed from the stream are acknowledged
+    and skipped.
+
+    Args:
+        group (str): consumer group name.
+        consumer (str): consumer name, unique within the group.
+        channels (Iterable[str]): channel names.
+        count (int): maximum number of messages per stream.
+        block (int | None): milliseconds to wait for new messages.
+        pending (bool): whether to read pending messages instead of new.
+
+    Returns:
+        list[StreamMessage]: messages in stream order for every channel.
+    """
+    start = PENDING_MESSAGES if pending else NEW_MESSAGES
+    response = await connections.async_client.xreadgroup(
+        group,
+        consumer,
+        {stream_key(channel): start for channel in channels},
+        count=count,
+        block=block,
+    )
+    messages = []
+    for key, entries in response or []:
+        messages.extend(await _collect_entries(group, key, entries))
+    return messages
+
+
+async def claim(
+    group: str,
+    consumer: str,
+    channels: T.Iterable[str],
+    min_idle: int,
+    count: int,
+) -> list[StreamMessage]:
+    """Take over the messages left pending by any consumer of the group.
+
+    Messages whose handling failed, or whose consumer died, stay pending
+    until they are claimed for another delivery. Claimed messages are
+    idle again, so they are not claimed twice in a row.
+
+    Args:
+        group (str): consumer group name.
+        consumer (str): consumer name, unique within the group.
+        channels (Iterable[str]): channel names.
+        min_idle (int): milliseconds a message has to be pending for.
+        count (int): maximum number of messages per stream.
+
+    Returns:
+        list[StreamMessage]: claimed messages for every channel.
+    """
+    messages = []
+    for channel in channels:
+        key = stream_key(channel)
+        entries = await connections.async_client.xautoclaim(
+            key,
+            group,
+            consumer,
+            min_idle,
+            count=count,
+        )
+        messages.extend(await _collect_entries(group, key.encode(), entries))
+    return messages
+
+
+async def acknowledge(group: str, messages: T.Iterable[StreamMessage]) -> int:
+    """Mark messages as processed by the group.
+
+    Args:
+        group (str): consumer group name.
+        messages (Iterable[StreamMessage]): processed messages.
+
+    Returns:
+        int: number of messages which were pending.
+    """
+    ids: dict[str, list[str]] = {}
+    for message in messages:
+        ids.setdefault(message.channel, []).append(message.message_id)
+    return sum(
+        [
+            await connections.async_client.xack(
+                stream_key(channel),
+                group,
+                *message_ids,
+            )
+            for channel, message_ids in ids.items()
+        ],
+    )
+
+
+async def _collect_entries(
+    group: str,
+    key: bytes,
+    entries: list[tuple[bytes, dict[bytes, bytes] | None]],
+) -> list[StreamMessage]:
+    """Convert the entries read from a stream to messages.
+
+    Trimmed messages come without fields.
+
+    Args:
+        group (str): consumer group name.
+        key (bytes): stream key.
+        entries (list[tuple[bytes, dict[bytes, bytes] | None]]): entries.
+
+    Returns:
+        list[StreamMessage]: messages which are still in the stream.
+    """
+    channel = key.decode().removeprefix(stream_key(""))
+    trimmed = [message_id for message_id, fields in entries if not fields]
+    if trimmed:
+        await connections.async_client.xack(key, group, *trimmed)
+    return [
+        create_message(channel, message_id, fields)
+        for message_id, fields in entries
+        if fields
+    ]
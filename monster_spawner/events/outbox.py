@@ -0,0 +1,154 @@
+"""Transactional outbox for events."""
+
+import asyncio
+from typing import TYPE_CHECKING, Callable, Iterable
+
+import redis
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from structlog import get_logger
+
+from monster_spawner.database import models
+from monster_spawner.events.bus import EventBus
+from monster_spawner.events.publisher import publish_messages, serialize_event
+from monster_spawner.settings import settings
+
+if TYPE_CHECKING:
+    from monster_spawner.domain.events.event_types import Event
+
+logger = get_logger(__name__)
+
+# Key of the advisory lock electing the relay publishing a batch.
+RELAY_LOCK_KEY = 730603412
+
+
+async def store_events(
+    session: AsyncSession,
+    events: Iterable["Event"],
+) -> None:
+    """Add events to the outbox within the session's transaction.
+
+    Args:
+        session (AsyncSession): database session.
+        events (Iterable[Event]): events to store.
+    """
+    for event in events:
+        if await EventBus.prepare(event):
+            session.add(
+                models.Outbox(
+                    channel=event.event_type.value,
+                    payload=serialize_event(event),
+                ),
+            )
+
+
+class OutboxRelay:
+    """Background worker draining the outbox to redis."""
+
+    def __init__(self, session_factory: Callable[..., AsyncSession]) -> None:
+        self.session_factory = session_factory
+        self.batch_size = settings.OUTBOX_BATCH_SIZE
+        self.poll_interval = settings.OUTBOX_POLL_INTERVAL
+        self.max_retries = settings.OUTBOX_MAX_RETRIES
+        self.retry_delay = settings.OUTBOX_RETRY_DELAY
+        self.task: asyncio.Task | None = None
+
+    async def publish(self, entries: list[models.Outbox]) -> None:
+        """Publish a batch in one pipeline, retrying with a backoff.
+
+        With EVENTS_COALESCE the events of an entity in the batch are
+        merged, so a burst committed between two polls is sent once.
+        The error of the last attempt is not caught.
+
+        Args:
+            entries (list[Outbox]): outbox entries.
+        """
+        messages = [(entry.channel, entry.payload) for entry in entries]
+        messages = EventBus.coalesce(messages)
+        for attempt in range(self.max_retries - 1):
+            try:
+                await publish_messages(messages)
+            except redis.exceptions.RedisError as exc:
+                logger.warning("Retrying outbox batch", exc=exc)
+                await asyncio.sleep(self.retry_delay * 2**attempt)
+            else:
+                return
+        await publish_messages(messages)
+
+    async def relay_batch(self, cursor: int) -> int | None:
+        """Publish and remove the next batch of entries after the cursor.
+
+        Every process runs a relay, but only the one holding the advisory
+        lock publishes a batch, so batches reach redis in outbox order.
+        The lock is released with the transaction.
+
+        Args:
+            cursor (int): position of the last relayed entry.
+
+        Returns:
+            int | None: new cursor, None when there was nothing to relay
+                or another relay holds the lock.
+        """
+        query = (
+            select(models.Outbox)
+            .where(models.Outbox.position > cursor)
+            .order_by(models.Outbox.position)
+            .limit(self.batch_size)
+        )
+        async with self.session_factory() as session:
+            elected = await session.execute(
+                select(func.pg_try_advisory_xact_lock(RELAY_LOCK_KEY)),
+            )
+            if not elected.scalar():
+                return None
+            entries = (await session.execute(query)).scalars().all()
+            if not entries:
+                return None
+            await self.publish(entries)
+            await session.execute(
+                delete(models.Outbox).where(
+                    models.Outbox.id.in_([entry.id for entry in entries]),
+                ),
+            )
+            await session.commit()
+        return entries[-1].position
+
+    async def drain(self) -> int:
+        """Relay batches until the outbox is empty.
+
+        Every drain walks the outbox from the beginning, so entries
+        committed out of order are never skipped.
+
+        Returns:
+            int: number of relayed batches.
+        """
+        batches = 0
+        cursor = await self.relay_batch(0)
+        while cursor is not None:
+            batches += 1
+            cursor = await self.relay_batch(cursor)
+        return batches
+
+    async def run(self) -> None:
+        """Keep draining the outbox until cancelled."""
+        while True:  # noqa: WPS457
+            try:
+                batches = await self.drain()
+            except Exception as exc:
+                logger.error("Could not relay the outbox", exc=exc)
+                batches = 0
+            if not batches:
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """Run the relay in the background."""
+        logger.info("Starting outbox relay")
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel the background relay."""
+        logger.info("Stopping outbox relay")
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
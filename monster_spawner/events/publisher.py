@@ -2,11 +2,14 @@
 
 import json
 from dataclasses import asdict
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Iterable
 
 import redis
 import structlog
+from redis import asyncio as aioredis
 
+from monster_spawner.metrics import collectors
 from monster_spawner.settings import settings
 
 if TYPE_CHECKING:
@@ -14,19 +17,155 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
-client = redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+
+class Connections:
+    """Redis clients of the application.
+
+    The clients are created on first use and dropped by ``disconnect``,
+    so the next use creates them again from the current settings.
+    """
+
+    @cached_property
+    def client(self) -> redis.Redis:
+        """Blocking client, kept for the sync publisher.
+
+        Returns:
+            redis.Redis: redis client.
+        """
+        return redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+
+    @cached_property
+    def async_pool(self) -> aioredis.BlockingConnectionPool:
+        """Bounded pool shared by the async clients.
+
+        Returns:
+            BlockingConnectionPool: connection pool.
+        """
+        return aioredis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+        )
+
+    @cached_property
+    def async_client(self) -> aioredis.Redis:
+        """Client of the event loop.
+
+        Returns:
+            aioredis.Redis: async redis client.
+        """
+        return aioredis.Redis(connection_pool=self.async_pool)
+
+    async def disconnect(self) -> None:
+        """Close the pooled connections and drop the clients."""
+        created = vars(self)  # noqa: WPS421
+        if "async_pool" in created:
+            await self.async_pool.disconnect()
+        if "client" in created:
+            self.client.connection_pool.disconnect()
+        created.clear()
+
+
+connections = Connections()
+
+STREAM_FIELD = "payload"
+
+
+def stream_key(channel: str) -> str:
+    """Get the key of the stream carrying a channel.
+
+    Args:
+        channel (str): channel name.
+
+    Returns:
+        str: redis key.
+    """
+    return f"stream:{channel}"
+
+
+def send_message(connection: Any, channel: str, payload: str) -> Any:
+    """Send a message with the configured transport.
+
+    Messages are published to the channel, or appended to its capped
+    stream with EVENTS_STREAMS enabled.
+
+    Args:
+        connection (Any): sync or async redis client, or pipeline.
+        channel (str): channel name.
+        payload (str): serialized event.
+
+    Returns:
+        Any: command result, awaitable for the async client.
+    """
+    if settings.EVENTS_STREAMS:
+        return connection.xadd(
+            stream_key(channel),
+            {STREAM_FIELD: payload},
+            maxlen=settings.EVENTS_STREAM_MAX_LENGTH,
+            approximate=True,
+        )
+    return connection.publish(channel, payload)
+
+
+def serialize_event(event: "Event") -> str:
+    """Serialize an event to the message format.
+
+    Args:
+        event (Event): event object.
+
+    Returns:
+        str: json encoded event.
+    """
+    return json.dumps(asdict(event), default=str)
 
 
 def publish_with_redis(event: "Event") -> None:
     """Publish an event to redis.
 
+    Blocks the calling thread, kept as a fallback for the async publisher.
+
     Args:
         event (Event): event object with type which is the channel name.
     """
     try:
-        client.publish(
-            event.event_type.value,
-            json.dumps(asdict(event), default=str),
-        )
+        with collectors.time_redis_publish():
+            send_message(
+                connections.client,
+                event.event_type.value,
+                serialize_event(event),
+            )
     except redis.exceptions.ConnectionError as exc:
         logger.error("Could not connect to redis", exc=exc)
+
+
+async def publish_with_async_redis(event: "Event") -> None:
+    """Publish an event to redis without blocking the event loop.
+
+    Args:
+        event (Event): event object with type which is the channel name.
+    """
+    try:
+        with collectors.time_redis_publish():
+            await send_message(
+                connections.async_client,
+                event.event_type.value,
+                serialize_event(event),
+            )
+    except redis.exceptions.ConnectionError as exc:
+        logger.error("Could not connect to redis", exc=exc)
+
+
+async def publish_messages(messages: Iterable[tuple[str, str]]) -> None:
+    """Publish already serialized messages in a single redis pipeline.
+
+    Errors are not swallowed, so the caller can retry the whole batch.
+
+    Args:
+        messages (Iterable[tuple[str, str]]): channel and payload pairs.
+    """
+    async with connections.async_client.pipeline(transaction=False) as pipeline:
+        for channel, payload in messages:
+            send_message(pipeline, channel, payload)
+        with collectors.time_redis_publish():
+            await pipeline.execute()
@@ -0,0 +1,120 @@
+"""Readers of the redis streams transport.
+
+Every channel is carried by a capped stream. Readers which need every
+message of a channel read it here, without a consumer group.
+"""
+
+import typing as T  # noqa: WPS111,N812
+from dataclasses import dataclass
+
+from monster_spawner.events.publisher import (
+    STREAM_FIELD,
+    connections,
+    stream_key,
+)
+
+
+@dataclass(frozen=True)
+class StreamMessage:
+    """Message read from a channel stream."""
+
+    channel: str
+    message_id: str
+    payload: str
+
+
+async def read_after(
+    channel: str,
+    message_id: str,
+    count: int,
+) -> list[StreamMessage]:
+    """Read the messages following an offset, without a consumer group.
+
+    Args:
+        channel (str): channel name.
+        message_id (str): id of the last seen message, ``0`` for all.
+        count (int): maximum number of messages.
+
+    Returns:
+        list[StreamMessage]: messages in stream order.
+    """
+    entries = await connections.async_client.xrange(
+        stream_key(channel),
+        min=f"({message_id}",
+        count=count,
+    )
+    return [
+        create_message(channel, entry_id, fields)
+        for entry_id, fields in entries
+    ]
+
+
+async def read_streams(
+    offsets: dict[str, str],
+    count: int,
+    block: int | None = None,
+) -> list[StreamMessage]:
+    """Read the messages following the offsets of every channel.
+
+    No consumer group is involved, so every reader gets every message
+    and nothing has to be acknowledged.
+
+    Args:
+        offsets (dict[str, str]): id of the last seen message by channel.
+        count (int): maximum number of messages per stream.
+        block (int | None): milliseconds to wait for new messages.
+
+    Returns:
+        list[StreamMessage]: messages in stream order for every channel.
+    """
+    response = await connections.async_client.xread(
+        {stream_key(channel): offset for channel, offset in offsets.items()},
+        count=count,
+        block=block,
+    )
+    return [
+        create_message(key.decode().removeprefix(stream_key("")), *entry)
+        for key, entries in response or []
+        for entry in entries
+    ]
+
+
+async def get_last_ids(channels: T.Iterable[str]) -> dict[str, str]:
+    """Get the id of the last message of every channel stream.
+
+    Args:
+        channels (Iterable[str]): channel names.
+
+    Returns:
+        dict[str, str]: last message id by channel, ``0`` when empty.
+    """
+    last_ids = {}
+    for channel in channels:
+        entries = await connections.async_client.xrevrange(
+            stream_key(channel),
+            count=1,
+        )
+        last_ids[channel] = entries[0][0].decode() if entries else "0"
+    return last_ids
+
+
+def create_message(
+    channel: str,
+    message_id: bytes,
+    fields: dict[bytes, bytes],
+) -> StreamMessage:
+    """Create a message from a stream entry.
+
+    Args:
+        channel (str): channel name.
+        message_id (bytes): stream entry id.
+        fields (dict[bytes, bytes]): stream entry fields.
+
+    Returns:
+        StreamMessage: message.
+    """
+    return StreamMessage(
+        channel=channel,
+        message_id=message_id.decode(),
+        payload=fields[STREAM_FIELD.encode()].decode(),
+    )
@@ -6,6 +6,25 @@ from starlette import status
 from monster_spawner.domain import exceptions
 
 
+def create_error_response(
+    status_code: int,
+    detail: str,
+) -> responses.JSONResponse:
+    """Create the json response of an error.
+
+    Args:
+        status_code (int): response status code.
+        detail (str): error description.
+
+    Returns:
+        JSONResponse: json response.
+    """
+    return responses.JSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+    )
+
+
 async def does_not_exist_handler(
     request: Request,
     exc: exceptions.DoesNotExistError,
@@ -19,9 +38,9 @@ async def does_not_exist_handler(
     Returns:
         JSONResponse: json response.
     """
-    return responses.JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={"detail": f"{exc.entry_name} does not exist - {exc.id}"},
+    return create_error_response(
+        status.HTTP_404_NOT_FOUND,
+        f"{exc.entry_name} does not exist - {exc.id}",
     )
 
 
@@ -38,9 +57,47 @@ async def already_exists_handler(
     Returns:
         JSONResponse: json response.
     """
-    return responses.JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={"detail": f"{exc.entry_name} already exists - {exc.id}"},
+    return create_error_response(
+        status.HTTP_400_BAD_REQUEST,
+        f"{exc.entry_name} already exists - {exc.id}",
+    )
+
+
+async def invalid_cursor_handler(
+    request: Request,
+    exc: exceptions.InvalidCursorError,
+) -> responses.JSONResponse:
+    """Handle InvalidCursorError.
+
+    Args:
+        request (Request): request object.
+        exc (InvalidCursorError): exception object.
+
+    Returns:
+        JSONResponse: json response.
+    """
+    return create_error_response(
+        status.HTTP_400_BAD_REQUEST,
+        f"Invalid cursor - {exc.cursor}",
+    )
+
+
+async def invalid_filter_handler(
+    request: Request,
+    exc: exceptions.InvalidFilterError,
+) -> responses.JSONResponse:
+    """Handle InvalidFilterError.
+
+    Args:
+        request (Request): request object.
+        exc (InvalidFilterError): exception object.
+
+    Returns:
+        JSONResponse: json response.
+    """
+    return create_error_response(
+        status.HTTP_400_BAD_REQUEST,
+        f"Invalid filter - {exc.name}",
     )
 
 
@@ -48,5 +105,7 @@ EXCEPTION_HANDLERS = frozenset(
     {
         exceptions.DoesNotExistError: does_not_exist_handler,
         exceptions.AlreadyExistsError: already_exists_handler,
+        exceptions.InvalidCursorError: invalid_cursor_handler,
+        exceptions.InvalidFilterError: invalid_filter_handler,
     }.items(),
 )
@@ -0,0 +1,153 @@
+"""Structured logging configuration.
+
+Calls below LOG_LEVEL are no-ops, so their arguments are never
+rendered. Expensive values can be wrapped with ``lazy`` to be computed
+only for the events which are actually written, and high volume events
+passing ``sampled=True`` are written with LOG_SAMPLE_RATE probability.
+"""
+
+import logging
+import random
+import sys
+import typing as T  # noqa: WPS111,N812
+from types import MappingProxyType
+
+import orjson
+import structlog
+
+from monster_spawner.settings import settings
+
+SAMPLED = "sampled"
+STREAMS: T.Mapping[str, T.Callable[[], T.TextIO]] = MappingProxyType(
+    {"stdout": lambda: sys.stdout, "stderr": lambda: sys.stderr},
+)
+
+
+class Lazy:
+    """Log value computed only when its event is rendered."""
+
+    def __init__(self, function: T.Callable, *args, **kwargs) -> None:
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> T.Any:
+        """Compute the value.
+
+        Returns:
+            Any: value to render.
+        """
+        return self.function(*self.args, **self.kwargs)
+
+
+def lazy(function: T.Callable, *args, **kwargs) -> Lazy:
+    """Defer a call until its event is rendered.
+
+    Args:
+        function (Callable): function computing the logged value.
+        args (tuple): positional arguments of the function.
+        kwargs (dict): keyword arguments of the function.
+
+    Returns:
+        Lazy: deferred call.
+    """
+    return Lazy(function, *args, **kwargs)
+
+
+class Sampler:
+    """Processor dropping most of the events marked as sampled."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+
+    def __call__(
+        self,
+        logger: T.Any,
+        method_name: str,
+        event_dict: dict[str, T.Any],
+    ) -> dict[str, T.Any]:
+        """Drop a sampled event unless it was picked.
+
+        Args:
+            logger (Any): wrapped logger.
+            method_name (str): name of the called log method.
+            event_dict (dict[str, Any]): event context.
+
+        Raises:
+            DropEvent: when the event is not written.
+
+        Returns:
+            dict[str, Any]: event context without the sampling flag.
+        """
+        if not event_dict.pop(SAMPLED, False):
+            return event_dict
+        if random.random() >= self.rate:  # noqa: S311
+            raise structlog.DropEvent
+        return event_dict
+
+
+def resolve_lazy(
+    logger: T.Any,
+    method_name: str,
+    event_dict: dict[str, T.Any],
+) -> dict[str, T.Any]:
+    """Compute the lazy values of an event which is going to be written.
+
+    Args:
+        logger (Any): wrapped logger.
+        method_name (str): name of the called log method.
+        event_dict (dict[str, Any]): event context.
+
+    Returns:
+        dict[str, Any]: event context with computed values.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, Lazy):
+            event_dict[key] = value()
+    return event_dict
+
+
+def configure_logging(
+    stream: T.TextIO | None = None,
+    json: bool | None = None,
+) -> None:
+    """Configure structlog from the settings.
+
+    JSON lines are encoded with orjson and written as bytes, otherwise
+    the colored development renderer is used.
+
+    Args:
+        stream (TextIO | None): log stream, None for the LOG_STREAM one.
+        json (bool | None): whether to write JSON lines, None for LOG_JSON.
+    """
+    if stream is None:
+        stream = STREAMS[settings.LOG_STREAM]()
+    if json is None:
+        json = settings.LOG_JSON
+    processors: list[T.Callable] = [
+        Sampler(settings.LOG_SAMPLE_RATE),
+        resolve_lazy,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+    ]
+    logger_factory: T.Callable
+    if json:
+        processors.append(structlog.processors.format_exc_info)
+        processors.append(
+            structlog.processors.JSONRenderer(
+                serializer=orjson.dumps,
+                default=str,
+            ),
+        )
+        logger_factory = structlog.BytesLoggerFactory(stream.buffer)
+    else:
+        processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory(stream)
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(settings.LOG_LEVEL.upper()),
+        ),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
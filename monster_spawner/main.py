@@ -4,8 +4,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from structlog import get_logger
 
+from monster_spawner import logs, resources
 from monster_spawner.api import router
+from monster_spawner.api.responses import FastJSONResponse
+from monster_spawner.database import sessions
+from monster_spawner.domain.mob import catalogue, feed, invalidation
+from monster_spawner.events import buffer, bus, outbox
 from monster_spawner.handlers import EXCEPTION_HANDLERS
+from monster_spawner.metrics import middleware
 from monster_spawner.settings import settings
 
 logger = get_logger(__name__)
@@ -17,22 +23,56 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: created app.
     """
+    logs.configure_logging()
     logger.info("Creating app...")
     app = FastAPI(
         title=settings.TITLE,
         version=settings.VERSION,
         description=settings.DESCRIPTION,
         docs_url="/api/docs",
+        default_response_class=FastJSONResponse,
     )
     app.add_middleware(
         CORSMiddleware,
         allow_credentials=True,
         allow_methods=["*"],
     )
+    app.add_middleware(middleware.InstrumentationMiddleware)
     app.include_router(router.api_router)
-    app.exception_handlers = dict(EXCEPTION_HANDLERS)
+    app.add_route("/metrics", middleware.get_metrics, include_in_schema=False)
+    add_background_tasks(app)
+    app.exception_handlers.update(EXCEPTION_HANDLERS)
     app.middleware_stack = app.build_middleware_stack()
     return app
 
 
+def add_background_tasks(app: FastAPI) -> None:
+    """Run the enabled background workers along with the application.
+
+    The connections are created before anything else starts, and
+    closed once everything else is stopped.
+
+    Args:
+        app (FastAPI): application.
+    """
+    hooks: list[tuple] = [(resources.start, resources.close)]
+    if settings.EVENTS_OUTBOX:
+        relay = outbox.OutboxRelay(sessions.database.session)
+        hooks.append((relay.start, relay.stop))
+    if settings.EVENTS_BUFFERED:
+        bus.EventBus.buffer = buffer.EventBuffer()
+        hooks.append((bus.EventBus.buffer.start, bus.EventBus.buffer.stop))
+    mob_feed = invalidation.CacheFeed(invalidation.mob_cache)
+    if settings.CATALOGUE_ENABLED:
+        mob_feed = feed.CatalogueFeed(
+            catalogue.mob_catalogue,
+            invalidation.mob_cache,
+        )
+    hooks.append((mob_feed.start, mob_feed.stop))
+    for start, _ in hooks:
+        app.add_event_handler("startup", start)
+    for _, stop in reversed(hooks):
+        app.add_event_handler("shutdown", stop)
+
+
 app = create_application()
@@ -0,0 +1,118 @@
+"""Prometheus collectors and timers of SQL statements and redis.
+
+Statements and redis publishes are timed globally and, inside a
+request, added up on the request stats held in a context variable.
+"""
+
+import time
+import typing as T  # noqa: WPS111,N812
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+STATEMENT_START = "statement_start"
+REQUEST_LABELS = ("method", "route")
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request.",
+    [*REQUEST_LABELS, "status"],
+)
+REQUEST_STATEMENTS = Histogram(
+    "http_request_sql_statements",
+    "Number of SQL statements executed by a request.",
+    REQUEST_LABELS,
+    buckets=STATEMENT_BUCKETS,
+)
+REQUEST_SQL_DURATION = Histogram(
+    "http_request_sql_duration_seconds",
+    "Time a request spent executing SQL statements.",
+    REQUEST_LABELS,
+)
+REQUEST_REDIS_DURATION = Histogram(
+    "http_request_redis_duration_seconds",
+    "Time a request spent publishing to redis.",
+    REQUEST_LABELS,
+)
+SQL_DURATION = Histogram(
+    "sql_statement_duration_seconds",
+    "Time spent executing a single SQL statement.",
+)
+REDIS_PUBLISH_DURATION = Histogram(
+    "redis_publish_duration_seconds",
+    "Time spent on a single redis publish or publish pipeline.",
+)
+
+
+@dataclass
+class RequestStats:
+    """Work done while handling a single request."""
+
+    status: int = 500
+    statements: int = 0
+    sql_time: float = 0
+    redis_time: float = 0
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats",
+    default=None,
+)
+
+
+def start_statement(connection: Connection, *args) -> None:
+    """Remember when the statement started.
+
+    Args:
+        connection (Connection): connection executing the statement.
+        args (tuple): other before_cursor_execute arguments.
+    """
+    connection.info[STATEMENT_START] = time.perf_counter()
+
+
+def finish_statement(connection: Connection, *args) -> None:
+    """Record the statement duration.
+
+    Args:
+        connection (Connection): connection executing the statement.
+        args (tuple): other after_cursor_execute arguments.
+    """
+    elapsed = time.perf_counter() - connection.info[STATEMENT_START]
+    SQL_DURATION.observe(elapsed)
+    stats = request_stats.get()
+    if stats:
+        stats.statements += 1
+        stats.sql_time += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed by the engine.
+
+    Args:
+        engine (Engine): sync engine, ``sync_engine`` of an async one.
+    """
+    event.listen(engine, "before_cursor_execute", start_statement)
+    event.listen(engine, "after_cursor_execute", finish_statement)
+
+
+@contextmanager
+def time_redis_publish() -> T.Iterator[None]:
+    """Record the duration of a redis publish.
+
+    Yields:
+        None: control to the publishing code.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        REDIS_PUBLISH_DURATION.observe(elapsed)
+        stats = request_stats.get()
+        if stats:
+            stats.redis_time += elapsed
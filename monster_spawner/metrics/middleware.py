@@ -0,0 +1,131 @@
+"""Request instrumentation middleware and metrics endpoint."""
+
+import functools
+import os
+import time
+import typing as T  # noqa: WPS111,N812
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from monster_spawner.metrics import collectors
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class InstrumentationMiddleware:
+    """ASGI middleware recording the latency and the work of requests.
+
+    Routes are labelled with their path template, so path parameters
+    do not blow up the number of series.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle the request with fresh request stats.
+
+        Args:
+            scope (Scope): connection scope.
+            receive (Receive): receive channel.
+            send (Send): send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track_request(scope) as stats:
+            await self.app(
+                scope,
+                receive,
+                functools.partial(self.send, stats, send),
+            )
+
+    async def send(
+        self,
+        stats: collectors.RequestStats,
+        send: Send,
+        message: Message,
+    ) -> None:
+        """Catch the response status on its way out.
+
+        Args:
+            stats (RequestStats): stats of the request.
+            send (Send): send channel.
+            message (Message): ASGI message.
+        """
+        if message["type"] == "http.response.start":
+            stats.status = message["status"]
+        await send(message)
+
+
+@contextmanager
+def track_request(scope: Scope) -> T.Iterator[collectors.RequestStats]:
+    """Collect the stats of a request and record them when it is done.
+
+    Args:
+        scope (Scope): connection scope.
+
+    Yields:
+        RequestStats: stats of the request.
+    """
+    stats = collectors.RequestStats()
+    token = collectors.request_stats.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        collectors.request_stats.reset(token)
+        observe(scope, stats, time.perf_counter() - start)
+
+
+def observe(
+    scope: Scope,
+    stats: collectors.RequestStats,
+    duration: float,
+) -> None:
+    """Record the stats of a finished request.
+
+    Args:
+        scope (Scope): connection scope.
+        stats (RequestStats): stats of the request.
+        duration (float): request duration in seconds.
+    """
+    route = scope.get("route")
+    labels = (scope["method"], route.path if route else UNMATCHED_ROUTE)
+    collectors.REQUEST_DURATION.labels(*labels, str(stats.status)).observe(
+        duration,
+    )
+    collectors.REQUEST_STATEMENTS.labels(*labels).observe(stats.statements)
+    collectors.REQUEST_SQL_DURATION.labels(*labels).observe(stats.sql_time)
+    collectors.REQUEST_REDIS_DURATION.labels(*labels).observe(
+        stats.redis_time,
+    )
+
+
+async def get_metrics(request: Request) -> Response:
+    """Render all metrics in the Prometheus text format.
+
+    When the server runs several workers, the metrics written by all of
+    them to PROMETHEUS_MULTIPROC_DIR are aggregated.
+
+    Args:
+        request (Request): request object.
+
+    Returns:
+        Response: metrics exposition.
+    """
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
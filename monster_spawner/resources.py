@@ -0,0 +1,69 @@
+"""Lifecycle of the shared database and redis connections.
+
+Importing the application creates no engine nor client. They are
+created by the startup handler, before the first request comes in, and
+dropped by the shutdown handler.
+"""
+
+import asyncio
+
+import redis
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog import get_logger
+
+from monster_spawner.database import sessions
+from monster_spawner.events import publisher
+from monster_spawner.settings import settings
+
+logger = get_logger(__name__)
+
+
+async def ping(engine: AsyncEngine) -> None:
+    """Run a trivial query on a pooled connection.
+
+    Args:
+        engine (AsyncEngine): engine to check out the connection from.
+    """
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def start() -> None:
+    """Create the connections, warm them up and monitor the replicas."""
+    await warm_up()
+    if sessions.database.replicas:
+        sessions.database.replicas.start()
+
+
+async def warm_up() -> None:
+    """Open connections before the first requests come in.
+
+    DATABASE_WARMUP_CONNECTIONS connections are checked out at the
+    same time, so each of them is a new one, and returned to the pool.
+    Failures are only logged, the pools connect again on demand.
+    """
+    try:
+        await asyncio.gather(
+            *(
+                ping(sessions.database.engine)
+                for _ in range(settings.DATABASE_WARMUP_CONNECTIONS)
+            ),
+        )
+    except (SQLAlchemyError, OSError) as database_error:
+        logger.warning(
+            "Could not warm up the database pool",
+            exc=database_error,
+        )
+    try:
+        await publisher.connections.async_client.ping()
+    except redis.exceptions.RedisError as redis_error:
+        logger.warning("Could not warm up the redis pool", exc=redis_error)
+
+
+async def close() -> None:
+    """Stop monitoring the replicas and close the pooled connections."""
+    await sessions.database.replicas.stop()
+    await sessions.database.dispose()
+    await publisher.connections.disconnect()
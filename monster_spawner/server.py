@@ -0,0 +1,66 @@
+"""Production server, run with ``python -m monster_spawner.server``.
+
+Every uvicorn worker is a spawned process importing the application on
+its own, so no connection is shared between workers. The pools are
+warmed up in the startup hooks, before the worker accepts requests,
+and closed in the shutdown hooks. On SIGTERM uvicorn stops accepting
+connections, waits for the requests in flight and runs the shutdown
+hooks.
+
+Each worker has its own database pool, so the database has to accept
+SERVER_WORKERS times DATABASE_POOL_SIZE plus DATABASE_MAX_OVERFLOW
+connections.
+"""
+
+import os
+import tempfile
+
+import uvicorn
+
+from monster_spawner.logs import configure_logging
+from monster_spawner.settings import settings
+
+APP = "monster_spawner.main:app"
+
+
+def count_workers() -> int:
+    """Get the number of workers, one per usable CPU by default.
+
+    Returns:
+        int: number of worker processes.
+    """
+    if settings.SERVER_WORKERS:
+        return settings.SERVER_WORKERS
+    return len(os.sched_getaffinity(0))
+
+
+def prepare_metrics() -> None:
+    """Make the workers write their metrics to a shared directory."""
+    os.environ.setdefault(
+        "PROMETHEUS_MULTIPROC_DIR",
+        tempfile.mkdtemp(prefix="prometheus-"),
+    )
+
+
+def main() -> None:
+    """Run the application in worker processes.
+
+    Workers are not replaced when they exit, so there is no limit of
+    requests per worker.
+    """
+    configure_logging()
+    workers = count_workers()
+    if workers > 1:
+        prepare_metrics()
+    uvicorn.run(
+        APP,
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        lifespan="on",
+        timeout_keep_alive=settings.SERVER_TIMEOUT_KEEP_ALIVE,
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
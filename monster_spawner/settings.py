@@ -1,5 +1,7 @@
 """App settings."""
 
+import socket
+
 from environs import Env
 from pydantic import BaseSettings
 
@@ -15,13 +17,93 @@ class Settings(BaseSettings):
     DESCRIPTION: str = "Service handling Minecraft mobs"
     DEBUG: bool = env.bool("DEBUG", default=False)
 
+    # Server
+    SERVER_HOST: str = env.str("SERVER_HOST", "0.0.0.0")  # noqa: S104
+    SERVER_PORT: int = env.int("PORT", 8002)
+    SERVER_WORKERS: int = env.int("SERVER_WORKERS", 0)
+    SERVER_TIMEOUT_KEEP_ALIVE: int = env.int("SERVER_TIMEOUT_KEEP_ALIVE", 2)
+
+    # Logging
+    LOG_LEVEL: str = env.str("LOG_LEVEL", "INFO")
+    LOG_JSON: bool = env.bool("LOG_JSON", default=False)
+    LOG_STREAM: str = env.str("LOG_STREAM", "stdout")
+    LOG_SAMPLE_RATE: float = env.float("LOG_SAMPLE_RATE", 0.01)
+
     # Database
     DATABASE_URL: str = env.str("DATABASE_URL")
     DATABASE_NAME: str = env.str("DATABASE_NAME", "")
+    DATABASE_REPLICA_URLS: str = env.str("DATABASE_REPLICA_URLS", "")
+    DATABASE_REPLICA_MAX_LAG: float = env.float("DATABASE_REPLICA_MAX_LAG", 5.0)
+    DATABASE_REPLICA_CHECK_INTERVAL: float = env.float(
+        "DATABASE_REPLICA_CHECK_INTERVAL",
+        1.0,
+    )
+    DATABASE_POOL_SIZE: int = env.int("DATABASE_POOL_SIZE", 5)
+    DATABASE_MAX_OVERFLOW: int = env.int("DATABASE_MAX_OVERFLOW", 10)
+    DATABASE_POOL_TIMEOUT: float = env.float("DATABASE_POOL_TIMEOUT", 30.0)
+    DATABASE_POOL_RECYCLE: int = env.int("DATABASE_POOL_RECYCLE", 1800)
+    DATABASE_POOL_PRE_PING: bool = env.bool(
+        "DATABASE_POOL_PRE_PING",
+        default=False,
+    )
+    DATABASE_WARMUP_CONNECTIONS: int = env.int("DATABASE_WARMUP_CONNECTIONS", 2)
+    DATABASE_STATEMENT_CACHE_SIZE: int = env.int(
+        "DATABASE_STATEMENT_CACHE_SIZE",
+        100,
+    )
+    DATABASE_QUERY_CACHE_SIZE: int = env.int("DATABASE_QUERY_CACHE_SIZE", 500)
+    DATABASE_QUERY_TEMPLATES: int = env.int("DATABASE_QUERY_TEMPLATES", 128)
+
+    # Pagination
+    PAGE_SIZE: int = env.int("PAGE_SIZE", 100)
+    MAX_PAGE_SIZE: int = env.int("MAX_PAGE_SIZE", 1000)
+
+    # Export and bulk create
+    EXPORT_CHUNK_SIZE: int = env.int("EXPORT_CHUNK_SIZE", 1000)
+    MAX_BULK_SIZE: int = env.int("MAX_BULK_SIZE", 1000)
 
     # Redis
     REDIS_HOST: str = env.str("REDIS_HOST")
     REDIS_PORT: int = env.int("REDIS_PORT")
+    REDIS_MAX_CONNECTIONS: int = env.int("REDIS_MAX_CONNECTIONS", 50)
+    REDIS_POOL_TIMEOUT: int = env.int("REDIS_POOL_TIMEOUT", 5)
+    REDIS_ASYNC_PUBLISHER: bool = env.bool(
+        "REDIS_ASYNC_PUBLISHER",
+        default=True,
+    )
+
+    # Cache
+    CACHE_MAX_SIZE: int = env.int("CACHE_MAX_SIZE", 10000)
+    CACHE_TTL: float = env.float("CACHE_TTL", 60.0)
+    CACHE_REDIS: bool = env.bool("CACHE_REDIS", default=False)
+    CATALOGUE_ENABLED: bool = env.bool("CATALOGUE_ENABLED", default=False)
+
+    # Events
+    EVENTS_OUTBOX: bool = env.bool("EVENTS_OUTBOX", default=True)
+    OUTBOX_BATCH_SIZE: int = env.int("OUTBOX_BATCH_SIZE", 500)
+    OUTBOX_POLL_INTERVAL: float = env.float("OUTBOX_POLL_INTERVAL", 0.5)
+    OUTBOX_MAX_RETRIES: int = env.int("OUTBOX_MAX_RETRIES", 5)
+    OUTBOX_RETRY_DELAY: float = env.float("OUTBOX_RETRY_DELAY", 0.1)
+    EVENTS_STREAMS: bool = env.bool("EVENTS_STREAMS", default=False)
+    EVENTS_STREAM_MAX_LENGTH: int = env.int("EVENTS_STREAM_MAX_LENGTH", 100000)
+    EVENTS_BUFFERED: bool = env.bool("EVENTS_BUFFERED", default=False)
+    EVENTS_COALESCE: bool = env.bool("EVENTS_COALESCE", default=True)
+    EVENTS_BUFFER_SIZE: int = env.int("EVENTS_BUFFER_SIZE", 100)
+    EVENTS_BUFFER_INTERVAL: float = env.float("EVENTS_BUFFER_INTERVAL", 0.05)
+
+    # Consumer
+    CONSUMER_CHANNELS: str = env.str(
+        "CONSUMER_CHANNELS",
+        "create-monster,delete-monster",
+    )
+    CONSUMER_GROUP: str = env.str("CONSUMER_GROUP", "monster-spawner")
+    CONSUMER_NAME: str = env.str("CONSUMER_NAME", socket.gethostname())
+    CONSUMER_CONCURRENCY: int = env.int("CONSUMER_CONCURRENCY", 10)
+    CONSUMER_BATCH_SIZE: int = env.int("CONSUMER_BATCH_SIZE", 100)
+    CONSUMER_BLOCK: int = env.int("CONSUMER_BLOCK", 1000)
+    CONSUMER_RETRY_DELAY: float = env.float("CONSUMER_RETRY_DELAY", 1.0)
+    CONSUMER_CLAIM_INTERVAL: float = env.float("CONSUMER_CLAIM_INTERVAL", 30.0)
+    CONSUMER_CLAIM_IDLE: int = env.int("CONSUMER_CLAIM_IDLE", 60000)
 
 
 settings = Settings()
@@ -0,0 +1,79 @@
+"""Incoming event worker, run with ``python -m monster_spawner.worker``."""
+
+import asyncio
+import contextlib
+import signal
+import typing as T  # noqa: WPS111,N812
+
+from structlog import get_logger
+
+from monster_spawner import resources
+from monster_spawner.database import sessions
+from monster_spawner.events import buffer, consumer, outbox
+from monster_spawner.events.bus import EventBus
+from monster_spawner.logs import configure_logging
+from monster_spawner.settings import settings
+
+logger = get_logger(__name__)
+
+Worker = T.Union[
+    consumer.EventConsumer,
+    outbox.OutboxRelay,
+    buffer.EventBuffer,
+]
+
+
+def create_workers() -> list[Worker]:
+    """Create the consumer and the workers publishing its events.
+
+    Returns:
+        list[Worker]: background workers in start order.
+    """
+    workers: list[Worker] = []
+    if settings.EVENTS_OUTBOX:
+        workers.append(outbox.OutboxRelay(sessions.database.session))
+    if settings.EVENTS_BUFFERED:
+        EventBus.buffer = buffer.EventBuffer()
+        workers.append(EventBus.buffer)
+    channels = filter(None, settings.CONSUMER_CHANNELS.split(","))
+    workers.append(consumer.EventConsumer(channels))
+    return workers
+
+
+async def run(stop: asyncio.Event) -> None:
+    """Run the workers until stopped.
+
+    The consumer is stopped first, so the events of the messages it was
+    handling are still published. The connections are closed last,
+    whatever happened.
+
+    Args:
+        stop (asyncio.Event): event set to shut the workers down.
+    """
+    async with contextlib.AsyncExitStack() as cleanup:
+        cleanup.push_async_callback(resources.close)
+        for worker in create_workers():
+            worker.start()
+            cleanup.push_async_callback(worker.stop)
+        await stop.wait()
+
+
+async def serve() -> None:
+    """Run the workers until SIGINT or SIGTERM."""
+    configure_logging()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    logger.info("Starting worker")
+    await run(stop)
+    logger.info("Stopped worker")
+
+
+def main() -> None:  # pragma: no cover
+    """Run the worker."""
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
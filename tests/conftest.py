@@ -10,6 +10,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from monster_spawner.database import base, sessions
+from monster_spawner.domain.mob import invalidation
 from monster_spawner.main import app as base_app
 from monster_spawner.settings import settings
 
@@ -26,9 +27,10 @@ def event_loop() -> T.Generator:
 async def database_session() -> T.AsyncGenerator:
     """Prepare a test database session."""
     engine, async_session = sessions.get_connection(settings.DATABASE_URL)
-    async with engine.begin() as connection:
+    async with engine.connect() as connection:
         await connection.run_sync(base.Model.metadata.drop_all)
         await connection.run_sync(base.Model.metadata.create_all)
+        await connection.commit()
         async with async_session(bind=connection) as session:
             yield session
             await session.flush()
@@ -43,6 +45,8 @@ def test_app(database_session: AsyncSession) -> FastAPI:
         return database_session
 
     base_app.dependency_overrides[sessions.get_session] = override_get_db
+    base_app.dependency_overrides[sessions.get_read_session] = override_get_db
+    invalidation.mob_cache.clear()
     return base_app
 
 
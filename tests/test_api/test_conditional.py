@@ -0,0 +1,80 @@
+"""Conditional request helpers test cases."""
+
+from datetime import datetime, timezone
+
+import pytest
+from starlette.requests import Request
+
+from monster_spawner.api import conditional
+
+MODIFIED_AT = datetime(2022, 3, 1, 12, 0, 30, 500, tzinfo=timezone.utc)
+
+
+def create_request(headers: dict[str, str]) -> Request:
+    """Shortcut for creating a GET request with the headers."""
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [
+                (name.lower().encode(), header.encode())
+                for name, header in headers.items()
+            ],
+        },
+    )
+
+
+def test_create_validators():
+    """Check that the validators are weak and dates are in GMT."""
+    validators = conditional.create_validators(3, MODIFIED_AT)
+
+    assert validators == {
+        "ETag": 'W/"3"',
+        "Last-Modified": "Tue, 01 Mar 2022 12:00:30 GMT",
+    }
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "matches"),
+    [
+        ("*", True),
+        ('"1", W/"3"', True),
+        ('"3"', True),
+        ('W/"4"', False),
+    ],
+)
+def test_matches_etag(if_none_match: str, matches: bool):
+    """Check that entity tags are compared with the weak comparison."""
+    assert conditional.matches_etag(if_none_match, 'W/"3"') is matches
+
+
+@pytest.mark.parametrize(
+    ("headers", "not_modified"),
+    [
+        ({}, False),
+        ({"If-None-Match": 'W/"3"'}, True),
+        ({"If-Modified-Since": "Tue, 01 Mar 2022 12:00:30 GMT"}, True),
+        ({"If-Modified-Since": "Tue, 01 Mar 2022 12:00:29 GMT"}, False),
+        ({"If-Modified-Since": "yesterday"}, False),
+    ],
+)
+def test_is_not_modified(headers: dict[str, str], not_modified: bool):
+    """Check that If-None-Match takes precedence over the date."""
+    validators = conditional.create_validators(3, MODIFIED_AT)
+
+    is_not_modified = conditional.is_not_modified(
+        create_request(headers),
+        validators,
+    )
+
+    assert is_not_modified is not_modified
+
+
+def test_is_not_modified_without_date():
+    """Check that a date is not compared without Last-Modified."""
+    request = create_request({"If-Modified-Since": "Tue, 01 Mar 2022"})
+
+    assert not conditional.is_not_modified(
+        request,
+        conditional.create_validators(3),
+    )
@@ -1,14 +1,26 @@
 """Mob API E2E test cases."""
 
+import json
+import typing as T  # noqa: WPS111,N812
 import uuid
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from monster_spawner.domain.mob import catalogue
+
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture()
+def loaded_catalogue() -> T.Generator:
+    """Serve the mob reads from the catalogue during the test."""
+    catalogue.mob_catalogue.load([])
+    yield catalogue.mob_catalogue
+    catalogue.mob_catalogue.unload()
+
+
 async def test_mob_create(async_client: AsyncClient):
     """Test creating a mob."""
     response = await async_client.post(
@@ -32,6 +44,34 @@ async def test_mob_create_not_unique(async_client: AsyncClient):
     assert data["detail"] == f"Mob already exists - {mob.json()['id']}"
 
 
+async def test_mob_bulk_create(async_client: AsyncClient):
+    """Test creating many mobs at once."""
+    response = await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+    zombie = response.json()
+
+    response = await async_client.post(
+        "/api/v1/mobs/bulk",
+        json=[{"name": "Zombie"}, {"name": "Creeper"}],
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data[0] == {
+        "status": "conflict",
+        "id": zombie["id"],
+        "name": "Zombie",
+    }
+    assert data[1]["status"] == "created"
+    assert data[1]["name"] == "Creeper"
+
+
+async def test_mob_bulk_create_empty(async_client: AsyncClient):
+    """Test creating an empty batch of mobs."""
+    response = await async_client.post("/api/v1/mobs/bulk", json=[])
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_mob_list(async_client: AsyncClient):
     """Test retrieving a list of mobs."""
     # Add 3 mobs to the database
@@ -58,6 +98,148 @@ async def test_mob_list_with_filters(async_client: AsyncClient):
     assert len(data) == 1
 
 
+async def test_mob_list_with_lookups(async_client: AsyncClient):
+    """Test retrieving a sorted list of mobs with range filters applied."""
+    # Add 5 mobs to the database
+    for i in range(5):
+        await async_client.post(
+            "/api/v1/mobs/",
+            json={"name": f"Zombie {i}", "health": i * 20, "damage": 5 - i},
+        )
+
+    response = await async_client.get(
+        "/api/v1/mobs/?hostile=false&health__gte=20&health__lte=60"
+        "&name__in=Zombie 1&name__in=Zombie 3&sort=damage"
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [mob["name"] for mob in data] == ["Zombie 3", "Zombie 1"]
+
+
+async def test_mob_list_between(async_client: AsyncClient):
+    """Test retrieving a list of mobs within a health range."""
+    # Add 5 mobs to the database
+    for i in range(5):
+        await async_client.post(
+            "/api/v1/mobs/",
+            json={"name": f"Zombie {i}", "health": i * 20},
+        )
+
+    response = await async_client.get(
+        "/api/v1/mobs/?health__between=20&health__between=60&sort=health",
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [mob["health"] for mob in data] == [20, 40, 60]
+
+
+async def test_mob_list_between_one_bound(async_client: AsyncClient):
+    """Test retrieving a list of mobs within a range missing a bound."""
+    response = await async_client.get("/api/v1/mobs/?damage__between=20")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_mob_list_with_fields(async_client: AsyncClient):
+    """Test retrieving a list of mobs with only some of the fields."""
+    await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+
+    response = await async_client.get("/api/v1/mobs/?fields=name,health")
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(data[0]) == {"id", "name", "health"}
+    assert data[0]["name"] == "Zombie"
+
+
+async def test_mob_list_invalid_fields(async_client: AsyncClient):
+    """Test retrieving a list of mobs with an unknown field."""
+    response = await async_client.get("/api/v1/mobs/?fields=name,lol")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_mob_list_not_modified(async_client: AsyncClient):
+    """Test revalidating a list of mobs before and after a change."""
+    await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+    response = await async_client.get("/api/v1/mobs/")
+    headers = {"If-None-Match": response.headers["ETag"]}
+
+    unchanged = await async_client.get("/api/v1/mobs/", headers=headers)
+    await async_client.post("/api/v1/mobs/", json={"name": "Creeper"})
+    changed = await async_client.get("/api/v1/mobs/", headers=headers)
+
+    assert unchanged.status_code == status.HTTP_304_NOT_MODIFIED
+    assert changed.status_code == status.HTTP_200_OK
+    assert len(changed.json()) == 2
+
+
+@pytest.mark.usefixtures("loaded_catalogue")
+async def test_mob_list_from_catalogue(async_client: AsyncClient):
+    """Test that lists cut from the catalogue are never revalidated."""
+    await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+    database = await async_client.get("/api/v1/mobs/?sort=name")
+    headers = {"If-None-Match": database.headers["ETag"]}
+
+    response = await async_client.get("/api/v1/mobs/", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response.headers
+    assert [mob["name"] for mob in response.json()] == ["Zombie"]
+
+
+async def test_mob_list_invalid_sort(async_client: AsyncClient):
+    """Test retrieving a list of mobs sorted by an unknown field."""
+    response = await async_client.get("/api/v1/mobs/?sort=lol")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_mob_list_pagination(async_client: AsyncClient):
+    """Test retrieving a list of mobs page by page."""
+    # Add 3 mobs to the database
+    for i in range(3):
+        await async_client.post("/api/v1/mobs/", json={"name": f"Zombie {i}"})
+
+    response = await async_client.get("/api/v1/mobs/?limit=2")
+    first_page = response.json()
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await async_client.get(f"/api/v1/mobs/?limit=2&cursor={cursor}")
+    last_page = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(first_page) == 2
+    assert len(last_page) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+
+async def test_mob_list_invalid_cursor(async_client: AsyncClient):
+    """Test retrieving a list of mobs with a malformed cursor."""
+    response = await async_client.get("/api/v1/mobs/?cursor=lol")
+    data = response.json()
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert data["detail"] == "Invalid cursor - lol"
+
+
+async def test_mob_export(async_client: AsyncClient):
+    """Test exporting mobs as newline delimited JSON."""
+    # Add 3 mobs to the database
+    for i in range(3):
+        await async_client.post("/api/v1/mobs/", json={"name": f"Zombie {i}"})
+
+    response = await async_client.get("/api/v1/mobs/export")
+    data = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(data) == 3
+    assert {mob["name"] for mob in data} == {"Zombie 0", "Zombie 1", "Zombie 2"}
+
+
 async def test_mob_get(async_client: AsyncClient):
     """Test retrieving a single mob."""
     response = await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
@@ -70,6 +252,46 @@ async def test_mob_get(async_client: AsyncClient):
     assert data["id"] == str(mob["id"])
 
 
+async def test_mob_get_not_modified(async_client: AsyncClient):
+    """Test revalidating a single mob which did not change."""
+    response = await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+    mob = response.json()
+    response = await async_client.get(f"/api/v1/mobs/{mob['id']}")
+
+    by_etag = await async_client.get(
+        f"/api/v1/mobs/{mob['id']}",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    by_date = await async_client.get(
+        f"/api/v1/mobs/{mob['id']}",
+        headers={"If-Modified-Since": response.headers["Last-Modified"]},
+    )
+
+    assert by_etag.status_code == status.HTTP_304_NOT_MODIFIED
+    assert by_etag.headers["ETag"] == response.headers["ETag"]
+    assert by_date.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not by_etag.content
+
+
+async def test_mob_get_modified(async_client: AsyncClient):
+    """Test revalidating a single mob which was updated."""
+    response = await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+    mob = response.json()
+    response = await async_client.get(f"/api/v1/mobs/{mob['id']}")
+    await async_client.patch(
+        f"/api/v1/mobs/{mob['id']}",
+        json={"name": "Creeper"},
+    )
+
+    response = await async_client.get(
+        f"/api/v1/mobs/{mob['id']}",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["name"] == "Creeper"
+
+
 async def test_mob_get_not_existing(async_client: AsyncClient):
     """Test retrieving a not existing mob."""
     mob_pk = uuid.uuid4()
@@ -0,0 +1,31 @@
+"""Stats API E2E test cases."""
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_cache_stats(async_client: AsyncClient):
+    """Test retrieving the cache counters."""
+    response = await async_client.post("/api/v1/mobs/", json={"name": "Zombie"})
+    mob = response.json()
+    await async_client.get(f"/api/v1/mobs/{mob['id']}")
+    await async_client.get(f"/api/v1/mobs/{mob['id']}")
+
+    response = await async_client.get("/api/v1/stats/cache")
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["mobs"]["hits"] >= 1
+    assert data["mobs"]["misses"] >= 1
+
+
+async def test_pool_stats(async_client: AsyncClient):
+    """Test retrieving the connection pool counters."""
+    response = await async_client.get("/api/v1/stats/pool")
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["size"] == 5
@@ -0,0 +1,150 @@
+"""Cache test cases."""
+
+from unittest import mock
+
+import pytest
+import redis
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.cache import Cache
+from monster_spawner.events.publisher import connections
+from monster_spawner.settings import settings
+
+MOB = schemas.MobOutSchema(
+    id="8b4f8b3e-7f5c-4d0a-9a4c-2a5c2f1e0b6d",
+    name="Enderman",
+    hostile=True,
+    health=40,
+    damage=7,
+    created_at="2022-03-01T12:00:00+00:00",
+    updated_at="2022-03-01T12:00:00+00:00",
+)
+
+
+def init_cache(use_redis: bool = False, ttl: float = 60) -> Cache:
+    """Shortcut for initializing a small mob cache."""
+    cache = Cache("test", schemas.MobOutSchema)
+    cache.stats.max_size = 2
+    cache.ttl = ttl
+    cache.use_redis = use_redis
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_and_miss():
+    """Check that hits and misses are counted."""
+    cache = init_cache()
+
+    assert await cache.get("lol") is None
+
+    await cache.set("lol", MOB)
+
+    assert await cache.get("lol") == MOB
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert Cache.registry["test"] is cache
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    """Check that the least recently used entry is evicted."""
+    cache = init_cache()
+    await cache.set("a", MOB)
+    await cache.set("b", MOB)
+    await cache.get("a")
+
+    await cache.set("c", MOB)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == MOB
+    assert cache.stats.evictions == 1
+    assert cache.stats.size == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_entries():
+    """Check that entries are not returned after their time to live."""
+    cache = init_cache(ttl=0)
+    await cache.set("lol", MOB)
+
+    assert await cache.get("lol") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_delete_and_clear():
+    """Check that entries can be invalidated and counters reset."""
+    cache = init_cache()
+    await cache.set("a", MOB)
+    await cache.set("b", MOB)
+
+    await cache.delete("a")
+
+    assert await cache.get("a") is None
+    assert cache.stats.size == 1
+
+    cache.clear()
+
+    assert cache.stats.misses == 0
+    assert cache.stats.max_size == 2
+    assert not cache.entries
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_stale_entries():
+    """Check that entries read before an invalidation are not cached."""
+    cache = init_cache()
+    generation = cache.generation
+
+    await cache.delete("lol")
+    await cache.set("lol", MOB, generation)
+    cache.clear()
+    await cache.set("kek", MOB, generation + 1)
+
+    assert not cache.entries
+    assert cache.generation == generation + 2
+
+
+@pytest.mark.asyncio
+@mock.patch.object(connections, "async_client", new_callable=mock.AsyncMock)
+async def test_cache_shared_tier(client: mock.AsyncMock):
+    """Check that local misses are read from redis and written back."""
+    client.get.side_effect = [MOB.json(), None]
+    cache = init_cache(use_redis=True)
+
+    assert await cache.get("lol") == MOB
+    assert await cache.get("kek") is None
+
+    await cache.set("kek", MOB)
+    await cache.delete("kek")
+
+    client.set.assert_awaited_once_with(
+        "cache:test:kek",
+        MOB.json(),
+        px=60000,
+    )
+    client.delete.assert_awaited_once_with("cache:test:kek")
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+@mock.patch.object(connections, "async_client", new_callable=mock.AsyncMock)
+async def test_cache_shared_tier_errors(client: mock.AsyncMock):
+    """Check that redis errors are treated as misses."""
+    client.get.side_effect = redis.exceptions.ConnectionError
+    client.set.side_effect = redis.exceptions.ConnectionError
+    client.delete.side_effect = redis.exceptions.ConnectionError
+    cache = init_cache(use_redis=True)
+
+    await cache.set("lol", MOB)
+    await cache.delete("lol")
+
+    assert await cache.get("lol") is None
+
+
+@mock.patch.object(settings, "CACHE_REDIS", True)
+def test_cache_shared_tier_enabled():
+    """Check that the redis tier is used when enabled."""
+    cache = Cache("test", schemas.MobOutSchema)
+
+    assert cache.client is connections.async_client
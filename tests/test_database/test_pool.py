@@ -0,0 +1,44 @@
+"""Connection pool test cases."""
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from monster_spawner.database.pool import InstrumentedPool
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_pool_stats():
+    """Check that checkouts and the pool state are counted."""
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=InstrumentedPool,
+    )
+    async with engine.connect():
+        stats = engine.sync_engine.pool.stats()
+
+    assert stats.checked_out == 1
+    assert stats.checkouts == 1
+    assert stats.wait_time >= 0
+    await engine.dispose()
+
+
+async def test_pool_timeouts():
+    """Check that checkouts timing out are counted."""
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=InstrumentedPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    async with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            await engine.connect().start()
+    stats = engine.sync_engine.pool.stats()
+
+    assert stats.timeouts == 1
+    assert stats.max_wait_time >= 0.01
+    await engine.dispose()
@@ -0,0 +1,134 @@
+"""Read replica routing test cases."""
+
+import asyncio
+import math
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from monster_spawner.database import models, sessions
+from monster_spawner.database.replicas import ReplicaSet
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+def init_replicas(count: int = 1) -> ReplicaSet:
+    """Shortcut for initializing replicas pointing to the test database."""
+    return ReplicaSet(
+        create_async_engine(settings.DATABASE_URL) for _ in range(count)
+    )
+
+
+async def test_replicas_round_robin():
+    """Check that replicas are chosen in turns, skipping lagging ones."""
+    replicas = init_replicas(3)
+    first, second, third = replicas.replicas
+    second.lag = math.inf
+
+    assert [replicas.choose() for _ in range(3)] == [first, third, first]
+
+    first.lag = third.lag = math.inf
+
+    assert replicas.choose() is None
+
+
+async def test_replicas_check_lag():
+    """Check that the lag is measured and unreachable replicas skipped."""
+    replicas = init_replicas()
+    unreachable = create_async_engine(
+        "postgresql+asyncpg://postgres@/lol?host=/tmp/lol",
+    )
+    replicas.replicas.extend(ReplicaSet([unreachable]).replicas)
+
+    await replicas.check_lag()
+
+    assert replicas.replicas[0].lag == 0
+    assert replicas.replicas[1].lag == math.inf
+
+
+async def test_replicas_monitor():
+    """Check that the lag monitor runs in the background until stopped."""
+    replicas = init_replicas()
+    replicas.check_interval = 0
+    replicas.replicas[0].lag = math.inf
+
+    replicas.start()
+    await asyncio.sleep(0.1)
+    await replicas.stop()
+    await replicas.stop()
+
+    assert replicas.replicas[0].lag == 0
+    assert replicas.task is None
+
+
+async def test_routing_session_reads_from_replica():
+    """Check that plain reads stick to a replica and locks go to primary."""
+    replicas = init_replicas(2)
+    replica = replicas.replicas[0]
+    engine, _ = sessions.get_connection(settings.DATABASE_URL)
+    read_session = sessions.get_read_sessionmaker(engine, replicas)
+
+    async with read_session() as session:
+        sync_session = session.sync_session
+        read = select(models.Mob)
+
+        assert (
+            sync_session.get_bind(clause=read)
+            is replica.autocommit_engine.sync_engine
+        )
+        assert (
+            sync_session.get_bind(
+                clause=read.with_for_update(),
+            )
+            is sync_session.bind
+        )
+        assert (
+            sync_session.get_bind(clause=read)
+            is replica.autocommit_engine.sync_engine
+        )
+
+
+async def test_write_session_stays_on_primary():
+    """Check that sessions which write never read from a replica."""
+    database = sessions.Database()
+    vars(database)["replicas"] = init_replicas()  # noqa: WPS421
+
+    async with database.session() as session:
+        bind = session.sync_session.get_bind(clause=select(models.Mob))
+
+    assert bind is database.engine.sync_engine
+    await database.dispose()
+
+
+async def test_routing_session_falls_back_to_primary():
+    """Check that reads stick to primary when every replica was lagging."""
+    replicas = init_replicas()
+    replicas.replicas[0].lag = math.inf
+    engine, _ = sessions.get_connection(settings.DATABASE_URL)
+    read_session = sessions.get_read_sessionmaker(engine, replicas)
+
+    async with read_session() as session:
+        sync_session = session.sync_session
+
+        assert (
+            sync_session.get_bind(
+                clause=select(models.Mob),
+            )
+            is sync_session.bind
+        )
+        replicas.replicas[0].lag = 0
+
+        assert (
+            sync_session.get_bind(
+                clause=insert(models.Mob),
+            )
+            is sync_session.bind
+        )
+        assert (
+            sync_session.get_bind(
+                clause=select(models.Mob),
+            )
+            is sync_session.bind
+        )
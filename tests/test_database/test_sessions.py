@@ -0,0 +1,44 @@
+"""Database session test cases."""
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import text
+
+from monster_spawner.database import sessions
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_read_session_autocommit():
+    """Check that read sessions do not open a transaction."""
+    engine, _ = sessions.get_connection(settings.DATABASE_URL)
+    read_session = sessions.get_read_sessionmaker(engine)
+
+    async with read_session() as session:
+        await session.execute(text("SELECT 1"))
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        assert not raw_connection.driver_connection.is_in_transaction()
+
+    await engine.dispose()
+
+
+@mock.patch.object(settings, "DATABASE_NAME", "")
+@mock.patch.object(settings, "DATABASE_REPLICA_URLS", "")
+async def test_database_lifecycle():
+    """Check that the engine is created on use and dropped on dispose."""
+    database = sessions.Database()
+
+    async with database.session() as session:
+        assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+    async with database.read_session() as session:
+        await session.execute(text("SELECT 1"))
+    engine = database.engine
+    await database.dispose()
+
+    assert not vars(database)
+    assert database.engine is not engine
+    await database.dispose()
@@ -0,0 +1,142 @@
+"""Mob catalogue test cases."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.domain.mob.catalogue import Catalogue
+
+NOW = datetime(2022, 4, 1)
+
+
+def create_mob(name: str, **fields) -> schemas.MobOutSchema:
+    """Shortcut for creating mob output data."""
+    data = {
+        "id": uuid.uuid4(),
+        "name": name,
+        "hostile": False,
+        "health": 100,
+        "damage": 10,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    data.update(fields)
+    return schemas.MobOutSchema(**data)
+
+
+SLIME = create_mob("Slime", health=20)
+ZOMBIE = create_mob("Zombie", hostile=True, damage=6)
+SKELETON = create_mob("Skeleton", hostile=True, damage=8)
+
+
+def init_catalogue() -> Catalogue:
+    """Shortcut for a catalogue loaded with a few mobs."""
+    catalogue = Catalogue()
+    catalogue.load([SLIME, ZOMBIE, SKELETON])
+    return catalogue
+
+
+def test_unloaded():
+    """Check that an unloaded catalogue ignores writes and has no reads."""
+    catalogue = Catalogue()
+    catalogue.put(SLIME)
+    catalogue.remove(SLIME.id)
+
+    assert not catalogue
+    assert catalogue.get(SLIME.id) is None
+    assert catalogue.collect() is None
+
+
+def test_get():
+    """Check that mobs are returned as output schemas."""
+    catalogue = init_catalogue()
+
+    assert catalogue.get(ZOMBIE.id) == ZOMBIE
+    assert catalogue.get(uuid.uuid4()) is None
+
+
+def test_put_replaces():
+    """Check that a mob is replaced along with its index entries."""
+    catalogue = init_catalogue()
+    renamed = create_mob("Creeper", id=SLIME.id, hostile=True)
+
+    catalogue.put(renamed)
+
+    assert len(catalogue) == 3
+    assert catalogue.get(SLIME.id) == renamed
+    assert catalogue.collect(name="Slime") == []
+    assert catalogue.collect(name="Creeper") == [renamed]
+    assert catalogue.collect(hostile=False) == []
+
+
+def test_remove():
+    """Check that the last record takes the place of a removed one."""
+    catalogue = init_catalogue()
+
+    catalogue.remove(SLIME.id)
+    catalogue.remove(SLIME.id)
+    catalogue.remove(ZOMBIE.id)
+
+    assert len(catalogue) == 1
+    assert catalogue.get(SKELETON.id) == SKELETON
+    assert catalogue.get(SLIME.id) is None
+    assert catalogue.collect(hostile=True) == [SKELETON]
+
+
+def test_remove_keeps_taken_name():
+    """Check that a stale record does not drop the name of a newer one."""
+    catalogue = init_catalogue()
+    newer = create_mob("Zombie")
+
+    catalogue.put(newer)
+    catalogue.remove(ZOMBIE.id)
+
+    assert catalogue.collect(name="Zombie") == [newer]
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, [SLIME, ZOMBIE, SKELETON]),
+        ({"name": "Zombie"}, [ZOMBIE]),
+        ({"name": "Creeper"}, []),
+        ({"name": "Zombie", "hostile": False}, []),
+        ({"hostile": False}, [SLIME]),
+        ({"health__lt": 50}, [SLIME]),
+        ({"health__between": (50, 100)}, [ZOMBIE, SKELETON]),
+        ({"damage__in": [6, 8]}, [ZOMBIE, SKELETON]),
+        ({"damage__gte": 8, "damage__lte": 9}, [SKELETON]),
+        ({"damage__gt": 6}, [SLIME, SKELETON]),
+        ({"name__startswith": "S"}, [SLIME, SKELETON]),
+        ({"name__istartswith": "sk"}, [SKELETON]),
+        ({"name__iexact": "slime"}, [SLIME]),
+    ],
+)
+def test_collect(filters: dict, expected: list[schemas.MobOutSchema]):
+    """Check that filters match like the repository lookups."""
+    catalogue = init_catalogue()
+
+    assert sorted(catalogue.collect(**filters), key=str) == sorted(
+        expected,
+        key=str,
+    )
+
+
+@pytest.mark.parametrize("name", ["colour", "name__contains"])
+def test_collect_unknown_filter(name: str):
+    """Check that unknown filters are left to the database."""
+    assert init_catalogue().collect(**{name: "green"}) is None
+
+
+def test_unload():
+    """Check that unloading drops the records and the indexes."""
+    catalogue = init_catalogue()
+
+    catalogue.unload()
+    catalogue.load([SLIME])
+
+    assert catalogue.collect(hostile=True) == []
+    assert catalogue.collect(name="Zombie") == []
+    assert len(catalogue) == 1
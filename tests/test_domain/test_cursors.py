@@ -0,0 +1,39 @@
+"""Keyset pagination cursors test cases."""
+
+import uuid
+
+import pytest
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.database import models
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.database import cursors
+
+
+def test_cursor_round_trip():
+    """Check that encoded cursor values are decoded back."""
+    mob_id = uuid.uuid4()
+
+    cursor = cursors.encode_cursor([mob_id, 10])
+
+    assert cursors.decode_cursor(cursor) == [str(mob_id), 10]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        cursors.encode_cursor({"id": 1}),  # type: ignore
+        cursors.encode_cursor([str(uuid.uuid4()), 1]),
+        cursors.encode_cursor(["not an uuid"]),
+    ],
+)
+def test_invalid_cursor(cursor: str):
+    """Check that malformed cursors are rejected."""
+    with pytest.raises(exceptions.InvalidCursorError):
+        cursors.create_keyset_expression(
+            models.Mob,
+            schemas.MobOutSchema,
+            ["id"],
+            cursor,
+        )
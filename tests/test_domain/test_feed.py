@@ -0,0 +1,205 @@
+"""Mob catalogue feed test cases."""
+
+import asyncio
+import json
+import typing as T  # noqa: WPS111,N812
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.cache import Cache
+from monster_spawner.database import sessions
+from monster_spawner.domain.events.incoming import DeleteMonster
+from monster_spawner.domain.mob import feed, invalidation
+from monster_spawner.domain.mob.catalogue import Catalogue
+from monster_spawner.domain.mob.repositories import MobRepository
+from monster_spawner.events import consumer
+from monster_spawner.events.streams import StreamMessage
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture()
+def feed_session(database_session: AsyncSession) -> T.Generator:
+    """Make the feed read through the test database session."""
+    session = mock.MagicMock()
+    session.return_value.__aenter__.return_value = database_session
+    with mock.patch.object(sessions.database, "session", session):
+        yield database_session
+
+
+def init_unloaded_feed() -> feed.CatalogueFeed:
+    """Shortcut for a feed of an unloaded catalogue."""
+    return feed.CatalogueFeed(Catalogue(), Cache("test", schemas.MobOutSchema))
+
+
+async def create_mob(session: AsyncSession, name: str) -> schemas.MobOutSchema:
+    """Shortcut for adding a mob to the database."""
+    repository = MobRepository(session=session)
+    return await repository.create(schemas.MobCreateSchema(name=name))
+
+
+def create_message(channel: str, pk: uuid.UUID) -> StreamMessage:
+    """Create a received message of a mob event."""
+    payload: dict[str, T.Any] = {"id": str(pk)}
+    if channel == "monster-created":
+        payload.update(name="", hostile=False, health=0, damage=0)
+    elif channel == "monster-updated":
+        payload.update(changes={"health": 1}, previous={"health": 0})
+    return StreamMessage(channel, "1-0", json.dumps(payload))
+
+
+def init_feed(*mobs: schemas.MobOutSchema) -> feed.CatalogueFeed:
+    """Shortcut for a feed of a catalogue loaded with the mobs."""
+    catalogue = Catalogue()
+    catalogue.load(mobs)
+    return feed.CatalogueFeed(catalogue, Cache("test", schemas.MobOutSchema))
+
+
+async def test_catch_up(feed_session: AsyncSession):
+    """Check that the catalogue is loaded with the whole table."""
+    mob = await create_mob(feed_session, "Slime")
+    catalogue_feed = init_unloaded_feed()
+
+    await catalogue_feed.catch_up()
+
+    assert catalogue_feed.catalogue.loaded
+    assert catalogue_feed.catalogue.get(mob.id) == mob
+
+
+async def test_catch_up_error():
+    """Check that the catalogue is left unloaded when the load fails."""
+    catalogue_feed = init_feed()
+
+    with mock.patch.object(
+        catalogue_feed,
+        "load",
+        side_effect=ConnectionRefusedError,
+    ):
+        await catalogue_feed.catch_up()
+
+    assert not catalogue_feed.catalogue.loaded
+
+
+@pytest.mark.parametrize("channel", ["monster-created", "monster-updated"])
+async def test_process_refreshes(feed_session: AsyncSession, channel: str):
+    """Check that created and updated mobs are read back."""
+    mob = await create_mob(feed_session, "Slime")
+    catalogue_feed = init_feed()
+
+    await catalogue_feed.process(create_message(channel, mob.id))
+
+    assert catalogue_feed.catalogue.get(mob.id) == mob
+
+
+async def test_process_missing(feed_session: AsyncSession):
+    """Check that a mob deleted in the meantime is removed."""
+    mob = await create_mob(feed_session, "Slime")
+    catalogue_feed = init_feed(mob)
+    await MobRepository(session=feed_session).delete(mob.id)
+
+    await catalogue_feed.process(create_message("monster-updated", mob.id))
+
+    assert catalogue_feed.catalogue.get(mob.id) is None
+
+
+async def test_process_deleted(feed_session: AsyncSession):
+    """Check that deleted mobs are removed without a database read."""
+    mob = await create_mob(feed_session, "Slime")
+    catalogue_feed = init_feed(mob)
+
+    await catalogue_feed.dispatch(create_message("monster-deleted", mob.id))
+
+    assert not catalogue_feed.catalogue
+    sessions.database.session.assert_not_called()
+
+
+async def test_apply_other_event():
+    """Check that events other than the mob ones are ignored."""
+    catalogue_feed = init_feed()
+
+    with mock.patch.object(catalogue_feed, "refresh") as mock_refresh:
+        await catalogue_feed.apply(DeleteMonster(id=uuid.uuid4()))
+
+    mock_refresh.assert_not_called()
+
+
+async def test_process_undecodable():
+    """Check that undecodable messages are skipped."""
+    catalogue_feed = init_feed()
+
+    await catalogue_feed.process(
+        StreamMessage("monster-created", "1-0", "not json"),
+    )
+
+    assert catalogue_feed.catalogue.loaded
+
+
+async def test_process_unloaded():
+    """Check that an unloaded catalogue is loaded instead."""
+    catalogue_feed = init_unloaded_feed()
+
+    with mock.patch.object(catalogue_feed, "load") as mock_load:
+        await catalogue_feed.process(
+            create_message("monster-deleted", uuid.uuid4()),
+        )
+
+    mock_load.assert_awaited_once()
+
+
+async def test_process_error():
+    """Check that the catalogue is unloaded when it cannot be synced."""
+    catalogue_feed = init_feed()
+
+    with mock.patch.object(
+        catalogue_feed,
+        "refresh",
+        side_effect=ConnectionRefusedError,
+    ):
+        await catalogue_feed.process(
+            create_message("monster-created", uuid.uuid4()),
+        )
+
+    assert not catalogue_feed.catalogue.loaded
+
+
+@mock.patch.object(
+    consumer.streams,
+    "get_last_ids",
+    new_callable=mock.AsyncMock,
+    return_value={"monster-deleted": "1-0"},
+)
+async def test_consume_streams(mock_get_last_ids: mock.AsyncMock):
+    """Check that the streams are read after the loaded snapshot."""
+    catalogue_feed = init_feed()
+    first = create_message("monster-deleted", uuid.uuid4())
+    second = StreamMessage("monster-deleted", "2-0", first.payload)
+    read = mock.AsyncMock(side_effect=[[first, second], asyncio.CancelledError])
+
+    with mock.patch.object(consumer.streams, "read_streams", read):
+        with mock.patch.object(catalogue_feed, "catch_up") as mock_catch_up:
+            with pytest.raises(asyncio.CancelledError):
+                await catalogue_feed.consume_streams()
+
+    mock_get_last_ids.assert_awaited_once_with(
+        list(invalidation.FEED_CHANNELS),
+    )
+    mock_catch_up.assert_awaited_once()
+    assert read.await_args_list[0] == mock.call(
+        {"monster-deleted": "2-0"},
+        settings.CONSUMER_BATCH_SIZE,
+        block=settings.CONSUMER_BLOCK,
+    )
+
+
+async def test_stop():
+    """Check that the catalogue is unloaded once the feed stops."""
+    catalogue_feed = init_feed()
+
+    await catalogue_feed.stop()
+
+    assert not catalogue_feed.catalogue.loaded
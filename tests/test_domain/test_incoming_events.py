@@ -0,0 +1,47 @@
+"""Incoming event handler test cases."""
+
+import contextlib
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.database import sessions
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.events import incoming
+from monster_spawner.domain.mob import repositories
+
+pytestmark = pytest.mark.asyncio
+
+
+def use_session(database_session: AsyncSession) -> mock._patch:
+    """Make the handlers use the test session."""
+    return mock.patch.object(
+        sessions.database,
+        "session",
+        lambda: contextlib.nullcontext(database_session),
+    )
+
+
+async def test_create_monster(database_session: AsyncSession):
+    """Check that the requested mob is created."""
+    with use_session(database_session):
+        await incoming.CreateMonster(name="Strider", health=20).handle()
+
+    mobs = await repositories.MobRepository(session=database_session).collect(
+        name="Strider",
+    )
+    assert [(mob.name, mob.health) for mob in mobs] == [("Strider", 20)]
+
+
+async def test_delete_monster(database_session: AsyncSession):
+    """Check that the requested mob is deleted."""
+    repository = repositories.MobRepository(session=database_session)
+    mob = await repository.create(schemas.MobCreateSchema(name="Hoglin"))
+
+    with use_session(database_session):
+        await incoming.DeleteMonster(id=mob.id).handle()
+
+    with pytest.raises(exceptions.DoesNotExistError):
+        await repository.get_by_id(mob.id)
@@ -0,0 +1,70 @@
+"""Mob cache invalidation test cases."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.cache import Cache
+from monster_spawner.domain.events.outgoing import (
+    MonsterCreated,
+    MonsterDeleted,
+    MonsterUpdated,
+)
+from monster_spawner.domain.mob.invalidation import CacheFeed
+
+pytestmark = pytest.mark.asyncio
+
+MOB = schemas.MobOutSchema(
+    id=uuid.uuid4(),
+    name="Slime",
+    hostile=False,
+    health=20,
+    damage=1,
+    created_at=datetime(2022, 4, 1),
+    updated_at=datetime(2022, 4, 1),
+)
+
+
+async def init_feed() -> CacheFeed:
+    """Shortcut for a feed of a cache holding a mob."""
+    cache = Cache("test", schemas.MobOutSchema)
+    await cache.set(str(MOB.id), MOB)
+    return CacheFeed(cache)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        MonsterUpdated(id=MOB.id, changes={"health": 1}, previous={}),
+        MonsterDeleted(id=MOB.id),
+    ],
+)
+async def test_apply_drops(event: MonsterUpdated | MonsterDeleted):
+    """Check that updated and deleted mobs are dropped from the cache."""
+    cache_feed = await init_feed()
+
+    await cache_feed.apply(event)
+
+    assert await cache_feed.cache.get(str(MOB.id)) is None
+
+
+async def test_apply_keeps_created():
+    """Check that created mobs leave the cache as it is."""
+    cache_feed = await init_feed()
+
+    await cache_feed.apply(
+        MonsterCreated(id=MOB.id, name="", hostile=False, health=0, damage=0),
+    )
+
+    assert await cache_feed.cache.get(str(MOB.id)) == MOB
+
+
+async def test_catch_up():
+    """Check that the cache is dropped, missed events are unknown."""
+    cache_feed = await init_feed()
+
+    await cache_feed.catch_up()
+
+    assert not cache_feed.cache.entries
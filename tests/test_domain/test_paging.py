@@ -0,0 +1,85 @@
+"""Mob catalogue paging test cases."""
+
+import pytest
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.mob import paging
+from monster_spawner.domain.mob.catalogue import Catalogue
+from monster_spawner.domain.mob.repositories import MobRepository
+from monster_spawner.domain.readers import PageRequest
+
+
+async def init_catalogue(session: AsyncSession) -> Catalogue:
+    """Shortcut for a catalogue loaded with a few mobs of the database."""
+    repository = MobRepository(session=session)
+    for number, health in enumerate((3, 1, 2, 1, 3)):
+        await repository.create(
+            schemas.MobCreateSchema(name=f"Slime {number}", health=health),
+        )
+    catalogue = Catalogue()
+    catalogue.load(await repository.collect())
+    return catalogue
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordering", ["id", "-id", "health", "-health"])
+@pytest.mark.parametrize("fields", [None, ["health"]])
+async def test_page_values_like_database(
+    database_session: AsyncSession,
+    ordering: str,
+    fields: list[str] | None,
+):
+    """Check that the pages and cursors match the database ones."""
+    catalogue = await init_catalogue(database_session)
+    pager = MobRepository(session=database_session).pager
+    request = PageRequest(limit=2, ordering=ordering, fields=fields)
+
+    pages = []
+    while request.cursor or not pages:
+        page = paging.page_values(catalogue, request, health__lt=3)
+        assert page == await pager.page_values(request, health__lt=3)
+        pages.append(page)
+        request = PageRequest(2, page.next_cursor, ordering, fields)
+
+    assert [len(page.items) for page in pages] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_page(database_session: AsyncSession):
+    """Check that the mobs are returned as output schemas."""
+    catalogue = await init_catalogue(database_session)
+    pager = MobRepository(session=database_session).pager
+    request = PageRequest(limit=3, ordering="-health")
+
+    assert paging.page(catalogue, request) == await pager.page(request)
+
+
+@pytest.mark.parametrize(
+    ("ordering", "filters"),
+    [("name", {}), ("id", {"color": "green"})],
+)
+def test_page_left_to_database(ordering: str, filters: dict):
+    """Check that the name order and unknown filters are not served."""
+    catalogue = Catalogue()
+    catalogue.load([])
+    request = PageRequest(limit=1, ordering=ordering)
+
+    assert paging.page(catalogue, request, **filters) is None
+    assert paging.page_values(catalogue, request, **filters) is None
+
+
+def test_page_unloaded():
+    """Check that an unloaded catalogue has no pages."""
+    assert paging.page_values(Catalogue(), PageRequest(limit=1)) is None
+
+
+def test_page_invalid_cursor():
+    """Check that cursors not matching the order are rejected."""
+    catalogue = Catalogue()
+    catalogue.load([])
+    request = PageRequest(limit=1, cursor="WzFd", ordering="health")
+
+    with pytest.raises(exceptions.InvalidCursorError):
+        paging.page_values(catalogue, request)
@@ -0,0 +1,83 @@
+"""Database queries helpers test cases."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.database import models
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.database import queries
+
+
+@pytest.mark.parametrize(
+    ("filters", "sql"),
+    [
+        ({"name": "Zombie"}, "mob.name = %(name_1)s"),
+        ({"health__gte": 20}, "mob.health >= %(health_1)s"),
+        (
+            {"health__between": (20, 80)},
+            "mob.health BETWEEN %(health_1)s AND %(health_2)s",
+        ),
+        ({"name__in": ["Zombie"]}, "mob.name IN (%(name_1_1)s)"),
+        (
+            {"name__istartswith": "Zom"},
+            "lower(mob.name) LIKE %(lower_1)s || '%%' ESCAPE '/'",
+        ),
+        (
+            {"name__startswith": "Zom"},
+            "mob.name LIKE %(name_1)s || '%%' ESCAPE '/'",
+        ),
+        ({"name__iexact": "zombie"}, "lower(mob.name) = %(lower_1)s"),
+    ],
+)
+def test_create_expressions(filters: dict, sql: str):
+    """Check that filter lookups are translated to SQL."""
+    (expression,) = queries.create_expressions(models.Mob, filters)
+    compiled = expression.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+
+    assert str(compiled) == sql
+
+
+@pytest.mark.parametrize("name", ["lol", "health__lol"])
+def test_create_expressions_invalid(name: str):
+    """Check that unknown fields and lookups are rejected."""
+    with pytest.raises(exceptions.InvalidFilterError):
+        queries.create_expressions(models.Mob, {name: 1})
+
+
+@pytest.mark.parametrize(
+    ("ordering", "fields", "descending"),
+    [
+        ("id", ["id"], False),
+        ("-damage", ["damage", "id"], True),
+    ],
+)
+def test_parse_ordering(ordering: str, fields: list[str], descending: bool):
+    """Check that the sort field is followed by the primary key."""
+    assert queries.parse_ordering(ordering) == (fields, descending)
+
+
+@pytest.mark.parametrize(
+    ("fields", "fieldset"),
+    [
+        (
+            None,
+            [
+                "id",
+                "name",
+                "hostile",
+                "health",
+                "damage",
+                "created_at",
+                "updated_at",
+            ],
+        ),
+        (["damage", "name"], ["id", "name", "damage"]),
+    ],
+)
+def test_create_fieldset(fields: list[str] | None, fieldset: list[str]):
+    """Check that the fieldset keeps the schema order and the id."""
+    assert queries.create_fieldset(schemas.MobOutSchema, fields) == fieldset
@@ -1,14 +1,21 @@
 """Mob sqlalchemy repository test cases."""
 
 import uuid
+import warnings
+from unittest import mock
 
 import pytest
+from sqlalchemy import delete
 from sqlalchemy import exc as sql_exceptions
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.sql import Select
 
 from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.database import models, sessions
 from monster_spawner.domain import exceptions as domain_exceptions
 from monster_spawner.domain.mob import repositories
+from monster_spawner.domain.readers import PageRequest
+from monster_spawner.settings import settings
 
 pytestmark = pytest.mark.asyncio
 
@@ -32,6 +39,91 @@ async def test_mob_create_not_unique(database_session: AsyncSession):
         await repo.create(data_object)
 
 
+async def test_mob_create_unique(database_session: AsyncSession):
+    """Test creating a mob with a unique name."""
+    repo = repositories.MobRepository(session=database_session)
+    data_object = schemas.MobCreateSchema(name="Skeleton")
+    mob = await repo.create_unique(data_object, "name")
+
+    assert mob.id is not None
+    assert mob.name == "Skeleton"
+
+
+async def test_mob_create_unique_conflict(database_session: AsyncSession):
+    """Test creating a mob with a name that already exists."""
+    repo = repositories.MobRepository(session=database_session)
+    data_object = schemas.MobCreateSchema(name="Skeleton")
+    mob = await repo.create_unique(data_object, "name")
+
+    with pytest.raises(domain_exceptions.AlreadyExistsError) as exc_info:
+        await repo.create_unique(data_object, "name")
+
+    assert exc_info.value.id == mob.id
+
+
+async def test_mob_create_unique_deleted_conflict(
+    database_session: AsyncSession,
+):
+    """Test creating a mob whose conflicting mob is deleted meanwhile."""
+    repo = repositories.MobRepository(session=database_session)
+    data_object = schemas.MobCreateSchema(name="Skeleton")
+    mob = await repo.create_unique(data_object, "name")
+    execute = database_session.execute
+
+    async def delete_before_lookup(query, *args, **kwargs):
+        if isinstance(query, Select):
+            await execute(delete(models.Mob))
+        return await execute(query, *args, **kwargs)
+
+    with mock.patch.object(
+        database_session,
+        "execute",
+        side_effect=delete_before_lookup,
+    ):
+        created = await repo.create_unique(data_object, "name")
+
+    assert created.id != mob.id
+    assert await repo.get_by_id(created.id) == created
+
+
+async def test_mob_create_many(database_session: AsyncSession):
+    """Test creating many mobs at once."""
+    repo = repositories.MobRepository(session=database_session)
+    data_objects = [
+        schemas.MobCreateSchema(name=f"Skeleton {i}") for i in range(3)
+    ]
+    mobs = await repo.create_many(data_objects)
+
+    assert {mob.name for mob in mobs} == {
+        "Skeleton 0",
+        "Skeleton 1",
+        "Skeleton 2",
+    }
+    assert all(mob.id is not None for mob in mobs)
+
+
+async def test_mob_create_many_conflict(database_session: AsyncSession):
+    """Test that mobs with taken names are skipped."""
+    repo = repositories.MobRepository(session=database_session)
+    await repo.create(schemas.MobCreateSchema(name="Slime"))
+
+    mobs = await repo.create_many(
+        [
+            schemas.MobCreateSchema(name="Slime"),
+            schemas.MobCreateSchema(name="Magma Cube"),
+        ],
+    )
+
+    assert [mob.name for mob in mobs] == ["Magma Cube"]
+
+
+async def test_mob_create_many_empty(database_session: AsyncSession):
+    """Test creating no mobs at once."""
+    repo = repositories.MobRepository(session=database_session)
+
+    assert await repo.create_many([]) == []
+
+
 async def test_mob_get(database_session: AsyncSession):
     """Test retrieving a mob."""
     repo = repositories.MobRepository(session=database_session)
@@ -106,11 +198,24 @@ async def test_mob_update(database_session: AsyncSession):
     data_object = schemas.MobCreateSchema(name="Skeleton")
     mob = await repo.create(data_object)
 
-    await repo.update(mob.id, schemas.MobUpdateSchema(name="Skeleton 2"))
-
-    updated_mob = await repo.get_by_id(mob.id)
+    previous, updated_mob = await repo.update(
+        mob.id,
+        schemas.MobUpdateSchema(name="Skeleton 2"),
+    )
 
+    assert previous == mob
     assert updated_mob.name == "Skeleton 2"
+    assert await repo.get_by_id(mob.id) == updated_mob
+
+
+async def test_mob_update_without_warnings(database_session: AsyncSession):
+    """Test that updating a mob emits no SQLAlchemy warning."""
+    repo = repositories.MobRepository(session=database_session)
+    mob = await repo.create(schemas.MobCreateSchema(name="Skeleton"))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", sql_exceptions.SAWarning)
+        await repo.update(mob.id, schemas.MobUpdateSchema(health=1))
 
 
 async def test_mob_update_not_unique_name(database_session: AsyncSession):
@@ -120,11 +225,32 @@ async def test_mob_update_not_unique_name(database_session: AsyncSession):
     slime_object = schemas.MobCreateSchema(name="Slime")
     skeleton_object = schemas.MobCreateSchema(name="Skeleton")
     slime = await repo.create(slime_object)
-    await repo.create(skeleton_object)
+    skeleton = await repo.create(skeleton_object)
 
-    with pytest.raises(sql_exceptions.IntegrityError):
+    with pytest.raises(domain_exceptions.AlreadyExistsError) as exc_info:
         await repo.update(slime.id, schemas.MobUpdateSchema(name="Skeleton"))
 
+    assert exc_info.value.id == skeleton.id
+
+
+async def test_mob_update_not_null(database_session: AsyncSession):
+    """Test updating a mob with a missing required value."""
+    repo = repositories.MobRepository(session=database_session)
+    mob = await repo.create(schemas.MobCreateSchema(name="Slime"))
+
+    with pytest.raises(sql_exceptions.IntegrityError):
+        await repo.update(mob.id, schemas.MobUpdateSchema(name=None))
+
+
+async def test_mob_update_nothing(database_session: AsyncSession):
+    """Test updating a mob without any changes."""
+    repo = repositories.MobRepository(session=database_session)
+    mob = await repo.create(schemas.MobCreateSchema(name="Slime"))
+
+    previous, updated_mob = await repo.update(mob.id, schemas.MobUpdateSchema())
+
+    assert previous == updated_mob == mob
+
 
 async def test_mob_update_not_existing(database_session: AsyncSession):
     """Test updating a mob that does not exist."""
@@ -134,3 +260,223 @@ async def test_mob_update_not_existing(database_session: AsyncSession):
         await repo.update(
             uuid.uuid4(), schemas.MobUpdateSchema(name="Skeleton")
         )
+
+
+async def test_mob_collect_in(database_session: AsyncSession):
+    """Test retrieving the mobs with any of the given names."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 3 mobs to the database
+    for i in range(3):
+        data_object = schemas.MobCreateSchema(name=f"Skeleton {i}")
+        await repo.create(data_object)
+
+    mobs = await repo.collect_in("name", ["Skeleton 0", "Skeleton 2", "Lol"])
+
+    assert {mob.name for mob in mobs} == {"Skeleton 0", "Skeleton 2"}
+
+
+async def test_mob_page(database_session: AsyncSession):
+    """Test retrieving the mobs page by page."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 5 mobs to the database
+    for i in range(5):
+        data_object = schemas.MobCreateSchema(name=f"Skeleton {i}")
+        await repo.create(data_object)
+
+    first_page = await repo.pager.page(PageRequest(limit=2))
+    second_page = await repo.pager.page(
+        PageRequest(limit=2, cursor=first_page.next_cursor),
+    )
+    last_page = await repo.pager.page(
+        PageRequest(limit=2, cursor=second_page.next_cursor),
+    )
+    ids = [
+        mob.id
+        for page in (first_page, second_page, last_page)
+        for mob in page.items
+    ]
+
+    assert len(first_page.items) == 2
+    assert len(last_page.items) == 1
+    assert last_page.next_cursor is None
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 5
+
+
+async def test_mob_stream(database_session: AsyncSession):
+    """Test streaming all the mobs in chunks."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 5 mobs to the database
+    for i in range(5):
+        data_object = schemas.MobCreateSchema(name=f"Skeleton {i}")
+        await repo.create(data_object)
+
+    chunks = [chunk async for chunk in repo.scanner.stream(chunk_size=2)]
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+async def test_mob_stream_with_filter(database_session: AsyncSession):
+    """Test streaming the mobs with a filter applied."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 3 mobs to the database
+    for i in range(3):
+        data_object = schemas.MobCreateSchema(name=f"Skeleton {i}")
+        await repo.create(data_object)
+
+    chunks = [
+        chunk
+        async for chunk in repo.scanner.stream(chunk_size=2, name="Skeleton 1")
+    ]
+
+    assert len(chunks) == 1
+    assert chunks[0][0].name == "Skeleton 1"
+
+
+async def test_mob_page_ordered(database_session: AsyncSession):
+    """Test retrieving the mobs page by page in descending order."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 5 mobs to the database, two of them with the same damage
+    for i in range(5):
+        data_object = schemas.MobCreateSchema(
+            name=f"Skeleton {i}",
+            damage=min(i, 3),
+        )
+        await repo.create(data_object)
+
+    first_page = await repo.pager.page(
+        PageRequest(limit=2, ordering="-damage"),
+    )
+    second_page = await repo.pager.page(
+        PageRequest(
+            limit=2,
+            cursor=first_page.next_cursor,
+            ordering="-damage",
+        ),
+    )
+    last_page = await repo.pager.page(
+        PageRequest(
+            limit=2,
+            cursor=second_page.next_cursor,
+            ordering="-damage",
+        ),
+    )
+    mobs = first_page.items + second_page.items + last_page.items
+
+    assert [mob.damage for mob in mobs] == [3, 3, 2, 1, 0]
+    assert len({mob.id for mob in mobs}) == 5
+
+
+async def test_mob_page_with_lookups(database_session: AsyncSession):
+    """Test retrieving a page of mobs with range and prefix filters."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 5 mobs to the database
+    for i in range(5):
+        data_object = schemas.MobCreateSchema(
+            name=f"Skeleton {i}",
+            health=i * 20,
+            hostile=i % 2 == 0,
+        )
+        await repo.create(data_object)
+
+    page = await repo.pager.page(
+        PageRequest(limit=10, ordering="health"),
+        hostile=True,
+        health__between=(20, 80),
+        name__istartswith="skeleton",
+    )
+
+    assert [mob.name for mob in page.items] == ["Skeleton 2", "Skeleton 4"]
+
+
+async def test_mob_page_values(database_session: AsyncSession):
+    """Test retrieving a page of mobs with a sparse fieldset."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 3 mobs to the database
+    for i in range(3):
+        data_object = schemas.MobCreateSchema(name=f"Skeleton {i}", health=i)
+        await repo.create(data_object)
+
+    first_page = await repo.pager.page_values(
+        PageRequest(limit=2, ordering="-health", fields=["name"]),
+    )
+    last_page = await repo.pager.page_values(
+        PageRequest(
+            limit=2,
+            cursor=first_page.next_cursor,
+            ordering="-health",
+            fields=["name"],
+        ),
+    )
+    mobs = first_page.items + last_page.items
+
+    assert [set(mob) for mob in mobs] == [{"id", "name"}] * 3
+    assert [mob["name"] for mob in mobs] == [
+        "Skeleton 2",
+        "Skeleton 1",
+        "Skeleton 0",
+    ]
+
+
+async def test_mob_version(database_session: AsyncSession):
+    """Test that every write bumps the table version."""
+    repo = repositories.MobRepository(session=database_session)
+    initial = await repo.scanner.version()
+
+    mob = await repo.create(schemas.MobCreateSchema(name="Skeleton"))
+    created = await repo.scanner.version()
+    await repo.delete(mob.id)
+
+    assert initial == 0
+    assert created > initial
+    assert await repo.scanner.version() > created
+
+
+async def test_mob_version_uncommitted(database_session: AsyncSession):
+    """Test that the version of a write is hidden until it commits."""
+    repo = repositories.MobRepository(session=database_session)
+    await repo.create_unique(schemas.MobCreateSchema(name="Skeleton"), "name")
+    engine, async_session = sessions.get_connection(settings.DATABASE_URL)
+
+    async with async_session() as session:
+        reader = repositories.MobRepository(session=session)
+        version = await reader.scanner.version()
+    await engine.dispose()
+
+    assert await repo.scanner.version() > 0
+    assert version == 0
+
+
+async def test_mob_page_with_filter(database_session: AsyncSession):
+    """Test retrieving a page of mobs with a filter applied."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 3 mobs to the database
+    for i in range(3):
+        data_object = schemas.MobCreateSchema(name=f"Skeleton {i}")
+        await repo.create(data_object)
+
+    page = await repo.pager.page(PageRequest(limit=2), name="Skeleton 1")
+
+    assert [mob.name for mob in page.items] == ["Skeleton 1"]
+    assert page.next_cursor is None
+
+
+async def test_mob_collect_with_lookups(database_session: AsyncSession):
+    """Test retrieving mobs with bound and escaped filters."""
+    repo = repositories.MobRepository(session=database_session)
+    # Add 3 mobs to the database
+    mobs = [
+        await repo.create(
+            schemas.MobCreateSchema(name=f"Skeleton {i}", health=i),
+        )
+        for i in range(3)
+    ]
+
+    bound = await repo.collect(
+        id__in=[mobs[0].id, mobs[2].id],
+        health__gte=1,
+    )
+    escaped = await repo.collect(name__startswith="Skeleton", health__lt=2)
+
+    assert [mob.name for mob in bound] == ["Skeleton 2"]
+    assert {mob.name for mob in escaped} == {"Skeleton 0", "Skeleton 1"}
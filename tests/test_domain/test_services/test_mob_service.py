@@ -1,23 +1,33 @@
 """Mob service test cases."""
 
 import uuid
+from unittest import mock
 
 import pytest
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from monster_spawner.api.v1.mobs import schemas
+from monster_spawner.cache import Cache
 from monster_spawner.domain import exceptions
 from monster_spawner.domain.database import transactions
+from monster_spawner.domain.events.outgoing import MonsterUpdated
 from monster_spawner.domain.mob import repositories, services
+from monster_spawner.domain.mob.catalogue import Catalogue
+from monster_spawner.domain.readers import PageRequest
 
 pytestmark = pytest.mark.asyncio
 
 
-def init_mob_service(database_session: AsyncSession) -> services.MobService:
+def init_mob_service(
+    database_session: AsyncSession,
+    catalogue: Catalogue | None = None,
+) -> services.MobService:
     """Shortcut for initializing MobService."""
     return services.MobService(
         transaction=transactions.DatabaseTransaction(session=database_session),
         repository=repositories.MobRepository(session=database_session),
+        cache=Cache("test-mobs", schemas.MobOutSchema),
+        catalogue=catalogue,
     )
 
 
@@ -40,6 +50,48 @@ async def test_mob_create_not_unique(database_session: AsyncSession):
         await mob_srv.create(data_object)
 
 
+async def test_mob_create_many(database_session: AsyncSession):
+    """Test creating many mobs with conflicting names."""
+    mob_srv = init_mob_service(database_session)
+    slime = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+    data_objects = [
+        schemas.MobCreateSchema(name="Slime"),
+        schemas.MobCreateSchema(name="Magma Cube"),
+        schemas.MobCreateSchema(name="Magma Cube"),
+    ]
+
+    results = await mob_srv.create_many(data_objects)
+
+    assert [result.status for result in results] == [
+        schemas.BulkStatus.CONFLICT,
+        schemas.BulkStatus.CREATED,
+        schemas.BulkStatus.CONFLICT,
+    ]
+    assert results[0].id == slime.id
+    assert results[1].id == results[2].id
+
+
+async def test_mob_create_many_deleted_conflict(
+    database_session: AsyncSession,
+):
+    """Test creating mobs whose conflicting mob is deleted meanwhile."""
+    mob_srv = init_mob_service(database_session)
+    await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+    data_objects = [
+        schemas.MobCreateSchema(name="Slime"),
+        schemas.MobCreateSchema(name="Magma Cube"),
+    ]
+
+    with mock.patch.object(mob_srv.repository, "collect_in", return_value=[]):
+        results = await mob_srv.create_many(data_objects)
+
+    assert [result.status for result in results] == [
+        schemas.BulkStatus.SKIPPED,
+        schemas.BulkStatus.CREATED,
+    ]
+    assert results[0].id is None
+
+
 async def test_mob_get(database_session: AsyncSession):
     """Test retrieving a mob."""
     mob_srv = init_mob_service(database_session)
@@ -52,6 +104,93 @@ async def test_mob_get(database_session: AsyncSession):
     assert retrieved_mob.name == mob.name
 
 
+async def test_mob_get_cached(database_session: AsyncSession):
+    """Test retrieving a mob from the cache."""
+    mob_srv = init_mob_service(database_session)
+    mob = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+    await mob_srv.get(mob.id)
+
+    with mock.patch.object(mob_srv.repository, "get_by_id") as mock_get:
+        cached_mob = await mob_srv.get(mob.id)
+
+    mock_get.assert_not_called()
+    assert cached_mob == mob
+    assert mob_srv.cache.stats.hits == 1
+    assert mob_srv.cache.stats.misses == 1
+
+
+async def test_mob_update_invalidates_cache(database_session: AsyncSession):
+    """Test that updating a mob drops it from the cache."""
+    mob_srv = init_mob_service(database_session)
+    mob = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+    await mob_srv.get(mob.id)
+
+    await mob_srv.update(mob.id, schemas.MobUpdateSchema(health=1))
+    retrieved_mob = await mob_srv.get(mob.id)
+
+    assert retrieved_mob.health == 1
+
+
+async def test_mob_delete_invalidates_cache(database_session: AsyncSession):
+    """Test that deleting a mob drops it from the cache."""
+    mob_srv = init_mob_service(database_session)
+    mob = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+    await mob_srv.get(mob.id)
+
+    await mob_srv.delete(mob.id)
+
+    with pytest.raises(exceptions.DoesNotExistError):
+        await mob_srv.get(mob.id)
+
+
+async def test_mob_update_event(database_session: AsyncSession):
+    """Test that updating a mob sends the updated mob out."""
+    mob_srv = init_mob_service(database_session)
+    mob = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+
+    with mock.patch.object(mob_srv.transaction, "add_event") as mock_add:
+        await mob_srv.update(mob.id, schemas.MobUpdateSchema(health=1))
+
+    event = mock_add.call_args.args[0]
+    assert isinstance(event, MonsterUpdated)
+    assert event.id == mob.id
+    assert event.changes == {"health": 1}
+    assert event.previous == {"health": 100}
+
+
+async def test_mob_update_unchanged(database_session: AsyncSession):
+    """Test that an update changing nothing sends no event."""
+    mob_srv = init_mob_service(database_session)
+    mob = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+
+    with mock.patch.object(mob_srv.transaction, "add_event") as mock_add:
+        await mob_srv.update(mob.id, schemas.MobUpdateSchema(name="Slime"))
+
+    mock_add.assert_not_called()
+
+
+async def test_mob_catalogue(database_session: AsyncSession):
+    """Test that a loaded catalogue serves reads and follows writes."""
+    catalogue = Catalogue()
+    catalogue.load([])
+    mob_srv = init_mob_service(database_session, catalogue)
+    slime = await mob_srv.create(schemas.MobCreateSchema(name="Slime"))
+    await mob_srv.create_many([schemas.MobCreateSchema(name="Zombie")])
+    slime = await mob_srv.update(slime.id, schemas.MobUpdateSchema(health=1))
+
+    with mock.patch.object(mob_srv, "repository") as mock_repository:
+        assert await mob_srv.get(slime.id) == slime
+        assert list(await mob_srv.get_all(health__lt=10)) == [slime]
+        page = await mob_srv.get_page(PageRequest(limit=1))
+        values = await mob_srv.get_page_values(PageRequest(limit=1))
+    await mob_srv.delete(slime.id)
+
+    mock_repository.collect.assert_not_called()
+    assert len(page.items) == 1
+    assert values.items == [page.items[0].dict()]
+    assert [mob.name for mob in catalogue.collect()] == ["Zombie"]
+
+
 async def test_mob_get_not_existing(database_session: AsyncSession):
     """Test retrieving a mob that does not exist."""
     mob_srv = init_mob_service(database_session)
@@ -140,3 +279,30 @@ async def test_mob_update_not_unique(database_session: AsyncSession):
     data_object = schemas.MobUpdateSchema(name="Skeleton")
     with pytest.raises(exceptions.AlreadyExistsError):
         await mob_srv.update(slime.id, data_object)
+
+
+async def test_mob_page(database_session: AsyncSession):
+    """Test retrieving a page of mobs."""
+    mob_srv = init_mob_service(database_session)
+    # Add 3 mobs to the database
+    for i in range(3):
+        data_object = schemas.MobCreateSchema(name=f"Slime {i}")
+        await mob_srv.create(data_object)
+
+    page = await mob_srv.get_page(PageRequest(limit=2))
+
+    assert len(page.items) == 2
+    assert page.next_cursor is not None
+
+
+async def test_mob_export(database_session: AsyncSession):
+    """Test exporting all mobs in chunks."""
+    mob_srv = init_mob_service(database_session)
+    # Add 3 mobs to the database
+    for i in range(3):
+        data_object = schemas.MobCreateSchema(name=f"Slime {i}")
+        await mob_srv.create(data_object)
+
+    chunks = [chunk async for chunk in mob_srv.export(chunk_size=2)]
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
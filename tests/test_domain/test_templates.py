@@ -0,0 +1,69 @@
+"""Query templates test cases."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from monster_spawner.database import models
+from monster_spawner.domain import readers
+from monster_spawner.domain.database import templates
+
+
+def test_template_reused():
+    """Check that filters on the same fields share a template."""
+    first = templates.Shape(models.Mob, tuple(sorted({"name", "health__gte"})))
+    second = templates.Shape(models.Mob, ("health__gte", "name"))
+
+    assert templates.get_select(first) is templates.get_select(second)
+
+
+@pytest.mark.parametrize(
+    ("filters", "sql"),
+    [
+        (("name",), "mob.name = %(name)s"),
+        (("health__lte",), "mob.health <= %(health__lte)s"),
+        (("name__in",), "mob.name IN (__[POSTCOMPILE_name__in])"),
+    ],
+)
+def test_template_parameters(filters: tuple[str, ...], sql: str):
+    """Check that the filter values are parameters named as the filters."""
+    query = templates.get_select(templates.Shape(models.Mob, filters))
+
+    assert sql in str(query.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [("name__startswith",), ("health", "health__between")],
+)
+def test_template_not_bound(filters: tuple[str, ...]):
+    """Check that filters depending on their values get no template."""
+    assert templates.get_select(templates.Shape(models.Mob, filters)) is None
+
+
+def test_page_template():
+    """Check that the limit and the cursor are parameters."""
+    shape = templates.PageShape.create(
+        models.Mob,
+        ["id", "name"],
+        readers.PageRequest(limit=1, cursor="cursor", ordering="-health"),
+        {"hostile": True},
+    )
+
+    sql = str(
+        templates.get_page_select(shape).compile(
+            dialect=postgresql.dialect(),
+        ),
+    )
+
+    assert shape.columns == ("id", "name", "health")
+    assert "(mob.health, mob.id) < (%(cursor_health)s, %(cursor_id)s)" in sql
+    assert "LIMIT %(limit)s" in sql
+
+
+def test_create_parameters():
+    """Check that choices are bound as lists."""
+    parameters = templates.create_parameters(
+        {"name__in": ("Zombie",), "health": 20},
+    )
+
+    assert parameters == {"name__in": ["Zombie"], "health": 20}
@@ -0,0 +1,56 @@
+"""Database transaction test cases."""
+
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from monster_spawner.database import models
+from monster_spawner.domain.database import transactions
+from monster_spawner.domain.events.outgoing import MonsterDeleted
+from monster_spawner.events.bus import EventBus
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_commit_stores_events(database_session: AsyncSession):
+    """Check that events are written to the outbox on commit."""
+    transaction = transactions.DatabaseTransaction(session=database_session)
+    transaction.add_event(MonsterDeleted(id=uuid.uuid4()))
+
+    await transaction.commit()
+    entries = await database_session.execute(select(models.Outbox))
+
+    assert len(list(entries.scalars())) == 1
+    assert not transaction.events
+
+
+@mock.patch.object(settings, "EVENTS_OUTBOX", False)
+@mock.patch.object(EventBus, "publish_many", new_callable=mock.AsyncMock)
+async def test_commit_publishes_events(
+    mock_publish: mock.AsyncMock,
+    database_session: AsyncSession,
+):
+    """Check that events are published after commit without the outbox."""
+    transaction = transactions.DatabaseTransaction(session=database_session)
+    event = MonsterDeleted(id=uuid.uuid4())
+    transaction.add_event(event)
+
+    await transaction.commit()
+    entries = await database_session.execute(select(models.Outbox))
+
+    mock_publish.assert_awaited_once_with([event])
+    assert not list(entries.scalars())
+
+
+async def test_rollback_drops_events(database_session: AsyncSession):
+    """Check that events are not kept after rollback."""
+    transaction = transactions.DatabaseTransaction(session=database_session)
+    transaction.add_event(MonsterDeleted(id=uuid.uuid4()))
+
+    await transaction.rollback()
+
+    assert not transaction.events
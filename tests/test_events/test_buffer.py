@@ -0,0 +1,116 @@
+"""Event buffer test cases."""
+
+import asyncio
+import json
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+import redis
+
+from monster_spawner.domain.events.event_types import Event
+from monster_spawner.events import buffer
+from monster_spawner.events.bus import EventBus, eventclass
+
+pytestmark = pytest.mark.asyncio
+
+
+def init_buffer(
+    max_size: int = 3,
+    flush_interval: float = 60,
+) -> buffer.EventBuffer:
+    """Shortcut for initializing a small event buffer."""
+    event_buffer = buffer.EventBuffer()
+    event_buffer.max_size = max_size
+    event_buffer.flush_interval = flush_interval
+    return event_buffer
+
+
+@mock.patch.object(buffer, "publish_messages", new_callable=mock.AsyncMock)
+async def test_flush_on_size(mock_publish: mock.AsyncMock):
+    """Check that a full buffer is published in one pipeline."""
+    event_buffer = init_buffer()
+
+    await event_buffer.add([("a", "1"), ("b", "1")])
+    mock_publish.assert_not_awaited()
+    await event_buffer.add([("a", "2")])
+
+    mock_publish.assert_awaited_once_with([("a", "1"), ("b", "1"), ("a", "2")])
+    assert not event_buffer.messages
+
+
+@mock.patch.object(buffer, "publish_messages", new_callable=mock.AsyncMock)
+async def test_flush_on_time(mock_publish: mock.AsyncMock):
+    """Check that the background task flushes the buffer periodically."""
+    event_buffer = init_buffer(flush_interval=0)
+    event_buffer.start()
+
+    await event_buffer.add([("a", "1")])
+    await asyncio.sleep(0.01)
+    await event_buffer.stop()
+
+    mock_publish.assert_awaited_once_with([("a", "1")])
+
+
+async def test_flush_order():
+    """Check that concurrent flushes publish the messages in order."""
+    published = []
+
+    async def publish_slowly(messages: list[tuple[str, str]]) -> None:
+        await asyncio.sleep(0.01 / len(published + [messages]))
+        published.extend(messages)
+
+    event_buffer = init_buffer(max_size=1)
+    with mock.patch.object(buffer, "publish_messages", publish_slowly):
+        await asyncio.gather(
+            *(event_buffer.add([("a", str(index))]) for index in range(5)),
+        )
+
+    assert published == [("a", str(index)) for index in range(5)]
+
+
+@mock.patch.object(buffer, "publish_messages", new_callable=mock.AsyncMock)
+async def test_flush_empty(mock_publish: mock.AsyncMock):
+    """Check that an empty buffer is not published."""
+    await init_buffer().stop()
+
+    mock_publish.assert_not_awaited()
+
+
+@mock.patch.object(
+    buffer,
+    "publish_messages",
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_flush_connection_error(mock_publish: mock.AsyncMock):
+    """Check that a batch which cannot be published is dropped."""
+    event_buffer = init_buffer(max_size=1)
+
+    await event_buffer.add([("a", "1")])
+
+    mock_publish.assert_awaited_once()
+    assert not event_buffer.messages
+
+
+async def test_event_bus_buffer():
+    """Check that the event bus hands the events over to its buffer."""
+    event_type = "hollow-knight-silksong-released"
+    mocked_enum = mock.MagicMock(value=event_type)
+
+    @eventclass(mocked_enum)
+    class SilksongReleased(Event):
+        name: str
+
+        async def handle(self) -> None:
+            ...
+
+    events = [SilksongReleased(name="a"), SilksongReleased(name="b")]
+    event_buffer = init_buffer(max_size=10)
+    with mock.patch.object(EventBus, "buffer", event_buffer):
+        await EventBus.publish(events[0])
+        await EventBus.publish_many(events)
+
+    assert event_buffer.messages == [
+        (event_type, json.dumps(asdict(event), default=str))
+        for event in (events[0], *events)
+    ]
@@ -0,0 +1,251 @@
+"""Incoming event consumer test cases."""
+
+import asyncio
+import json
+import uuid
+from unittest import mock
+
+import pytest
+import redis
+
+from monster_spawner.domain import exceptions
+from monster_spawner.domain.events.incoming import DeleteMonster
+from monster_spawner.events import consumer
+from monster_spawner.events.streams import StreamMessage
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+MOB_ID = uuid.uuid4()
+MESSAGE = StreamMessage(
+    "delete-monster", "1-0", json.dumps({"id": str(MOB_ID)})
+)
+
+
+def init_consumer(concurrency: int = 2) -> consumer.EventConsumer:
+    """Shortcut for initializing a consumer of the incoming channels."""
+    with mock.patch.object(settings, "CONSUMER_CONCURRENCY", concurrency):
+        event_consumer = consumer.EventConsumer(["delete-monster"])
+    return event_consumer
+
+
+@pytest.mark.parametrize(
+    "channel, payload",
+    [
+        ("not-registered", "{}"),
+        ("delete-monster", "not json"),
+        ("delete-monster", '{"id": "not an uuid"}'),
+        ("delete-monster", "[]"),
+    ],
+)
+async def test_decode_invalid(channel: str, payload: str):
+    """Check that messages which cannot be decoded are skipped."""
+    assert init_consumer().decode(channel, payload) is None
+
+
+async def test_decode():
+    """Check that messages are decoded into the registered events."""
+    event = init_consumer().decode(MESSAGE.channel, MESSAGE.payload)
+
+    assert isinstance(event, DeleteMonster)
+    assert event.id == MOB_ID
+
+
+@pytest.mark.parametrize(
+    "side_effect, done",
+    [
+        (None, True),
+        (exceptions.DoesNotExistError(MOB_ID), True),
+        (RuntimeError("lol"), False),
+    ],
+)
+async def test_handle(side_effect: Exception | None, done: bool):
+    """Check that only failed events are worth a retry."""
+    with mock.patch.object(
+        DeleteMonster,
+        "handle",
+        new_callable=mock.AsyncMock,
+        side_effect=side_effect,
+    ) as mock_handle:
+        assert await init_consumer().handle(MESSAGE) is done
+
+    mock_handle.assert_awaited_once()
+
+
+async def test_handle_undecodable():
+    """Check that undecodable messages are done with."""
+    message = StreamMessage("delete-monster", "1-0", "lol")
+
+    assert await init_consumer().handle(message)
+
+
+@pytest.mark.parametrize(
+    "message, done, acknowledged",
+    [
+        (MESSAGE, True, True),
+        (MESSAGE, False, False),
+        (StreamMessage(MESSAGE.channel, "", MESSAGE.payload), True, False),
+    ],
+)
+@mock.patch.object(consumer.groups, "acknowledge", new_callable=mock.AsyncMock)
+async def test_process(
+    mock_acknowledge: mock.AsyncMock,
+    message: StreamMessage,
+    done: bool,
+    acknowledged: bool,
+):
+    """Check that stream messages are acknowledged when done with."""
+    event_consumer = init_consumer()
+
+    with mock.patch.object(event_consumer, "handle", return_value=done):
+        await event_consumer.process(message)
+
+    assert mock_acknowledge.await_count == int(acknowledged)
+
+
+@mock.patch.object(
+    consumer.groups,
+    "acknowledge",
+    new_callable=mock.AsyncMock,
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_process_acknowledge_error(mock_acknowledge: mock.AsyncMock):
+    """Check that acknowledging errors are logged, not raised."""
+    event_consumer = init_consumer()
+
+    with mock.patch.object(event_consumer, "handle", return_value=True):
+        await event_consumer.process(MESSAGE)
+
+    mock_acknowledge.assert_awaited_once()
+
+
+async def test_dispatch_backpressure():
+    """Check that dispatching waits for a free slot."""
+    event_consumer = init_consumer(concurrency=1)
+    release = asyncio.Event()
+
+    async def handle_slowly(message: StreamMessage) -> None:
+        await release.wait()
+
+    with mock.patch.object(event_consumer, "process", handle_slowly):
+        await event_consumer.dispatch(MESSAGE)
+        second = asyncio.create_task(event_consumer.dispatch(MESSAGE))
+        await asyncio.sleep(0)
+
+        assert not second.done()
+        release.set()
+        await second
+        await event_consumer.handlers.drain()
+
+    assert not event_consumer.handlers.running
+
+
+@mock.patch.object(settings, "EVENTS_STREAMS", True)
+@mock.patch.object(consumer.groups, "acknowledge", new_callable=mock.AsyncMock)
+@mock.patch.object(consumer.groups, "create_group", new_callable=mock.AsyncMock)
+async def test_consume_streams(
+    mock_create_group: mock.AsyncMock,
+    mock_acknowledge: mock.AsyncMock,
+):
+    """Check that pending messages are replayed before the new ones."""
+    event_consumer = init_consumer()
+    second = StreamMessage(MESSAGE.channel, "2-0", MESSAGE.payload)
+    read = mock.AsyncMock(
+        side_effect=[[MESSAGE], [second], asyncio.CancelledError],
+    )
+
+    with mock.patch.object(consumer.groups, "read_group", read):
+        with mock.patch.object(DeleteMonster, "handle"):
+            event_consumer.start()
+            await asyncio.gather(event_consumer.task, return_exceptions=True)
+            await event_consumer.stop()
+
+    mock_create_group.assert_awaited_once_with(
+        settings.CONSUMER_GROUP,
+        ["delete-monster"],
+        start="0",
+    )
+    assert read.await_args_list[0].kwargs == {"pending": True}
+    assert read.await_args_list[1].kwargs == {"block": settings.CONSUMER_BLOCK}
+    assert mock_acknowledge.await_args_list == [
+        mock.call(settings.CONSUMER_GROUP, [MESSAGE]),
+        mock.call(settings.CONSUMER_GROUP, [second]),
+    ]
+
+
+@mock.patch.object(settings, "EVENTS_STREAMS", True)
+@mock.patch.object(settings, "CONSUMER_CLAIM_INTERVAL", 0)
+@mock.patch.object(consumer.groups, "acknowledge", new_callable=mock.AsyncMock)
+@mock.patch.object(consumer.groups, "create_group", new_callable=mock.AsyncMock)
+async def test_consume_streams_claims(
+    mock_create_group: mock.AsyncMock,
+    mock_acknowledge: mock.AsyncMock,
+):
+    """Check that idle pending messages are retried while running."""
+    event_consumer = init_consumer()
+    read = mock.AsyncMock(side_effect=[[], [], asyncio.CancelledError])
+    claim = mock.AsyncMock(return_value=[MESSAGE])
+
+    with mock.patch.object(consumer.groups, "read_group", read):
+        with mock.patch.object(consumer.groups, "claim", claim):
+            with mock.patch.object(DeleteMonster, "handle"):
+                event_consumer.start()
+                await asyncio.gather(
+                    event_consumer.task,
+                    return_exceptions=True,
+                )
+                await event_consumer.stop()
+
+    claim.assert_awaited_with(
+        settings.CONSUMER_GROUP,
+        settings.CONSUMER_NAME,
+        ["delete-monster"],
+        settings.CONSUMER_CLAIM_IDLE,
+        settings.CONSUMER_BATCH_SIZE,
+    )
+    mock_acknowledge.assert_awaited_once_with(
+        settings.CONSUMER_GROUP,
+        [MESSAGE],
+    )
+
+
+@mock.patch.object(consumer.connections, "async_client")
+async def test_consume_channels(mock_client: mock.Mock):
+    """Check that published messages are handled."""
+    mock_client.pubsub = mock.MagicMock()
+    pubsub = mock_client.pubsub.return_value.__aenter__.return_value
+    pubsub.get_message = mock.AsyncMock(
+        side_effect=[
+            None,
+            {"channel": b"delete-monster", "data": MESSAGE.payload.encode()},
+            asyncio.CancelledError,
+        ],
+    )
+    event_consumer = init_consumer()
+
+    with mock.patch.object(
+        DeleteMonster,
+        "handle",
+        new_callable=mock.AsyncMock,
+    ) as mock_handle:
+        with pytest.raises(asyncio.CancelledError):
+            await event_consumer.consume_channels()
+        await event_consumer.stop()
+
+    pubsub.subscribe.assert_awaited_once_with("delete-monster")
+    mock_handle.assert_awaited_once()
+
+
+@mock.patch.object(settings, "CONSUMER_RETRY_DELAY", 0)
+async def test_run_reconnects():
+    """Check that redis errors are logged and consuming restarted."""
+    event_consumer = init_consumer()
+    consume = mock.AsyncMock(
+        side_effect=[redis.exceptions.ConnectionError, asyncio.CancelledError],
+    )
+
+    with mock.patch.object(event_consumer, "consume_channels", consume):
+        with pytest.raises(asyncio.CancelledError):
+            await event_consumer.run()
+
+    assert consume.await_count == 2
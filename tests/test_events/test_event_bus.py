@@ -1,4 +1,5 @@
 import json
+import uuid
 from dataclasses import asdict
 from unittest import mock
 
@@ -6,7 +7,12 @@ import pytest
 import redis
 
 from monster_spawner.domain.events.event_types import Event
+from monster_spawner.domain.events.outgoing import (
+    MonsterDeleted,
+    MonsterUpdated,
+)
 from monster_spawner.events.bus import EventBus, eventclass
+from monster_spawner.settings import settings
 
 pytestmark = [pytest.mark.asyncio]
 
@@ -42,6 +48,7 @@ def test_eventclass_as_a_dataclass():
     assert event.date == "2020-01-01"
 
 
+@mock.patch.object(settings, "REDIS_ASYNC_PUBLISHER", False)
 @mock.patch.object(redis.Redis, "publish")
 async def test_publishing_event(mock_publish: mock.Mock):
     """Check that the event bus publishes events to redis."""
@@ -62,6 +69,26 @@ async def test_publishing_event(mock_publish: mock.Mock):
     )
 
 
+@mock.patch.object(redis.asyncio.Redis, "publish", new_callable=mock.AsyncMock)
+async def test_publishing_event_async(mock_publish: mock.AsyncMock):
+    """Check that the event bus awaits the async redis publisher."""
+    event_type = "elden-ring-is-easy"
+    mocked_enum = mock.MagicMock(value=event_type)
+
+    @eventclass(mocked_enum)
+    class EldenRingIsEasy(Event):
+        async def handle(self) -> None:
+            ...
+
+    event = EldenRingIsEasy()
+    await EventBus.publish(event)
+
+    mock_publish.assert_awaited_once_with(
+        event_type,
+        json.dumps(asdict(event), default=str),
+    )
+
+
 @mock.patch.object(redis.Redis, "publish")
 async def test_publishing_not_registered_event(mock_publish: mock.Mock):
     """Check that the event bus ignores events that are not registered."""
@@ -77,3 +104,142 @@ async def test_publishing_not_registered_event(mock_publish: mock.Mock):
     await EventBus.publish(BfHasNoBugs())
 
     mock_publish.assert_not_called()
+
+
+@mock.patch("monster_spawner.events.bus.publish_messages")
+async def test_publishing_many_events(mock_publish: mock.AsyncMock):
+    """Check that the event bus publishes a batch in one pipeline."""
+    event_type = "minecraft-has-mods"
+    mocked_enum = mock.MagicMock(value=event_type)
+
+    @eventclass(mocked_enum)
+    class MinecraftHasMods(Event):
+        name: str
+
+        async def handle(self) -> None:
+            ...
+
+    events = [MinecraftHasMods(name="a"), MinecraftHasMods(name="b")]
+    await EventBus.publish_many(events)
+
+    mock_publish.assert_awaited_once_with(
+        [
+            (event_type, json.dumps(asdict(event), default=str))
+            for event in events
+        ],
+    )
+
+
+@mock.patch(
+    "monster_spawner.events.bus.publish_messages",
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_publishing_many_events_connection_error(
+    mock_publish: mock.AsyncMock,
+):
+    """Check that connection errors of a batch are logged, not raised."""
+    event_type = "terraria-is-finished"
+    mocked_enum = mock.MagicMock(value=event_type)
+
+    @eventclass(mocked_enum)
+    class TerrariaIsFinished(Event):
+        async def handle(self) -> None:
+            ...
+
+    await EventBus.publish_many([TerrariaIsFinished()])
+
+    mock_publish.assert_awaited_once()
+
+
+@mock.patch.object(settings, "REDIS_ASYNC_PUBLISHER", False)
+@mock.patch.object(redis.Redis, "publish")
+async def test_publishing_many_events_sync(mock_publish: mock.Mock):
+    """Check that the sync fallback publishes every event of a batch."""
+    event_type = "portal-3-is-out"
+    mocked_enum = mock.MagicMock(value=event_type)
+
+    @eventclass(mocked_enum)
+    class PortalThreeIsOut(Event):
+        async def handle(self) -> None:
+            ...
+
+    await EventBus.publish_many([PortalThreeIsOut(), PortalThreeIsOut()])
+
+    assert mock_publish.call_count == 2
+
+
+def create_update(pk: uuid.UUID, **changes: tuple) -> tuple[str, str]:
+    """Create the message of a monster update, changes are (old, new)."""
+    event = MonsterUpdated(
+        id=pk,
+        changes={field: new for field, (_, new) in changes.items()},
+        previous={field: old for field, (old, _) in changes.items()},
+    )
+    return "monster-updated", json.dumps(asdict(event), default=str)
+
+
+async def test_coalesce():
+    """Check that updates are merged until another event is published."""
+    first, second = uuid.uuid4(), uuid.uuid4()
+    deleted = ("monster-deleted", json.dumps({"id": str(second)}))
+    messages = [
+        create_update(first, health=(100, 50)),
+        create_update(second, health=(100, 1)),
+        create_update(first, health=(50, 40), damage=(10, 5)),
+        deleted,
+        create_update(first, health=(40, 30)),
+    ]
+
+    coalesced = EventBus.coalesce(messages)
+
+    assert coalesced == [
+        create_update(first, health=(100, 40), damage=(10, 5)),
+        messages[1],
+        deleted,
+        messages[4],
+    ]
+
+
+async def test_coalesce_changed_back():
+    """Check that fields changed back are left out of the merged diff."""
+    pk = uuid.uuid4()
+
+    coalesced = EventBus.coalesce(
+        [
+            create_update(pk, health=(100, 50), damage=(10, 5)),
+            create_update(pk, health=(50, 100)),
+        ],
+    )
+
+    assert coalesced == [create_update(pk, damage=(10, 5))]
+
+
+async def test_coalesce_undecodable():
+    """Check that undecodable messages are kept and close the merges."""
+    pk = uuid.uuid4()
+    messages = [
+        create_update(pk, health=(100, 50)),
+        ("monster-updated", "not json"),
+        create_update(pk, health=(50, 40)),
+    ]
+
+    assert EventBus.coalesce(messages) == messages
+
+
+@mock.patch.object(settings, "EVENTS_COALESCE", False)
+async def test_coalesce_disabled():
+    """Check that messages are kept as they are when disabled."""
+    pk = uuid.uuid4()
+    messages = [
+        create_update(pk, health=(100, 50)),
+        create_update(pk, health=(50, 40)),
+    ]
+
+    assert EventBus.coalesce(messages) == messages
+
+
+async def test_merge_keeps_later():
+    """Check that events are replaced by later ones by default."""
+    first, later = MonsterDeleted(id=uuid.uuid4()), MonsterDeleted(id="b")
+
+    assert first.merge(later) is later
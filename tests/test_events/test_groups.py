@@ -0,0 +1,132 @@
+"""Redis streams consumer group test cases."""
+
+from unittest import mock
+
+import pytest
+import redis
+
+from monster_spawner.events import groups
+from monster_spawner.events.streams import StreamMessage
+
+pytestmark = pytest.mark.asyncio
+
+FIRST = StreamMessage("monster-deleted", "1-0", '{"id": "a"}')
+SECOND = StreamMessage("monster-deleted", "2-0", '{"id": "b"}')
+OTHER = StreamMessage("monster-created", "1-0", '{"id": "c"}')
+
+
+def create_entry(message: StreamMessage) -> tuple[bytes, dict[bytes, bytes]]:
+    """Create the stream entry redis returns for a message."""
+    return message.message_id.encode(), {b"payload": message.payload.encode()}
+
+
+@mock.patch.object(groups.connections, "async_client")
+async def test_create_group(mock_client: mock.Mock):
+    """Check that existing groups are kept and other errors raised."""
+    mock_client.xgroup_create = mock.AsyncMock(
+        side_effect=[
+            None,
+            redis.exceptions.ResponseError("BUSYGROUP Group exists"),
+            redis.exceptions.ResponseError("WRONGTYPE Wrong kind of value"),
+        ],
+    )
+
+    await groups.create_group("group", ["a", "b"], start="0")
+    with pytest.raises(redis.exceptions.ResponseError):
+        await groups.create_group("group", ["c"])
+
+    mock_client.xgroup_create.assert_any_await(
+        "stream:a",
+        "group",
+        id="0",
+        mkstream=True,
+    )
+
+
+@pytest.mark.parametrize("pending, start", [(False, ">"), (True, "0")])
+@mock.patch.object(groups.connections, "async_client")
+async def test_read_group(mock_client: mock.Mock, pending: bool, start: str):
+    """Check that new or pending messages are read for every channel."""
+    mock_client.xreadgroup = mock.AsyncMock(
+        return_value=[
+            [b"stream:monster-deleted", [create_entry(FIRST), (b"9-0", None)]],
+            [b"stream:monster-created", [create_entry(OTHER)]],
+        ],
+    )
+    mock_client.xack = mock.AsyncMock()
+
+    messages = await groups.read_group(
+        "group",
+        "consumer",
+        ["monster-deleted", "monster-created"],
+        count=10,
+        block=100,
+        pending=pending,
+    )
+
+    assert messages == [FIRST, OTHER]
+    mock_client.xreadgroup.assert_awaited_once_with(
+        "group",
+        "consumer",
+        {"stream:monster-deleted": start, "stream:monster-created": start},
+        count=10,
+        block=100,
+    )
+    mock_client.xack.assert_awaited_once_with(
+        b"stream:monster-deleted",
+        "group",
+        b"9-0",
+    )
+
+
+@mock.patch.object(groups.connections, "async_client")
+async def test_read_group_timeout(mock_client: mock.Mock):
+    """Check that no messages are returned when the block times out."""
+    mock_client.xreadgroup = mock.AsyncMock(return_value=None)
+
+    assert await groups.read_group("group", "consumer", ["a"], 10) == []
+
+
+@mock.patch.object(groups.connections, "async_client")
+async def test_claim(mock_client: mock.Mock):
+    """Check that idle pending messages are claimed from every stream."""
+    mock_client.xautoclaim = mock.AsyncMock(
+        side_effect=[[create_entry(FIRST), (b"9-0", None)], []],
+    )
+    mock_client.xack = mock.AsyncMock()
+
+    messages = await groups.claim(
+        "group",
+        "consumer",
+        ["monster-deleted", "monster-created"],
+        1000,
+        10,
+    )
+
+    assert messages == [FIRST]
+    mock_client.xautoclaim.assert_any_await(
+        "stream:monster-deleted",
+        "group",
+        "consumer",
+        1000,
+        count=10,
+    )
+    mock_client.xack.assert_awaited_once_with(
+        b"stream:monster-deleted",
+        "group",
+        b"9-0",
+    )
+
+
+@mock.patch.object(groups.connections, "async_client")
+async def test_acknowledge(mock_client: mock.Mock):
+    """Check that messages are acknowledged with one call per stream."""
+    mock_client.xack = mock.AsyncMock(side_effect=[2, 1])
+
+    assert await groups.acknowledge("group", [FIRST, SECOND, OTHER]) == 3
+    mock_client.xack.assert_has_awaits(
+        [
+            mock.call("stream:monster-deleted", "group", "1-0", "2-0"),
+            mock.call("stream:monster-created", "group", "1-0"),
+        ],
+    )
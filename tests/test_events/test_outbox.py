@@ -0,0 +1,188 @@
+"""Transactional outbox test cases."""
+
+import asyncio
+import contextlib
+import json
+import uuid
+from unittest import mock
+
+import pytest
+import redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from monster_spawner.database import models, sessions
+from monster_spawner.domain.events.event_types import Event
+from monster_spawner.domain.events.outgoing import (
+    MonsterDeleted,
+    MonsterUpdated,
+)
+from monster_spawner.events import outbox
+from monster_spawner.events.publisher import serialize_event
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+def init_relay(database_session: AsyncSession) -> outbox.OutboxRelay:
+    """Shortcut for initializing OutboxRelay with the test session."""
+    relay = outbox.OutboxRelay(lambda: contextlib.nullcontext(database_session))
+    relay.retry_delay = 0
+    return relay
+
+
+async def store_deleted_events(
+    database_session: AsyncSession,
+    count: int,
+) -> list[MonsterDeleted]:
+    """Store a number of MonsterDeleted events in the outbox."""
+    events = [MonsterDeleted(id=uuid.uuid4()) for _ in range(count)]
+    await outbox.store_events(database_session, events)
+    await database_session.flush()
+    return events
+
+
+async def test_store_events(database_session: AsyncSession):
+    """Check that registered events are stored in the outbox."""
+    event = MonsterDeleted(id=uuid.uuid4())
+
+    class NotRegistered(Event):
+        event_type = mock.MagicMock(value="not-registered")
+
+        async def handle(self) -> None:
+            ...
+
+    await outbox.store_events(database_session, [event, NotRegistered()])
+    entries = (await database_session.execute(select(models.Outbox))).scalars()
+    entries = list(entries)
+
+    assert len(entries) == 1
+    assert entries[0].channel == "monster-deleted"
+    assert json.loads(entries[0].payload) == {"id": str(event.id)}
+
+
+@mock.patch.object(outbox, "publish_messages", new_callable=mock.AsyncMock)
+async def test_drain(
+    mock_publish: mock.AsyncMock,
+    database_session: AsyncSession,
+):
+    """Check that the relay publishes the outbox in ordered batches."""
+    events = await store_deleted_events(database_session, 5)
+    relay = init_relay(database_session)
+    relay.batch_size = 2
+
+    batches = await relay.drain()
+    published = [
+        json.loads(payload)["id"]
+        for call in mock_publish.await_args_list
+        for _, payload in call.args[0]
+    ]
+    entries = await database_session.execute(select(models.Outbox))
+
+    assert batches == 3
+    assert published == [str(event.id) for event in events]
+    assert not list(entries.scalars())
+
+
+@mock.patch.object(outbox, "publish_messages", new_callable=mock.AsyncMock)
+async def test_drain_elected(
+    mock_publish: mock.AsyncMock,
+    database_session: AsyncSession,
+):
+    """Check that only the relay holding the lock publishes."""
+    await store_deleted_events(database_session, 1)
+    await database_session.commit()
+    engine, _ = sessions.get_connection(settings.DATABASE_URL)
+    lock = select(func.pg_advisory_lock(outbox.RELAY_LOCK_KEY))
+
+    async with engine.connect() as connection:
+        await connection.execute(lock)
+        batches = await init_relay(database_session).drain()
+    await engine.dispose()
+
+    assert batches == 0
+    mock_publish.assert_not_awaited()
+
+
+@mock.patch.object(outbox, "publish_messages", new_callable=mock.AsyncMock)
+async def test_publish_retries(mock_publish: mock.AsyncMock):
+    """Check that a failing batch is retried."""
+    mock_publish.side_effect = [redis.exceptions.ConnectionError, None]
+    relay = outbox.OutboxRelay(mock.Mock())
+    relay.retry_delay = 0
+
+    await relay.publish([models.Outbox(channel="channel", payload="{}")])
+
+    assert mock_publish.await_count == 2
+
+
+@mock.patch.object(outbox, "publish_messages", new_callable=mock.AsyncMock)
+async def test_publish_coalesces(mock_publish: mock.AsyncMock):
+    """Check that the updates of a mob in a batch are sent once."""
+    pk = uuid.uuid4()
+    events = [
+        MonsterUpdated(id=pk, changes={"health": 50}, previous={"health": 9}),
+        MonsterUpdated(id=pk, changes={"health": 40}, previous={"health": 50}),
+    ]
+    relay = outbox.OutboxRelay(mock.Mock())
+
+    await relay.publish(
+        [
+            models.Outbox(channel="monster-updated", payload=payload)
+            for payload in map(serialize_event, events)
+        ],
+    )
+
+    ((_, payload),) = mock_publish.await_args.args[0]
+    assert json.loads(payload)["changes"] == {"health": 40}
+    assert json.loads(payload)["previous"] == {"health": 9}
+
+
+@mock.patch.object(outbox, "publish_messages", new_callable=mock.AsyncMock)
+async def test_publish_gives_up(
+    mock_publish: mock.AsyncMock,
+    database_session: AsyncSession,
+):
+    """Check that entries stay in the outbox when redis is unavailable."""
+    mock_publish.side_effect = redis.exceptions.ConnectionError
+    await store_deleted_events(database_session, 1)
+    relay = init_relay(database_session)
+    relay.max_retries = 3
+
+    with pytest.raises(redis.exceptions.ConnectionError):
+        await relay.drain()
+
+    assert mock_publish.await_count == 3
+
+
+async def test_run_in_background():
+    """Check that the relay keeps draining until it is stopped."""
+    relay = outbox.OutboxRelay(mock.Mock())
+    relay.poll_interval = 0
+    drained = asyncio.Event()
+    results = [1, redis.exceptions.ConnectionError()]
+
+    async def drain() -> int:
+        if not results:
+            drained.set()
+            return 0
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with mock.patch.object(relay, "drain", side_effect=drain):
+        relay.start()
+        await asyncio.wait_for(drained.wait(), timeout=1)
+        await relay.stop()
+
+    assert relay.task is None
+
+
+async def test_stop_not_started():
+    """Check that stopping a relay that was not started is a no-op."""
+    relay = outbox.OutboxRelay(mock.Mock())
+
+    await relay.stop()
+
+    assert relay.task is None
@@ -0,0 +1,64 @@
+"""Event publisher test cases."""
+
+from unittest import mock
+
+import pytest
+import redis
+
+from monster_spawner.domain.events.outgoing import MonsterDeleted
+from monster_spawner.events import publisher
+
+pytestmark = pytest.mark.asyncio
+
+
+@mock.patch.object(publisher, "logger")
+@mock.patch.object(
+    redis.Redis,
+    "publish",
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_publish_connection_error(
+    mock_publish: mock.Mock,
+    mock_logger: mock.Mock,
+):
+    """Check that the sync publisher logs connection errors."""
+    publisher.publish_with_redis(MonsterDeleted(id="mob-id"))
+
+    mock_logger.error.assert_called_once()
+
+
+@mock.patch.object(publisher, "logger")
+@mock.patch.object(
+    redis.asyncio.Redis,
+    "publish",
+    new_callable=mock.AsyncMock,
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_async_publish_connection_error(
+    mock_publish: mock.AsyncMock,
+    mock_logger: mock.Mock,
+):
+    """Check that the async publisher logs connection errors."""
+    await publisher.publish_with_async_redis(MonsterDeleted(id="mob-id"))
+
+    mock_logger.error.assert_called_once()
+
+
+@mock.patch.object(
+    redis.asyncio.client.Pipeline,
+    "execute",
+    new_callable=mock.AsyncMock,
+)
+async def test_publish_messages(mock_execute: mock.AsyncMock):
+    """Check that messages are published in a single pipeline."""
+    messages = [("channel", "first"), ("channel", "second")]
+
+    with mock.patch.object(
+        redis.asyncio.client.Pipeline,
+        "publish",
+        autospec=True,
+    ) as mock_publish:
+        await publisher.publish_messages(messages)
+
+    assert [call.args[1:] for call in mock_publish.call_args_list] == messages
+    mock_execute.assert_awaited_once()
@@ -0,0 +1,116 @@
+"""Redis streams transport test cases."""
+
+from unittest import mock
+
+import pytest
+import redis
+
+from monster_spawner.domain.events.outgoing import MonsterDeleted
+from monster_spawner.events import publisher, streams
+from monster_spawner.events.streams import StreamMessage
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+SECOND = StreamMessage("monster-deleted", "2-0", '{"id": "b"}')
+OTHER = StreamMessage("monster-created", "1-0", '{"id": "c"}')
+
+
+def create_entry(message: StreamMessage) -> tuple[bytes, dict[bytes, bytes]]:
+    """Create the stream entry redis returns for a message."""
+    return message.message_id.encode(), {b"payload": message.payload.encode()}
+
+
+@mock.patch.object(settings, "EVENTS_STREAMS", True)
+@mock.patch.object(redis.Redis, "xadd")
+async def test_publish_to_stream(mock_xadd: mock.Mock):
+    """Check that events are appended to capped streams."""
+    event = MonsterDeleted(id="mob-id")
+
+    publisher.publish_with_redis(event)
+
+    mock_xadd.assert_called_once_with(
+        "stream:monster-deleted",
+        {"payload": publisher.serialize_event(event)},
+        maxlen=settings.EVENTS_STREAM_MAX_LENGTH,
+        approximate=True,
+    )
+
+
+@mock.patch.object(settings, "EVENTS_STREAMS", True)
+@mock.patch.object(
+    redis.asyncio.client.Pipeline,
+    "execute",
+    new_callable=mock.AsyncMock,
+)
+async def test_publish_messages_to_streams(mock_execute: mock.AsyncMock):
+    """Check that pipelined messages are appended to streams."""
+    with mock.patch.object(
+        redis.asyncio.client.Pipeline,
+        "xadd",
+        autospec=True,
+    ) as mock_xadd:
+        await publisher.publish_messages([("channel", "first")])
+
+    assert mock_xadd.call_args.args[1:] == (
+        "stream:channel",
+        {"payload": "first"},
+    )
+    mock_execute.assert_awaited_once()
+
+
+@mock.patch.object(streams.connections, "async_client")
+async def test_read_after(mock_client: mock.Mock):
+    """Check that messages after an offset are read without a group."""
+    mock_client.xrange = mock.AsyncMock(return_value=[create_entry(SECOND)])
+
+    messages = await streams.read_after("monster-deleted", "1-0", 10)
+
+    assert messages == [SECOND]
+    mock_client.xrange.assert_awaited_once_with(
+        "stream:monster-deleted",
+        min="(1-0",
+        count=10,
+    )
+
+
+@mock.patch.object(streams.connections, "async_client")
+async def test_read_streams(mock_client: mock.Mock):
+    """Check that every stream is read after its own offset."""
+    mock_client.xread = mock.AsyncMock(
+        return_value=[
+            (b"stream:monster-deleted", [create_entry(SECOND)]),
+            (b"stream:monster-created", [create_entry(OTHER)]),
+        ],
+    )
+
+    messages = await streams.read_streams(
+        {"monster-deleted": "1-0", "monster-created": "0"},
+        10,
+        block=100,
+    )
+
+    assert messages == [SECOND, OTHER]
+    mock_client.xread.assert_awaited_once_with(
+        {"stream:monster-deleted": "1-0", "stream:monster-created": "0"},
+        count=10,
+        block=100,
+    )
+
+
+@mock.patch.object(streams.connections, "async_client")
+async def test_get_last_ids(mock_client: mock.Mock):
+    """Check that empty streams start from the beginning."""
+    mock_client.xrevrange = mock.AsyncMock(
+        side_effect=[[create_entry(SECOND)], []],
+    )
+
+    last_ids = await streams.get_last_ids(
+        ["monster-deleted", "monster-created"],
+    )
+
+    assert last_ids == {"monster-deleted": "2-0", "monster-created": "0"}
+    mock_client.xrevrange.assert_awaited_with(
+        "stream:monster-created",
+        count=1,
+    )
@@ -0,0 +1,23 @@
+"""Exception handlers test cases."""
+
+import json
+from unittest import mock
+
+import pytest
+from fastapi import status
+
+from monster_spawner import handlers
+from monster_spawner.domain import exceptions
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_invalid_filter_handler():
+    """Check that unknown filters are answered with bad request."""
+    response = await handlers.invalid_filter_handler(
+        mock.Mock(),
+        exceptions.InvalidFilterError(name="lol"),
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert json.loads(response.body) == {"detail": "Invalid filter - lol"}
@@ -0,0 +1,86 @@
+"""Logging configuration test cases."""
+
+import io
+from unittest import mock
+
+import orjson
+import pytest
+import structlog
+
+from monster_spawner import logs
+from monster_spawner.settings import settings
+
+
+@pytest.fixture()
+def restore_config() -> None:
+    """Bring back the structlog configuration after the test."""
+    config = structlog.get_config()
+    yield
+    structlog.configure(**config)
+
+
+def create_stream() -> io.TextIOWrapper:
+    """Create a text stream with a binary buffer."""
+    return io.TextIOWrapper(io.BytesIO(), write_through=True)
+
+
+def test_lazy_value():
+    """Check that lazy values are only computed when resolved."""
+    function = mock.Mock(return_value=42)
+
+    event_dict = logs.resolve_lazy(
+        None,
+        "info",
+        {"event": "lol", "answer": logs.lazy(function, 6, by=7)},
+    )
+
+    function.assert_called_once_with(6, by=7)
+    assert event_dict == {"event": "lol", "answer": 42}
+
+
+@pytest.mark.parametrize(
+    "random_value, kept",
+    [(0.005, True), (0.5, False)],
+)
+def test_sampler(random_value: float, kept: bool):
+    """Check that only the picked sampled events are kept."""
+    sampler = logs.Sampler(0.01)
+
+    with mock.patch.object(logs.random, "random", return_value=random_value):
+        assert sampler(None, "info", {"event": "lol"}) == {"event": "lol"}
+        if kept:
+            event_dict = sampler(None, "info", {"event": "lol", "sampled": 1})
+            assert event_dict == {"event": "lol"}
+        else:
+            with pytest.raises(structlog.DropEvent):
+                sampler(None, "info", {"event": "lol", "sampled": True})
+
+
+@pytest.mark.usefixtures("restore_config")
+def test_json_logging():
+    """Check that logs are rendered as JSON lines above the level."""
+    stream = create_stream()
+    with mock.patch.object(settings, "LOG_JSON", True):
+        logs.configure_logging(stream)
+    logger = structlog.get_logger()
+    expensive = mock.Mock(return_value="kek")
+
+    logger.debug("Hidden", value=logs.lazy(expensive))
+    logger.info("Shown", value=logs.lazy(expensive), pk=1)
+
+    expensive.assert_called_once()
+    line = orjson.loads(stream.buffer.getvalue())
+    assert line["event"] == "Shown"
+    assert line["level"] == "info"
+    assert line["value"] == "kek"
+    assert line["pk"] == 1
+
+
+@pytest.mark.usefixtures("restore_config")
+def test_console_logging():
+    """Check that the development renderer can be chosen."""
+    stream = io.StringIO()
+    logs.configure_logging(stream, json=False)
+    structlog.get_logger().warning("Shown")
+
+    assert "Shown" in stream.getvalue()
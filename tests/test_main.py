@@ -0,0 +1,80 @@
+"""Application factory test cases."""
+
+from unittest import mock
+
+from monster_spawner import resources
+from monster_spawner.database import sessions
+from monster_spawner.domain.mob.catalogue import mob_catalogue
+from monster_spawner.domain.mob.feed import CatalogueFeed
+from monster_spawner.domain.mob.invalidation import CacheFeed, mob_cache
+from monster_spawner.events import publisher
+from monster_spawner.events.buffer import EventBuffer
+from monster_spawner.events.bus import EventBus
+from monster_spawner.events.outbox import OutboxRelay
+from monster_spawner.main import create_application
+from monster_spawner.settings import settings
+
+
+def test_outbox_relay_lifecycle():
+    """Check that the outbox relay is started with the application."""
+    app = create_application()
+
+    assert isinstance(app.router.on_startup[1].__self__, OutboxRelay)
+    assert len(app.router.on_startup) == 3
+    assert len(app.router.on_shutdown) == 3
+
+
+@mock.patch.object(settings, "EVENTS_OUTBOX", False)
+def test_outbox_relay_disabled():
+    """Check that the outbox relay is not started when disabled."""
+    app = create_application()
+
+    assert app.router.on_startup[0] == resources.start
+    assert app.router.on_shutdown[-1] == resources.close
+    assert len(app.router.on_startup) == 2
+
+
+@mock.patch.object(settings, "EVENTS_OUTBOX", False)
+def test_cache_feed_lifecycle():
+    """Check that the cache feed is run with the application."""
+    app = create_application()
+
+    cache_feed = app.router.on_startup[1].__self__
+    assert type(cache_feed) is CacheFeed
+    assert cache_feed.cache is mob_cache
+    assert app.router.on_shutdown[0] == cache_feed.stop
+
+
+@mock.patch.object(publisher, "connections", publisher.Connections())
+@mock.patch.object(sessions, "database", sessions.Database())
+def test_no_connections_created():
+    """Check that the connections are left to the startup handlers."""
+    create_application()
+
+    assert not vars(sessions.database)
+    assert not vars(publisher.connections)
+
+
+@mock.patch.object(settings, "EVENTS_OUTBOX", False)
+@mock.patch.object(settings, "EVENTS_BUFFERED", True)
+@mock.patch.object(EventBus, "buffer", None)
+def test_event_buffer_lifecycle():
+    """Check that the event buffer is set and run with the application."""
+    app = create_application()
+
+    assert isinstance(EventBus.buffer, EventBuffer)
+    assert len(app.router.on_startup) == 3
+    assert len(app.router.on_shutdown) == 3
+
+
+@mock.patch.object(settings, "EVENTS_OUTBOX", False)
+@mock.patch.object(settings, "CATALOGUE_ENABLED", True)
+def test_catalogue_feed_lifecycle():
+    """Check that the catalogue feed is run with the application."""
+    app = create_application()
+
+    feed = app.router.on_startup[1].__self__
+    assert isinstance(feed, CatalogueFeed)
+    assert feed.catalogue is mob_catalogue
+    assert feed.cache is mob_cache
+    assert app.router.on_shutdown[0] == feed.stop
@@ -0,0 +1,44 @@
+"""Metric collectors test cases."""
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from monster_spawner.metrics import collectors
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_statements_counted(database_session: AsyncSession):
+    """Check that statements are added up on the request stats."""
+    stats = collectors.RequestStats()
+    token = collectors.request_stats.set(stats)
+    count = REGISTRY.get_sample_value("sql_statement_duration_seconds_count")
+
+    await database_session.execute(select(1))
+    await database_session.execute(select(2))
+    collectors.request_stats.reset(token)
+    await database_session.execute(select(3))
+
+    assert stats.statements == 2
+    assert stats.sql_time > 0
+    assert REGISTRY.get_sample_value(
+        "sql_statement_duration_seconds_count",
+    ) == (count + 3)
+
+
+async def test_redis_publish_timed():
+    """Check that redis time is recorded with and without a request."""
+    stats = collectors.RequestStats()
+    count = REGISTRY.get_sample_value("redis_publish_duration_seconds_count")
+
+    with collectors.time_redis_publish():
+        token = collectors.request_stats.set(stats)
+    with collectors.time_redis_publish():
+        collectors.request_stats.reset(token)
+
+    assert stats.redis_time > 0
+    assert REGISTRY.get_sample_value(
+        "redis_publish_duration_seconds_count",
+    ) == (count + 2)
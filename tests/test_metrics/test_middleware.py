@@ -0,0 +1,89 @@
+"""Instrumentation middleware test cases."""
+
+import pathlib
+from unittest import mock
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from starlette import status
+
+from monster_spawner.metrics import middleware
+
+pytestmark = pytest.mark.asyncio
+
+ROUTE_LABELS = {"method": "GET", "route": "/api/v1/mobs/"}
+
+
+def get_sample(name: str, labels: dict[str, str]) -> float:
+    """Shortcut for reading a sample which may not exist yet."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+async def test_request_recorded(async_client: AsyncClient):
+    """Check that latency and statements of a route are recorded."""
+    duration_labels = {**ROUTE_LABELS, "status": "200"}
+    count = get_sample("http_request_duration_seconds_count", duration_labels)
+    statements = get_sample("http_request_sql_statements_sum", ROUTE_LABELS)
+
+    response = await async_client.get("/api/v1/mobs/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert get_sample(
+        "http_request_duration_seconds_count",
+        duration_labels,
+    ) == (count + 1)
+    assert get_sample(
+        "http_request_sql_statements_sum",
+        ROUTE_LABELS,
+    ) == (statements + 2)
+
+
+async def test_unmatched_route(async_client: AsyncClient):
+    """Check that unknown paths share a single label."""
+    labels = {"method": "GET", "route": "unmatched", "status": "404"}
+    count = get_sample("http_request_duration_seconds_count", labels)
+
+    await async_client.get("/api/v1/lol")
+
+    assert get_sample(
+        "http_request_duration_seconds_count",
+        labels,
+    ) == (count + 1)
+
+
+async def test_metrics_endpoint(async_client: AsyncClient):
+    """Check that the metrics are exposed in the Prometheus format."""
+    await async_client.get("/api/v1/mobs/")
+
+    response = await async_client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "http_request_sql_duration_seconds_bucket" in response.text
+
+
+async def test_metrics_multiprocess(tmp_path: pathlib.Path):
+    """Check that the metrics of all workers are read from their files."""
+    environ = {"PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+
+    with mock.patch.dict(middleware.os.environ, environ):
+        with mock.patch.object(
+            middleware.multiprocess,
+            "MultiProcessCollector",
+        ) as mock_collector:
+            response = await middleware.get_metrics(mock.Mock())
+
+    assert response.status_code == status.HTTP_200_OK
+    registry = mock_collector.call_args.args[0]
+    assert registry is not middleware.REGISTRY
+
+
+async def test_other_scopes_passed_through():
+    """Check that lifespan messages are not instrumented."""
+    app = mock.AsyncMock()
+    instrumented = middleware.InstrumentationMiddleware(app)
+    scope = {"type": "lifespan"}
+
+    await instrumented(scope, mock.Mock(), mock.Mock())
+
+    app.assert_awaited_once()
@@ -0,0 +1,103 @@
+"""Connection lifecycle test cases."""
+
+from unittest import mock
+
+import pytest
+import redis
+from sqlalchemy.exc import OperationalError
+
+from monster_spawner import resources
+from monster_spawner.database import sessions
+from monster_spawner.database.replicas import ReplicaSet
+from monster_spawner.events import publisher
+from monster_spawner.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+@mock.patch.object(settings, "DATABASE_WARMUP_CONNECTIONS", 3)
+@mock.patch.object(publisher.connections, "async_client")
+@mock.patch.object(resources, "ping", new_callable=mock.AsyncMock)
+async def test_warm_up(mock_ping: mock.AsyncMock, mock_client: mock.Mock):
+    """Check that the database and redis pools are connected."""
+    mock_client.ping = mock.AsyncMock()
+
+    await resources.warm_up()
+
+    assert mock_ping.await_count == 3
+    mock_client.ping.assert_awaited_once()
+
+
+@mock.patch.object(publisher.connections, "async_client")
+@mock.patch.object(
+    resources,
+    "ping",
+    new_callable=mock.AsyncMock,
+    side_effect=OperationalError("SELECT 1", {}, ConnectionRefusedError()),
+)
+async def test_warm_up_errors(
+    mock_ping: mock.AsyncMock,
+    mock_client: mock.Mock,
+):
+    """Check that connection errors are logged, not raised."""
+    mock_client.ping = mock.AsyncMock(
+        side_effect=redis.exceptions.ConnectionError,
+    )
+
+    await resources.warm_up()
+
+    mock_client.ping.assert_awaited_once()
+
+
+async def test_ping():
+    """Check that a query is run on the engine."""
+    await resources.ping(sessions.database.engine)
+
+
+@pytest.mark.parametrize("replica_count", [0, 1])
+@mock.patch.object(resources, "warm_up", new_callable=mock.AsyncMock)
+async def test_start(mock_warm_up: mock.AsyncMock, replica_count: int):
+    """Check that the replica lag monitor only runs with replicas."""
+    replicas = ReplicaSet([mock.MagicMock()] * replica_count)
+
+    with mock.patch.object(sessions.database, "replicas", replicas):
+        with mock.patch.object(replicas, "start") as mock_start:
+            await resources.start()
+
+    mock_warm_up.assert_awaited_once()
+    assert mock_start.call_count == replica_count
+
+
+@mock.patch.object(sessions, "database", sessions.Database())
+@mock.patch.object(publisher, "connections", publisher.Connections())
+async def test_close():
+    """Check that every pool is closed and the connections dropped."""
+    replica = mock.Mock()
+    replica.engine.dispose = mock.AsyncMock()
+    database = sessions.database
+    database.replicas = ReplicaSet([replica.engine])
+    database.engine = mock.Mock(dispose=mock.AsyncMock())
+    engine = database.engine
+    publisher.connections.async_pool = mock.AsyncMock()
+    async_pool = publisher.connections.async_pool
+    publisher.connections.client = mock.Mock()
+    client = publisher.connections.client
+
+    await resources.close()
+
+    engine.dispose.assert_awaited_once()
+    replica.engine.dispose.assert_awaited_once()
+    async_pool.disconnect.assert_awaited_once()
+    client.connection_pool.disconnect.assert_called_once()
+    assert not vars(sessions.database)
+    assert not vars(publisher.connections)
+
+
+@mock.patch.object(sessions, "database", sessions.Database())
+@mock.patch.object(publisher, "connections", publisher.Connections())
+async def test_close_unused():
+    """Check that closing creates no connection."""
+    await resources.close()
+
+    assert not vars(sessions.database)
+    assert not vars(publisher.connections)
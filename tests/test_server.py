@@ -0,0 +1,42 @@
+"""Production server test cases."""
+
+import os
+from unittest import mock
+
+import pytest
+
+from monster_spawner import server
+from monster_spawner.settings import settings
+
+
+@mock.patch.object(settings, "SERVER_WORKERS", 3)
+def test_count_workers_set():
+    """Check that the configured number of workers is used."""
+    assert server.count_workers() == 3
+
+
+@mock.patch.object(settings, "SERVER_WORKERS", 0)
+def test_count_workers_auto():
+    """Check that a worker is run per usable CPU by default."""
+    assert server.count_workers() == len(os.sched_getaffinity(0))
+
+
+@pytest.mark.parametrize("workers, multiprocess", [(1, False), (4, True)])
+@mock.patch.object(server.uvicorn, "run")
+def test_main(mock_run: mock.Mock, workers: int, multiprocess: bool):
+    """Check that workers share a metrics directory."""
+    with mock.patch.dict(os.environ):
+        os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+        with mock.patch.object(settings, "SERVER_WORKERS", workers):
+            server.main()
+
+        assert ("PROMETHEUS_MULTIPROC_DIR" in os.environ) is multiprocess
+
+    mock_run.assert_called_once_with(
+        server.APP,
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        lifespan="on",
+        timeout_keep_alive=settings.SERVER_TIMEOUT_KEEP_ALIVE,
+    )
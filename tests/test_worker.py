@@ -0,0 +1,104 @@
+"""Event worker test cases."""
+
+import asyncio
+import os
+import signal
+from unittest import mock
+
+import pytest
+
+from monster_spawner import worker
+from monster_spawner.events.buffer import EventBuffer
+from monster_spawner.events.bus import EventBus
+from monster_spawner.events.consumer import EventConsumer
+from monster_spawner.events.outbox import OutboxRelay
+from monster_spawner.settings import settings
+
+
+@mock.patch.object(settings, "CONSUMER_CHANNELS", "create-monster,")
+def test_create_workers():
+    """Check that the outbox relay is run along with the consumer."""
+    workers = worker.create_workers()
+
+    assert [type(started) for started in workers] == [
+        OutboxRelay,
+        EventConsumer,
+    ]
+    assert workers[-1].channels == ["create-monster"]
+
+
+@mock.patch.object(settings, "EVENTS_OUTBOX", False)
+@mock.patch.object(settings, "EVENTS_BUFFERED", True)
+@mock.patch.object(EventBus, "buffer", None)
+def test_create_workers_buffered():
+    """Check that the event buffer is set and run with the consumer."""
+    workers = worker.create_workers()
+
+    assert workers[0] is EventBus.buffer
+    assert [type(started) for started in workers] == [
+        EventBuffer,
+        EventConsumer,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run():
+    """Check that workers start in order and stop in reverse."""
+    calls = mock.Mock()
+    first, second = mock.Mock(), mock.Mock()
+    first.stop = mock.AsyncMock(side_effect=lambda: calls("first.stop"))
+    second.stop = mock.AsyncMock(side_effect=lambda: calls("second.stop"))
+    first.start.side_effect = lambda: calls("first.start")
+    second.start.side_effect = lambda: calls("second.start")
+    stop = asyncio.Event()
+    stop.set()
+
+    with mock.patch.object(
+        worker,
+        "create_workers",
+        return_value=[first, second],
+    ):
+        with mock.patch.object(
+            worker.resources,
+            "close",
+            side_effect=lambda: calls("close"),
+        ):
+            await worker.run(stop)
+
+    assert [call.args[0] for call in calls.call_args_list] == [
+        "first.start",
+        "second.start",
+        "second.stop",
+        "first.stop",
+        "close",
+    ]
+
+
+@pytest.mark.asyncio
+@mock.patch.object(worker.resources, "close", new_callable=mock.AsyncMock)
+async def test_run_closes_on_error(mock_close: mock.AsyncMock):
+    """Check that the connections are closed when a worker fails."""
+    failing = mock.Mock()
+    failing.start.side_effect = RuntimeError
+
+    with mock.patch.object(worker, "create_workers", return_value=[failing]):
+        with pytest.raises(RuntimeError):
+            await worker.run(asyncio.Event())
+
+    mock_close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@mock.patch.object(worker, "run", new_callable=mock.AsyncMock)
+async def test_serve_stops_on_signal(mock_run: mock.AsyncMock):
+    """Check that SIGTERM sets the stop event."""
+    loop = asyncio.get_running_loop()
+
+    await worker.serve()
+    stop = mock_run.await_args.args[0]
+    os.kill(os.getpid(), signal.SIGTERM)
+    await asyncio.sleep(0.01)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.remove_signal_handler(signum)
+
+    assert stop.is_set()